@@ -5,6 +5,9 @@ import random
 import os
 import csv
 import statistics 
+import importlib.util
+import numpy as np
+from concurrent.futures import wait, FIRST_COMPLETED
 
 import PyQt5
 from PyQt5 import QtWidgets, QtCore, QtGui
@@ -15,21 +18,38 @@ from PyQt5.QtGui import QCursor
 import matplotlib
 matplotlib.use("Qt5Agg")
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import networkx as nx
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.patches import FancyArrowPatch, Circle
+
+import graph_layout
 
 # --- PROJE IMPORTLARI ---
-try:
-    from network_manager import NetworkManager
-    from algorithms.ga import GeneticOptimizer
-    from algorithms.ql import QLearningOptimizer
-    from algorithms.abc_alg  import ABCOptimizer
-    from algorithms.sa import SAOptimizer
-    ALGO_IMPORTED = True
-except ImportError as e:
-    print(f"UYARI: Algoritma veya Manager dosyaları bulunamadı: {e}")
-    ALGO_IMPORTED = False
+# Açılışı hızlandırmak için NetworkManager (pandas) veri yükleme iş parçacığında, algoritma
+# modülleri ilk çözümde, spatial_index (SciPy) indeks iş parçacığında içe aktarılır.
+# Burada sadece dosyaların varlığı (import etmeden) kontrol edilir.
+_MISSING = [m for m in ("network_manager", "algorithms") if importlib.util.find_spec(m) is None]
+ALGO_IMPORTED = not _MISSING
+if _MISSING:
+    print(f"UYARI: Algoritma veya Manager dosyaları bulunamadı: {', '.join(_MISSING)}")
+
+_ALGORITHMS = None
+
+def load_algorithms():
+    """Optimizasyon sınıflarını ilk kullanımda içe aktarır; GUI kısaltması -> sınıf sözlüğü döndürür."""
+    global _ALGORITHMS
+    if _ALGORITHMS is None:
+        from algorithms.ga import GeneticOptimizer
+        from algorithms.ql import QLearningOptimizer
+        from algorithms.abc_alg import ABCOptimizer
+        from algorithms.sa import SAOptimizer
+        from algorithms.exact import ExactOptimizer
+        _ALGORITHMS = {"GA": GeneticOptimizer, "RL": QLearningOptimizer, "ABC": ABCOptimizer,
+                       "SA": SAOptimizer, "A*": ExactOptimizer}
+    return _ALGORITHMS
 
 # PyQt5 Plugin Yolu
 dirname = os.path.dirname(PyQt5.__file__)
@@ -50,6 +70,9 @@ NODE_FILE   = os.path.join(DATA_DIR, "BSM307_317_Guz2025_TermProject_NodeData(in
 EDGE_FILE   = os.path.join(DATA_DIR, "BSM307_317_Guz2025_TermProject_EdgeData(in).csv")
 DEMAND_FILE = os.path.join(DATA_DIR, "BSM307_317_Guz2025_TermProject_DemandData(in).csv")
 
+# Hesaplanan graf yerleşimleri topoloji özetiyle anahtarlanıp burada saklanır
+LAYOUT_CACHE_DIR = os.path.join(BASE_DIR, ".layout_cache")
+
 # --- RENK PALETİ ---
 THEME = {
     "MAIN_BG": "#111828",       
@@ -153,19 +176,40 @@ class BatchResultsWindow(QtWidgets.QDialog):
         self.table.setHorizontalHeaderLabels(headers)
         
         for row_idx, row_data in enumerate(self.data):
-            for col_idx, key in enumerate(headers):
-                val = row_data[key]
-                item = QtWidgets.QTableWidgetItem(str(val))
-                
-                # Renklendirme
-                if key == "Durum":
-                    if val == "BAŞARILI": item.setForeground(QtGui.QColor("#22c55e"))
-                    else: item.setForeground(QtGui.QColor("#ef4444"))
-                
-                self.table.setItem(row_idx, col_idx, item)
+            self._fill_row(row_idx, row_data, headers)
         
         self.table.resizeColumnsToContents()
 
+    def _fill_row(self, row_idx, row_data, headers):
+        for col_idx, key in enumerate(headers):
+            val = row_data.get(key, "")
+            item = QtWidgets.QTableWidgetItem(str(val))
+            
+            # Renklendirme
+            if key == "Durum":
+                if val == "BAŞARILI": item.setForeground(QtGui.QColor("#22c55e"))
+                else: item.setForeground(QtGui.QColor("#ef4444"))
+            
+            self.table.setItem(row_idx, col_idx, item)
+
+    def add_row(self, row_data):
+        """Toplu test sürerken tamamlanan satırı tabloya ekler (canlı akış)."""
+        self.data.append(row_data)
+        if self.table.columnCount() == 0:
+            self.table.setColumnCount(len(row_data))
+            self.table.setHorizontalHeaderLabels(list(row_data.keys()))
+        headers = [self.table.horizontalHeaderItem(c).text() for c in range(self.table.columnCount())]
+        row_idx = self.table.rowCount()
+        self.table.insertRow(row_idx)
+        self._fill_row(row_idx, row_data, headers)
+        self.table.scrollToBottom()
+
+    def set_data(self, data):
+        """Test bitince tabloyu son (sıralı) raporla yeniden doldurur."""
+        self.data = list(data)
+        self.table.setRowCount(0)
+        self.populate_table()
+
     def export_csv(self):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Raporu Kaydet", "Toplu_Test_Sonuclari.csv", "CSV Files (*.csv)")
         if path:
@@ -183,17 +227,25 @@ class BatchResultsWindow(QtWidgets.QDialog):
 # ==========================================================
 class BatchTestWorker(QThread):
     progress_signal = pyqtSignal(int, str) 
+    row_signal = pyqtSignal(dict)          # Bir (senaryo, algoritma) satırı tamamlandıkça
     finished_signal = pyqtSignal(list)     
 
-    def __init__(self, manager, demands, weights):
+    def __init__(self, manager, demands, weights, processes=None):
         super().__init__()
         self.manager = manager
         self.demands = demands
         self.weights = weights
         self.algorithms = ["GA", "RL", "ABC", "SA"]
         self.repetitions = 5
+        self.processes = processes      # None -> CPU sayısı; 0/1 -> bu iş parçacığında sırayla
+        self.cancelled = False
+
+    def cancel(self):
+        """Bekleyen çözümleri iptal eder; çalışmakta olanların sonucu beklenmez."""
+        self.cancelled = True
 
     def run(self):
+        from algorithms.batch import task_seed
         full_report = []
         target_scenario_count = 20
         scenarios_to_run = list(self.demands)
@@ -209,9 +261,8 @@ class BatchTestWorker(QThread):
             scenarios_to_run.append({'src': s, 'dst': d, 'bw': bw})
 
         scenarios_to_run = scenarios_to_run[:max(len(self.demands), target_scenario_count)]
-        total_steps = len(scenarios_to_run) * len(self.algorithms) * self.repetitions
-        current_step = 0
-
+        base_seed = random.getrandbits(32)
+        tasks = []
         for i, sc in enumerate(scenarios_to_run):
             src, dst, bw = sc['src'], sc['dst'], sc['bw']
             # --- YOL KONTROLÜ ---
@@ -223,84 +274,121 @@ class BatchTestWorker(QThread):
                         "Senaryo": i + 1,
                         "Kaynak": src, "Hedef": dst, "Bant_Gen": bw,
                         "Algoritma": algo_name,
-                        "Basari": "0/5", "Durum": "BAŞARISIZ",
+                        "Basari": f"0/{self.repetitions}", "Durum": "BAŞARISIZ",
                         "Ort_Maliyet": "0.00", "Std_Sapma": "0.00",
                         "En_Iyi": "0.00", "En_Kotu": "0.00", "Ort_Sure_ms": "0.00",
                         "Not": "Topolojik Yol Yok (Unreachable)"
                     }
-                     full_report.append(row)
+                     full_report.append(row); self.row_signal.emit(row)
                 continue # Bir sonraki senaryoya atla
-            
             for algo_name in self.algorithms:
-                costs = []
-                times = []
-                success_count = 0
-                
                 for r in range(self.repetitions):
-                    current_step += 1
-                    progress_pct = int((current_step / total_steps) * 100)
-                    self.progress_signal.emit(progress_pct, f"Senaryo {i+1} - {algo_name} ({r+1}/{self.repetitions})")
-
-                    optimizer = None
-                    if algo_name == "GA": optimizer = GeneticOptimizer(self.manager, src, dst, bw)
-                    elif algo_name == "RL": optimizer = QLearningOptimizer(self.manager, src, dst, bw)
-                    elif algo_name == "ABC": optimizer = ABCOptimizer(self.manager, src, dst, bw)
-                    elif algo_name == "SA": optimizer = SAOptimizer(self.manager, src, dst, bw)
-
-                    t_start = time.time()
-                    path, cost, metrics = optimizer.solve(self.weights)
-                    t_end = time.time()
-                    
-                    if path:
-                        costs.append(cost)
-                        times.append((t_end - t_start) * 1000)
-                        success_count += 1
-                    
-                if success_count > 0:
-                    # --- Maliyetleri temizle ---
-                    cleaned_costs = [clean_cost_value(c) for c in costs]
-                    
-                    avg_cost = statistics.mean(cleaned_costs)
-                    # Standart sapma temizlenmiş veriden hesaplanır
-                    std_dev = statistics.stdev(cleaned_costs) if len(cleaned_costs) > 1 else 0.0
-                    best_cost = min(cleaned_costs)
-                    worst_cost = max(cleaned_costs)
-                    
-                    avg_time = statistics.mean(times)
-                    status = "BAŞARILI"
-                    reason = "-"
-                else:
-                    avg_cost = 0; std_dev = 0; best_cost = 0; worst_cost = 0; avg_time = 0
-                    status = "BAŞARISIZ"
-                    reason = "Yol Bulunamadı"
-
-                row = {
-                    "Senaryo": i + 1,
-                    "Kaynak": src,
-                    "Hedef": dst,
-                    "Bant_Gen": bw,
-                    "Algoritma": algo_name,
-                    "Basari": f"{success_count}/{self.repetitions}",
-                    "Ort_Maliyet": f"{avg_cost:.2f}",
-                    "Std_Sapma": f"{std_dev:.4f}", # Hassasiyet artırıldı
-                    "En_Iyi": f"{best_cost:.2f}",
-                    "En_Kotu": f"{worst_cost:.2f}",
-                    "Ort_Sure_ms": f"{avg_time:.2f}",
-                    "Durum": status,
-                    "Not": reason
-                }
-                full_report.append(row)
-
+                    tasks.append(((i, algo_name), algo_name, src, dst, bw, self.weights,
+                                  task_seed(i, algo_name, r, base_seed)))
+
+        # Sonuçlar tamamlandıkça (senaryo, algoritma) bazında toplanır; tekrarlar bitince satır yayınlanır
+        results = {}
+        total_steps = len(tasks)
+        done = 0
+        start_time = time.perf_counter()
+        for key, found, cost, ms in self._iter_results(tasks):
+            done += 1
+            results.setdefault(key, []).append((found, cost, ms))
+            i, algo_name = key
+            if len(results[key]) == self.repetitions:
+                sc = scenarios_to_run[i]
+                row = self._make_row(i, sc['src'], sc['dst'], sc['bw'], algo_name, results.pop(key))
+                full_report.append(row); self.row_signal.emit(row)
+
+            # Kalan süre tahmini: şimdiye kadarki gözlenen çözüm hızı
+            elapsed = time.perf_counter() - start_time
+            eta = (total_steps - done) * elapsed / done
+            progress_pct = int((done / total_steps) * 100)
+            self.progress_signal.emit(progress_pct, f"Senaryo {i+1} - {algo_name} ({done}/{total_steps}) | Kalan ~{self._format_eta(eta)}")
+
+        order = {a: k for k, a in enumerate(self.algorithms)}
+        full_report.sort(key=lambda row: (row["Senaryo"], order.get(row["Algoritma"], 0)))
         self.finished_signal.emit(full_report)
 
+    def _iter_results(self, tasks):
+        """
+        Görevleri süreç havuzunda çalıştırıp sonuçları tamamlanma sırasıyla döndürür (tek çekirdekte
+        bu iş parçacığında sırayla). İptal edildiğinde bekleyen görevler havuzdan silinir.
+        """
+        from algorithms.batch import solve_task
+        from algorithms.parallel import make_pool, resolve_processes
+        processes = resolve_processes(self.processes, len(tasks))
+        if processes <= 1:
+            for task in tasks:
+                if self.cancelled: return
+                yield solve_task(task, self.manager)
+            return
+
+        pool = make_pool(self.manager, processes)
+        try:
+            pending = {pool.submit(solve_task, task) for task in tasks}
+            while pending and not self.cancelled:
+                # Kısa zaman aşımı: iptal isteği en geç bu kadar sürede fark edilir
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _format_eta(seconds):
+        seconds = int(round(seconds))
+        return f"{seconds // 60} dk {seconds % 60} sn" if seconds >= 60 else f"{seconds} sn"
+
+    def _make_row(self, i, src, dst, bw, algo_name, runs):
+        costs = [cost for found, cost, _ in runs if found]
+        times = [ms for found, _, ms in runs if found]
+        success_count = len(costs)
+        if success_count > 0:
+            # --- Maliyetleri temizle ---
+            cleaned_costs = [clean_cost_value(c) for c in costs]
+            
+            avg_cost = statistics.mean(cleaned_costs)
+            # Standart sapma temizlenmiş veriden hesaplanır
+            std_dev = statistics.stdev(cleaned_costs) if len(cleaned_costs) > 1 else 0.0
+            best_cost = min(cleaned_costs)
+            worst_cost = max(cleaned_costs)
+            
+            avg_time = statistics.mean(times)
+            status = "BAŞARILI"
+            reason = "-"
+        else:
+            avg_cost = 0; std_dev = 0; best_cost = 0; worst_cost = 0; avg_time = 0
+            status = "BAŞARISIZ"
+            reason = "Yol Bulunamadı"
+
+        return {
+            "Senaryo": i + 1,
+            "Kaynak": src,
+            "Hedef": dst,
+            "Bant_Gen": bw,
+            "Algoritma": algo_name,
+            "Basari": f"{success_count}/{self.repetitions}",
+            "Ort_Maliyet": f"{avg_cost:.2f}",
+            "Std_Sapma": f"{std_dev:.4f}", # Hassasiyet artırıldı
+            "En_Iyi": f"{best_cost:.2f}",
+            "En_Kotu": f"{worst_cost:.2f}",
+            "Ort_Sure_ms": f"{avg_time:.2f}",
+            "Durum": status,
+            "Not": reason
+        }
+
 # ==========================================================
 #  ROUTING WORKER
 # ==========================================================
 class RoutingWorker(QThread):
     finished_single = pyqtSignal(list, float, dict)
     finished_batch = pyqtSignal(dict)
+    progress_signal = pyqtSignal(str, int, float, list)   # (algoritma, iterasyon, en iyi maliyet, en iyi yol)
     error = pyqtSignal(str)
 
+    PROGRESS_INTERVAL = 0.25    # İlerleme bildirimleri arası en kısa süre (saniye): GUI'yi boğmadan akıcı grafik
+
     def __init__(self, mode, algo_key, manager, src, dst, weights, bw_demand=0):
         super().__init__()
         self.mode = mode 
@@ -310,18 +398,40 @@ class RoutingWorker(QThread):
         self.dst = dst
         self.weights = weights
         self.bw_demand = bw_demand
+        self.reporter = None        # Çalışan optimizasyonun ProgressReporter'ı
+        self.stop_requested = False
+
+    def stop(self):
+        """Çalışan algoritmayı (kıyaslamada kalanları da) eldeki en iyi sonuçla erken bitirir."""
+        self.stop_requested = True
+        if self.reporter is not None:
+            self.reporter.request_stop()
 
     def _solve_with_algo(self, name):
         if not ALGO_IMPORTED: raise Exception("Algoritma dosyaları eksik!")
+        algorithms = load_algorithms()
+        from algorithms.progress import ProgressReporter
         start_time = time.time()
         optimizer = None
-        if name == "GA": optimizer = GeneticOptimizer(self.manager, self.src, self.dst, self.bw_demand)
-        elif name == "RL": optimizer = QLearningOptimizer(self.manager, self.src, self.dst, self.bw_demand)
-        elif name == "ABC": optimizer = ABCOptimizer(self.manager, self.src, self.dst, self.bw_demand)
-        elif name == "SA": optimizer = SAOptimizer(self.manager, self.src, self.dst, self.bw_demand)
+        # Tekil çalıştırmada ağırlık değişimleri arşivden sıcak başlar (kıyaslama adil kalsın diye soğuk)
+        archive = self.manager.get_solution_archive() if self.mode == "SINGLE" else None
+        if name == "A*": optimizer = algorithms[name](self.manager, self.src, self.dst, self.bw_demand)
+        elif name in algorithms: optimizer = algorithms[name](self.manager, self.src, self.dst, self.bw_demand, archive=archive)
+
+        # Yinelemeli algoritmalar ilerlemeyi (yakınsama grafiği için) seyreltilmiş olarak bildirir
+        if hasattr(optimizer, 'progress'):
+            self.reporter = ProgressReporter(lambda it, c, p: self.progress_signal.emit(name, it, c, p),
+                                             self.PROGRESS_INTERVAL)
+            if self.stop_requested: self.reporter.request_stop()
+            optimizer.progress = self.reporter
         
         if optimizer: path, cost, metrics = optimizer.solve(self.weights)
+        elif name == "PF":
+            # Pareto cephesi talep başına bir kez (NSGA-II) hesaplanır; ağırlık değişince arşivden seçilir
+            front = self.manager.get_pareto_front(self.src, self.dst, self.bw_demand)
+            path, cost, metrics = front.best_for(self.weights)
         else: path, cost, metrics = [], 0, {}
+        self.reporter = None
 
         end_time = time.time()
         if not path:
@@ -330,6 +440,7 @@ class RoutingWorker(QThread):
         else:
             metrics['success'] = True
         metrics['time_ms'] = (end_time - start_time) * 1000
+        metrics['stopped'] = self.stop_requested
         return path, cost, metrics
 
     def run(self):
@@ -347,12 +458,79 @@ class RoutingWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+# ==========================================================
+#  VERİ YÜKLEME WORKER (AÇILIŞ)
+# ==========================================================
+class DataLoadWorker(QThread):
+    """NetworkManager'ı (pandas dahil) içe aktarıp CSV'leri arka planda yükler; pencere beklemeden açılır."""
+    progress_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(object, str)   # (NetworkManager veya None, hata mesajı)
+
+    def run(self):
+        try:
+            self.progress_signal.emit("Modüller yükleniyor...")
+            from network_manager import NetworkManager
+            if not (os.path.exists(NODE_FILE) and os.path.exists(EDGE_FILE)):
+                self.finished_signal.emit(None, f"Veri dosyaları eksik:\n{DATA_DIR}")
+                return
+            self.progress_signal.emit("Ağ verisi okunuyor...")
+            manager = NetworkManager()
+            if not manager.load_data(NODE_FILE, EDGE_FILE, DEMAND_FILE):
+                self.finished_signal.emit(None, "CSV okunamadı!")
+                return
+            manager.topology_version()   # Yerleşim önbelleği anahtarı (özet burada bir kez hesaplanır)
+            self.finished_signal.emit(manager, "")
+        except Exception as e:
+            self.finished_signal.emit(None, str(e))
+
+# ==========================================================
+#  LAYOUT WORKER (GRAF YERLEŞİMİ)
+# ==========================================================
+class LayoutWorker(QThread):
+    # dict yerine object: Qt, int anahtarlı sözlükleri QVariantMap'e çeviremez
+    finished_signal = pyqtSignal(object, object)   # (G, pos)
+
+    def __init__(self, G, key=None, cache_dir=LAYOUT_CACHE_DIR):
+        super().__init__()
+        self.G = G
+        self.key = key
+        self.cache_dir = cache_dir
+
+    def run(self):
+        try:
+            pos, _ = graph_layout.cached_layout(self.G, self.cache_dir, self.key)
+        except Exception as e:
+            print(f"UYARI: Graf yerleşimi hesaplanamadı: {e}")
+            pos = nx.spring_layout(self.G, seed=42)
+        self.finished_signal.emit(self.G, pos)
+
+class SpatialIndexWorker(QThread):
+    finished_signal = pyqtSignal(object, object)   # (pos, GraphSpatialIndex)
+
+    def __init__(self, G, pos, density_resolution=None):
+        super().__init__()
+        self.G = G
+        self.pos = pos
+        self.density_resolution = density_resolution   # Verilirse uzak görünüm için yoğunluk görüntüsü de hazırlanır
+
+    def run(self):
+        try:
+            from spatial_index import GraphSpatialIndex
+            index = GraphSpatialIndex(self.pos, list(self.G.edges()))
+            if self.density_resolution: index.edge_density(self.density_resolution)
+        except Exception as e:
+            print(f"UYARI: Uzamsal indeks kurulamadı: {e}")
+            return
+        self.finished_signal.emit(self.pos, index)
+
 # ==========================================================
 #  GRAFİK 1: AĞ TOPOLOJİSİ (GraphCanvas)
 # ==========================================================
 class GraphCanvas(FigureCanvas):
+    layout_ready = pyqtSignal()     # Arka planda hesaplanan asıl yerleşim çizildiğinde
+
     def __init__(self, parent=None):
-        self.fig, self.ax = plt.subplots()
+        self.fig = Figure(); self.ax = self.fig.subplots()
         self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
         super().__init__(self.fig)
         self.setParent(parent)
@@ -360,7 +538,31 @@ class GraphCanvas(FigureCanvas):
         self.ax.set_facecolor(THEME["GRAPH_BG"])
         self.G = None
         self.pos = {}
-        self.highlight_artists = []
+        self.layout_key = None          # Disk önbelleği anahtarı (topoloji özeti); None ise yapıdan üretilir
+        self.layout_pending = False     # Asıl yerleşim arka planda hesaplanıyor (geçici yerleşim çizili)
+        self.layout_worker = None
+        self._old_workers = []          # Graf değiştiğinde hâlâ çalışan eski işçiler (sonuçları yok sayılır)
+        self._draw_args = (None, None, None)
+        self.spatial_index = None       # Fare yakalama için (yerleşim başına bir kez, arka planda kurulur)
+        self.index_graph = None         # İndeksin kurulduğu graf
+        self.index_worker = None
+        self.NODE_HIT_RADIUS = 0.08; self.EDGE_HIT_RADIUS = 0.05
+        # Kenar detay seviyesi (LOD): görünümdeki kenar sayısı bu sınırı aşarsa kenarlar yerine yoğunluk
+        # görüntüsü çizilir (indeks hazır değilse rastgele örneklem); yakınlaşınca sadece görünümdeki kenarlar
+        self.LOD_EDGE_LIMIT = 2000
+        self.LOD_DENSITY_VIEW = 0.25    # Görünüm alanı / graf alanı bu oranın üstündeyse "uzaktan" sayılır
+        self.DENSITY_RESOLUTION = 256
+        self.edge_lines = None; self.edge_image = None
+        self._all_segments = np.zeros((0, 2, 2))
+        self._edge_rank = np.zeros(0, dtype=np.int64)
+        self._lod_key = None
+        # Retained-mode çizim: statik arka plan (kenar/düğüm koleksiyonları) bir kez çizilip önbelleğe
+        # alınır (copy_from_bbox); rota, S/D ve fare vurgusu animated katman olarak üstüne blit edilir
+        self._scene_key = None          # Arka planın kurulduğu (graf, yerleşim, geçici mi) üçlüsü
+        self._background = None         # Statik katmanın piksel önbelleği
+        self._background_view = None    # Önbelleğin alındığı eksen sınırları
+        self.overlay = {}               # ad -> animated artist (rota, S/D, vurgu)
+        self.route_arrows = []
         self.last_hovered_edge = None
         self.last_hovered_node = None
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
@@ -369,6 +571,7 @@ class GraphCanvas(FigureCanvas):
         self.mpl_connect("button_press_event", self.on_press)
         self.mpl_connect("button_release_event", self.on_release)
         self.mpl_connect("motion_notify_event", self.on_mouse_move)
+        self.mpl_connect("draw_event", self.on_draw)
         self.panning = False
         self.pan_start_x = 0
         self.pan_start_y = 0
@@ -376,10 +579,7 @@ class GraphCanvas(FigureCanvas):
     def on_press(self, event):
         if event.inaxes == self.ax and event.button in [1, 3]:
             if not self.pos: return
-            closest, min_d = None, 0.08
-            for n, (x, y) in self.pos.items():
-                d = math.hypot(event.xdata - x, event.ydata - y)
-                if d < min_d: min_d = d; closest = n
+            closest = self.hit_node(event.xdata, event.ydata)
             
             if closest is not None:
                 mode = "src" if event.button == 1 else "dst"
@@ -394,9 +594,10 @@ class GraphCanvas(FigureCanvas):
             self.setCursor(QtCore.Qt.ClosedHandCursor)
 
     def on_release(self, event):
+        was_panning = self.panning
         self.panning = False
         self.setCursor(QtCore.Qt.ArrowCursor)
-        self.draw_idle()
+        if was_panning: self.draw_idle()
 
     def on_mouse_move(self, event):
         if event.inaxes != self.ax: return
@@ -410,35 +611,20 @@ class GraphCanvas(FigureCanvas):
 
         if not event.xdata or not self.pos or not self.G: return
         
-        closest_node = None
-        min_d_node = 0.08 
-        for n, (x, y) in self.pos.items():
-            if abs(x - event.xdata) > min_d_node or abs(y - event.ydata) > min_d_node: continue
-            d = math.hypot(event.xdata - x, event.ydata - y)
-            if d < min_d_node: min_d_node = d; closest_node = n
-        
+        closest_node = self.hit_node(event.xdata, event.ydata)
         closest_edge = None
         if closest_node is None:
-            min_d_edge = 0.05
-            for u, v in self.G.edges():
-                if u not in self.pos or v not in self.pos: continue
-                x1, y1 = self.pos[u]; x2, y2 = self.pos[v]
-                margin = 0.1
-                if not (min(x1, x2) - margin < event.xdata < max(x1, x2) + margin and
-                        min(y1, y2) - margin < event.ydata < max(y1, y2) + margin): continue
-                d = dist_point_to_segment(event.xdata, event.ydata, x1, y1, x2, y2)
-                if d < min_d_edge: min_d_edge = d; closest_edge = (u, v)
+            closest_edge = self.hit_edge(event.xdata, event.ydata)
 
         if closest_node != self.last_hovered_node or closest_edge != self.last_hovered_edge:
             self.last_hovered_node = closest_node
             self.last_hovered_edge = closest_edge
-            for artist in self.highlight_artists: artist.remove()
-            self.highlight_artists = []
+            hover_node, hover_edge = self.overlay.get("hover_node"), self.overlay.get("hover_edge")
+            if hover_node is None: return
+            hover_node.set_visible(False); hover_edge.set_visible(False)
 
             if closest_node is not None:
-                x, y = self.pos[closest_node]
-                c = plt.Circle((x, y), 0.01, color='#facc15', zorder=10, alpha=1.0)
-                self.ax.add_patch(c); self.highlight_artists.append(c)
+                hover_node.set_center(self.pos[closest_node]); hover_node.set_visible(True)
                 p = self.G.nodes[closest_node]
                 txt = f"<b>DÜĞÜM {closest_node}</b><hr>İşlem: {p.get('processing_delay',0)}ms<br>Güven: {p.get('reliability',0)}"
                 QtWidgets.QToolTip.showText(QCursor.pos(), txt)
@@ -446,14 +632,98 @@ class GraphCanvas(FigureCanvas):
             elif closest_edge is not None:
                 u, v = closest_edge
                 x1, y1 = self.pos[u]; x2, y2 = self.pos[v]
-                l, = self.ax.plot([x1, x2], [y1, y2], color="#facc15", linewidth=2.5, alpha=1.0, zorder=10)
-                self.highlight_artists.append(l)
+                hover_edge.set_data([x1, x2], [y1, y2]); hover_edge.set_visible(True)
                 data = self.G[u][v]
                 txt = (f"<b>BAĞLANTI: {u} ↔ {v}</b><hr>BW: {data.get('bandwidth','-')} Mbps<br>Gecikme: {data.get('delay','-')} ms")
                 QtWidgets.QToolTip.showText(QCursor.pos(), txt)
             else:
                 QtWidgets.QToolTip.hideText()
-            self.draw_idle()
+            self.update_overlay()
+
+    def hit_node(self, x, y):
+        """(x, y)'ye en yakın düğüm (yakalama yarıçapı içinde; yoksa None). İndeks hazır değilse doğrusal arama."""
+        if self.spatial_index is not None:
+            return self.spatial_index.nearest_node(x, y, self.NODE_HIT_RADIUS)
+        closest, min_d = None, self.NODE_HIT_RADIUS
+        for n, (nx_, ny_) in self.pos.items():
+            if abs(nx_ - x) > min_d or abs(ny_ - y) > min_d: continue
+            d = math.hypot(x - nx_, y - ny_)
+            if d < min_d: min_d = d; closest = n
+        return closest
+
+    def hit_edge(self, x, y):
+        """(x, y)'ye en yakın kenar (u, v). Tüm kenarları dolaşmamak için sadece uzamsal indeks hazırken çalışır."""
+        if self.spatial_index is None: return None
+        return self.spatial_index.nearest_edge(x, y, self.EDGE_HIT_RADIUS)
+
+    def rebuild_spatial_index(self, G):
+        """Kesinleşen yerleşim için uzamsal indeksi arka planda kurar (geçici yerleşimde kurulmaz)."""
+        self.spatial_index = None; self.index_graph = G
+        if self.layout_pending or not self.pos: return
+        if self.index_worker is not None and self.index_worker.isRunning():
+            self._old_workers.append(self.index_worker)
+        dense = G.number_of_edges() > self.LOD_EDGE_LIMIT
+        self.index_worker = SpatialIndexWorker(G, self.pos, self.DENSITY_RESOLUTION if dense else None)
+        self.index_worker.finished_signal.connect(self.on_index_ready)
+        self.index_worker.finished.connect(self._drop_finished_workers)
+        self.index_worker.start()
+
+    def on_index_ready(self, pos, index):
+        if pos is not self.pos: return   # Bu arada yerleşim değiştiyse eski indeks atılır
+        self.spatial_index = index
+        if len(self._all_segments) > self.LOD_EDGE_LIMIT: self._lod_key = None; self.draw_idle()
+
+    def update_lod(self):
+        """
+        Görünüme göre kenar katmanını seçer (her tam çizimden önce, görünüm değiştiyse):
+        - Toplam kenar sayısı sınırın altındaysa hepsi çizilir.
+        - Görünümdeki kenarlar (uzamsal indeksten) sınırın altındaysa sadece onlar, seyreldikçe daha opak.
+        - Uzaktan bakılıyorsa önceden hesaplanmış kenar yoğunluğu görüntüsü.
+        - Yakındaysa görünümdeki kenarlardan sabit öncelikli örneklem (kaydırırken seçim titremesin).
+        """
+        if self.edge_lines is None: return
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        key = (x0, x1, y0, y1, id(self.spatial_index))
+        if key == self._lod_key: return
+        self._lod_key = key
+        total = len(self._all_segments)
+        index = self.spatial_index
+        show_image = False
+        segments, alpha = self._all_segments, 0.1
+        if total > self.LOD_EDGE_LIMIT and index is None:
+            segments = self._all_segments[self._sample_edges(np.arange(total))]
+        elif total > self.LOD_EDGE_LIMIT:
+            visible = index.edges_in_rect(x0, y0, x1, y1)
+            if visible.size <= self.LOD_EDGE_LIMIT:
+                segments = index.seg[visible].reshape(-1, 2, 2)
+                alpha = float(np.clip(0.1 * math.sqrt(self.LOD_EDGE_LIMIT / max(visible.size, 1)), 0.1, 0.6))
+            elif (x1 - x0) * (y1 - y0) >= self.LOD_DENSITY_VIEW * index.extent ** 2:
+                segments, show_image = np.zeros((0, 2, 2)), True
+                if self.edge_image is None: self._create_density_image(index)
+            else:
+                segments = index.seg[self._sample_edges(visible)].reshape(-1, 2, 2)
+        self.edge_lines.set_segments(segments); self.edge_lines.set_alpha(alpha)
+        self.edge_lines.set_visible(not show_image)
+        if self.edge_image is not None: self.edge_image.set_visible(show_image)
+
+    def _sample_edges(self, candidates):
+        """Adaylardan önceliği en yüksek LOD_EDGE_LIMIT kenar (öncelikler sahne başına bir kez rastgele atanır)."""
+        if candidates.size <= self.LOD_EDGE_LIMIT: return candidates
+        keep = np.argpartition(self._edge_rank[candidates], self.LOD_EDGE_LIMIT)[:self.LOD_EDGE_LIMIT]
+        return candidates[keep]
+
+    def _create_density_image(self, index):
+        image, extent = index.edge_density(self.DENSITY_RESOLUTION)
+        # Boş pikseller şeffaf; logaritmik ölçek yoğun çekirdeğin seyrek bölgeleri bastırmasını önler
+        values = np.ma.masked_equal(np.log1p(image / max(image.max(), 1e-12) * 100), 0)
+        cmap = LinearSegmentedColormap.from_list("edge_density", [(0.39, 0.43, 0.49, 0.15), (0.39, 0.43, 0.49, 0.6), (0.65, 0.84, 0.92, 0.9)])
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+        self.edge_image = self.ax.imshow(values, extent=extent, origin="lower", cmap=cmap, interpolation="bilinear", aspect="auto", zorder=1)
+        self.ax.set_xlim(xlim); self.ax.set_ylim(ylim)   # imshow görünümü değiştirmesin
+
+    def draw(self):
+        self.update_lod()
+        super().draw()
 
     def on_scroll(self, event):
         if event.inaxes != self.ax: return
@@ -478,34 +748,90 @@ class GraphCanvas(FigureCanvas):
     def reset_view(self):
         self.ax.autoscale(); self.draw_idle()
 
+    def ensure_layout(self, G):
+        """
+        Graf için yerleşimi hazırlar. Diskte kayıtlıysa hemen okunur; değilse anında dairesel
+        geçici yerleşim kullanılır ve asıl yerleşim LayoutWorker ile arka planda hesaplanır
+        (ilk çizim yerleşim maliyetini beklemez). Bitince on_layout_ready yeniden çizer.
+        """
+        if self.layout_pending and G is self.G: return   # Bu graf için işçi zaten çalışıyor
+        if self.layout_pending or not self.pos or set(self.pos.keys()) != set(G.nodes()):
+            pos = graph_layout.load_layout(LAYOUT_CACHE_DIR, self.layout_key, G) if self.layout_key else None
+            if pos is None:
+                self.start_layout_worker(G)
+                return
+            self.pos = pos; self.layout_pending = False
+        if self.index_graph is not G: self.rebuild_spatial_index(G)
+
+    def start_layout_worker(self, G):
+        self.pos = graph_layout.provisional_layout(G)
+        self.spatial_index = None; self.index_graph = None
+        self.layout_pending = G.number_of_nodes() > 0
+        if not self.layout_pending: return
+        if self.layout_worker is not None and self.layout_worker.isRunning():
+            self._old_workers.append(self.layout_worker)
+        self.layout_worker = LayoutWorker(G, self.layout_key)
+        self.layout_worker.finished_signal.connect(self.on_layout_ready)
+        self.layout_worker.finished.connect(self._drop_finished_workers)
+        self.layout_worker.start()
+
+    def _drop_finished_workers(self):
+        self._old_workers = [w for w in self._old_workers if w.isRunning()]
+
+    def on_layout_ready(self, G, pos):
+        if G is not self.G: return   # Bu arada başka bir graf çizildi
+        self.pos = pos; self.layout_pending = False
+        self.rebuild_spatial_index(G)
+        path, src, dst = self._draw_args
+        self.draw_graph(G, path, src, dst)
+        self.layout_ready.emit()
+
     def draw_graph(self, G, path=None, src=None, dst=None):
-        self.G = G; self.ax.clear(); self.ax.set_facecolor(THEME["GRAPH_BG"])
-        self.highlight_artists = []; self.last_hovered_edge = None; self.last_hovered_node = None
-        
+        """
+        Grafı, rotayı ve S/D düğümlerini gösterir. Statik sahne (tüm kenarlar ve düğümler) sadece
+        graf veya yerleşim değiştiğinde yeniden kurulur; aksi hâlde sadece katman güncellenip blit edilir.
+        """
+        self.ensure_layout(G)
+        self.G = G; self._draw_args = (path, src, dst)
+        scene_key = (id(G), id(self.pos), self.layout_pending)
+        if scene_key != self._scene_key:
+            self.build_scene(G)
+            self._scene_key = scene_key
+            self.set_route(path, src, dst)
+            self.draw_idle()
+        else:
+            self.set_route(path, src, dst)
+            self.update_overlay()
+
+    def build_scene(self, G):
+        """Statik katmanı (tek LineCollection + tek scatter) ve boş katman artist'lerini kurar."""
+        self.ax.clear(); self.ax.set_facecolor(THEME["GRAPH_BG"])
+        self._background = None; self.route_arrows = []
+        self.last_hovered_edge = None; self.last_hovered_node = None
+
         COLOR_BG_NODE = "#a6d5eb"; COLOR_BG_EDGE = "#636E7E"
         COLOR_SRC = "#22c55e"; COLOR_DST = "#ef4444"; COLOR_PATH = "#00e5ff"
-        
-        if not self.pos or set(self.pos.keys()) != set(G.nodes()):
-            try: self.pos = nx.kamada_kawai_layout(G)
-            except: self.pos = nx.spring_layout(G, seed=42)
 
-        nx.draw_networkx_edges(G, self.pos, edge_color=COLOR_BG_EDGE, width=0.8, alpha=0.1, ax=self.ax, arrows=False)
-        
-        all_nodes = list(G.nodes()); path_nodes_set = set(path) if path else set()
-        special_nodes = {src, dst} if src is not None else set()
-        bg_nodes = [n for n in all_nodes if n not in path_nodes_set and n not in special_nodes]
-        nx.draw_networkx_nodes(G, self.pos, nodelist=bg_nodes, node_size=45, node_color=COLOR_BG_NODE, alpha=1.0, ax=self.ax, edgecolors="#1e293b", linewidths=0.5).set_zorder(2)
-
-        if path and len(path) > 1:
-            path_edges = list(zip(path[:-1], path[1:]))
-            nx.draw_networkx_edges(G, self.pos, edgelist=path_edges, width=3.0, edge_color=COLOR_PATH, alpha=1.0, ax=self.ax, arrows=True, arrowsize=20, arrowstyle='-|>')
-            path_mid_nodes = [n for n in path if n not in (src, dst)]
-            nx.draw_networkx_nodes(G, self.pos, nodelist=path_mid_nodes, node_color=COLOR_PATH, node_size=80, ax=self.ax, linewidths=1.5, edgecolors="white").set_zorder(4)
-
-        if src is not None and src in G:
-            nx.draw_networkx_nodes(G, self.pos, nodelist=[src], node_color=COLOR_SRC, node_size=220, ax=self.ax, edgecolors="white", linewidths=2.5).set_zorder(5)
-        if dst is not None and dst in G:
-            nx.draw_networkx_nodes(G, self.pos, nodelist=[dst], node_color=COLOR_DST, node_size=220, ax=self.ax, edgecolors="white", linewidths=2.5).set_zorder(5)
+        segments = [(self.pos[u], self.pos[v]) for u, v in G.edges() if u in self.pos and v in self.pos]
+        self._all_segments = np.array(segments, dtype=float).reshape(-1, 2, 2)
+        # Kenar katmanı update_lod ile görünüme göre doldurulur (autolim yok: sınırları düğümler belirler)
+        self.edge_lines = LineCollection([], colors=COLOR_BG_EDGE, linewidths=0.8, alpha=0.1, zorder=1)
+        self.ax.add_collection(self.edge_lines, autolim=False)
+        self.edge_image = None; self._lod_key = None
+        self._edge_rank = np.random.default_rng(42).permutation(len(self._all_segments))
+        xy = np.array([self.pos[n] for n in G.nodes() if n in self.pos], dtype=float).reshape(-1, 2)
+        self.ax.scatter(xy[:, 0], xy[:, 1], s=45, c=COLOR_BG_NODE, edgecolors="#1e293b", linewidths=0.5, zorder=2)
+
+        # Katman artist'leri: animated=True olanlar tam çizimde atlanır, on_draw/update_overlay çizer
+        empty = np.zeros((0, 2))
+        self.overlay = {
+            "route_nodes": self.ax.scatter(empty[:, 0], empty[:, 1], s=80, c=COLOR_PATH, edgecolors="white", linewidths=1.5, zorder=4),
+            "src": self.ax.scatter(empty[:, 0], empty[:, 1], s=220, c=COLOR_SRC, edgecolors="white", linewidths=2.5, zorder=5),
+            "dst": self.ax.scatter(empty[:, 0], empty[:, 1], s=220, c=COLOR_DST, edgecolors="white", linewidths=2.5, zorder=5),
+            "hover_node": self.ax.add_patch(Circle((0, 0), 0.01, color='#facc15', zorder=10, alpha=1.0, visible=False)),
+            "hover_edge": self.ax.plot([], [], color="#facc15", linewidth=2.5, alpha=1.0, zorder=10, visible=False)[0],
+        }
+        for artist in self.overlay.values(): artist.set_animated(True)
 
         legend_elements = [
             Line2D([0], [0], marker='o', color='none', markerfacecolor=COLOR_SRC, markersize=10, label="Kaynak (S)", markeredgecolor='white'),
@@ -515,14 +841,52 @@ class GraphCanvas(FigureCanvas):
         ]
         legend = self.ax.legend(handles=legend_elements, loc="upper left", frameon=True, facecolor=THEME["GRAPH_BG"], edgecolor="#374151", labelcolor="white", fontsize=9)
         legend.get_frame().set_alpha(0.85)
-        self.ax.set_axis_off(); self.draw_idle()
+        if self.layout_pending:
+            self.ax.text(0.99, 0.01, "Yerleşim hesaplanıyor...", transform=self.ax.transAxes, ha="right", va="bottom", color=THEME["TEXT"], fontsize=9, alpha=0.7)
+        self.ax.autoscale_view(); self.ax.set_axis_off()
+
+    def set_route(self, path=None, src=None, dst=None):
+        """Katmandaki rota okları, ara düğümler ve S/D işaretlerini günceller (statik sahneye dokunmaz)."""
+        if not self.overlay: return
+        COLOR_PATH = "#00e5ff"
+        for arrow in self.route_arrows: arrow.remove()
+        self.route_arrows = []
+        path = [n for n in (path or []) if n in self.pos]
+        if len(path) > 1:
+            for u, v in zip(path[:-1], path[1:]):
+                arrow = FancyArrowPatch(self.pos[u], self.pos[v], arrowstyle='-|>', mutation_scale=20, color=COLOR_PATH,
+                                        linewidth=3.0, shrinkA=8, shrinkB=8, zorder=3, animated=True)
+                self.ax.add_patch(arrow); self.route_arrows.append(arrow)
+        mid = [self.pos[n] for n in path if n not in (src, dst)] if len(path) > 1 else []
+        self.overlay["route_nodes"].set_offsets(np.array(mid, dtype=float).reshape(-1, 2))
+        for key, node in (("src", src), ("dst", dst)):
+            xy = [self.pos[node]] if node is not None and node in self.pos else []
+            self.overlay[key].set_offsets(np.array(xy, dtype=float).reshape(-1, 2))
+
+    def overlay_artists(self):
+        artists = self.route_arrows + [a for a in self.overlay.values() if a.get_visible()]
+        return sorted(artists, key=lambda a: a.get_zorder())
+
+    def on_draw(self, event):
+        """Tam çizimden sonra statik katmanı önbelleğe alır ve animated katmanı üstüne çizer."""
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        self._background_view = (self.ax.get_xlim(), self.ax.get_ylim())
+        for artist in self.overlay_artists(): self.ax.draw_artist(artist)
+
+    def update_overlay(self):
+        """Sadece katmanı yeniden çizer: önbellekteki arka plan geri yüklenir, katman çizilip blit edilir."""
+        if self._background is None or self._background_view != (self.ax.get_xlim(), self.ax.get_ylim()):
+            self.draw_idle(); return   # Görünüm değişti; tam çizim arka planı yeniler
+        self.restore_region(self._background)
+        for artist in self.overlay_artists(): self.ax.draw_artist(artist)
+        self.blit(self.ax.bbox)
 
 # ==========================================================
 #  GRAFİK 2: PERFORMANS KIYASLAMA
 # ==========================================================
 class ComparisonCanvas(FigureCanvas):
     def __init__(self, parent=None):
-        self.fig, self.axs = plt.subplots(2, 2)
+        self.fig = Figure(); self.axs = self.fig.subplots(2, 2)
         super().__init__(self.fig)
         self.setParent(parent)
         self.fig.patch.set_facecolor(THEME["GRAPH_BG"])
@@ -565,6 +929,47 @@ class ComparisonCanvas(FigureCanvas):
         for spine in ax.spines.values(): spine.set_edgecolor('#374151')
         ax.spines['top'].set_visible(False); ax.spines['right'].set_visible(False)
 
+class ConvergenceCanvas(FigureCanvas):
+    """
+    Çalışan algoritmaların en iyi maliyet - iterasyon eğrileri (canlı).
+    Noktalar işçi iş parçacığından sinyalle gelir; çizim draw_idle ile olay döngüsüne bırakılır,
+    böylece çözüm hiçbir zaman çizimi beklemez.
+    """
+    COLORS = {"GA": "#22d3ee", "RL": "#818cf8", "ABC": "#34d399", "SA": "#f472b6"}
+
+    def __init__(self, parent=None):
+        self.fig = Figure(); self.ax = self.fig.subplots()
+        super().__init__(self.fig)
+        self.setParent(parent)
+        self.fig.patch.set_facecolor(THEME["GRAPH_BG"])
+        self.fig.subplots_adjust(left=0.1, right=0.95, top=0.9, bottom=0.12)
+        self.series = {}    # algoritma -> (iterasyonlar, maliyetler, Line2D)
+        self.reset()
+
+    def reset(self):
+        self.series = {}
+        ax = self.ax
+        ax.clear(); ax.set_facecolor(THEME["GRAPH_BG"])
+        ax.set_title("Yakınsama (En İyi Maliyet)", color='white', fontsize=10, fontweight='bold', pad=8)
+        ax.set_xlabel("İterasyon", color='#9ca3af', fontsize=8); ax.set_ylabel("Maliyet", color='#9ca3af', fontsize=8)
+        ax.tick_params(axis='x', colors='#9ca3af', labelsize=8); ax.tick_params(axis='y', colors='#9ca3af', labelsize=8)
+        ax.grid(linestyle='--', alpha=0.2, color='white')
+        for spine in ax.spines.values(): spine.set_edgecolor('#374151')
+        ax.spines['top'].set_visible(False); ax.spines['right'].set_visible(False)
+        self.draw_idle()
+
+    def add_point(self, algo, iteration, cost):
+        if algo not in self.series:
+            line, = self.ax.plot([], [], drawstyle='steps-post', marker='o', markersize=3, linewidth=1.8,
+                                 color=self.COLORS.get(algo, THEME["BUTTON"]), label=algo)
+            self.series[algo] = ([], [], line)
+            self.ax.legend(loc='upper right', facecolor=THEME["CARD_BG"], edgecolor='#374151', labelcolor='white', fontsize=8)
+        xs, ys, line = self.series[algo]
+        xs.append(iteration); ys.append(clean_cost_value(cost))
+        line.set_data(xs, ys)
+        self.ax.relim(); self.ax.autoscale_view()
+        self.draw_idle()
+
 # ==========================================================
 #  ANA PENCERE
 # ==========================================================
@@ -575,16 +980,55 @@ class Window(QtWidgets.QWidget):
         self.resize(1450, 850)
         self.last_results = None 
         self.manager = None; self.G = nx.Graph() 
-        
-        if ALGO_IMPORTED:
-            self.manager = NetworkManager()
-            if os.path.exists(NODE_FILE) and os.path.exists(EDGE_FILE):
-                success = self.manager.load_data(NODE_FILE, EDGE_FILE, DEMAND_FILE)
-                if success: self.G = self.manager.G
-                else: QtWidgets.QMessageBox.critical(self, "Hata", "CSV okunamadı!")
-            else: QtWidgets.QMessageBox.warning(self, "Dosya Yok", f"Veri dosyaları eksik:\n{DATA_DIR}")
 
+        # Pencere hemen açılır; veri ve yerleşim arka planda hazırlanır (bkz. on_data_loaded)
         self.build_ui(); self.canvas_net.draw_graph(self.G)
+        self.canvas_net.layout_ready.connect(self.on_startup_done)
+        if ALGO_IMPORTED:
+            self.set_loading("Başlatılıyor...")
+            self.data_worker = DataLoadWorker()
+            self.data_worker.progress_signal.connect(self.set_loading)
+            self.data_worker.finished_signal.connect(self.on_data_loaded)
+            self.data_worker.start()
+
+    # --- AÇILIŞ (ARKA PLAN YÜKLEME) ---
+    def set_loading(self, msg):
+        """Yükleme göstergesini gösterir; veri hazır olana kadar çözüm butonları kapalıdır."""
+        self.load_bar.setFormat(msg); self.load_bar.setVisible(True)
+        for b in (self.btn_run, self.btn_compare, self.btn_batch): b.setEnabled(False)
+        self.path_box.setPlainText(f"DURUM: {msg}")
+
+    def on_data_loaded(self, manager, error):
+        if manager is None:
+            self.load_bar.setVisible(False)
+            QtWidgets.QMessageBox.critical(self, "Hata", error)
+            return
+        self.manager = manager; self.G = manager.G
+        self.canvas_net.layout_key = manager.topology_version()
+        self.populate_scenarios()
+        if not getattr(self, '_weights_invalid', False):
+            for b in (self.btn_run, self.btn_compare, self.btn_batch): b.setEnabled(True)
+        if self.canvas_net.layout_pending:
+            self.load_bar.setFormat("Graf yerleşimi hesaplanıyor...")
+            self.path_box.setPlainText("DURUM: Veri yüklendi, graf yerleşimi hesaplanıyor...")
+        else:
+            self.on_startup_done()
+
+    def on_startup_done(self):
+        if self.manager is None: return
+        self.load_bar.setVisible(False)
+        self.path_box.setPlainText(f"Hazır: {self.G.number_of_nodes()} düğüm, {self.G.number_of_edges()} bağlantı.")
+
+    def populate_scenarios(self):
+        self.scenario_combo.blockSignals(True)
+        self.scenario_combo.clear()
+        if self.manager and self.manager.demands:
+            for i, dem in enumerate(self.manager.demands): 
+                self.scenario_combo.addItem(f"Senaryo {i+1}: S:{dem['src']} -> D:{dem['dst']} | {dem['bw']} Mbps", dem)
+        else: 
+            self.scenario_combo.addItem("Manuel Giriş", {'src':0, 'dst':1, 'bw':0})
+        self.scenario_combo.blockSignals(False)
+        self.on_scenario_changed(0)
 
     def on_scenario_changed(self, idx):
         data = self.scenario_combo.itemData(idx)
@@ -610,13 +1054,25 @@ class Window(QtWidgets.QWidget):
         if reply == QtWidgets.QMessageBox.Yes:
             self.btn_batch.setEnabled(False)
             self.btn_batch.setText("Test Yapılıyor... (%0)")
+            self.btn_batch_cancel.setEnabled(True); self.btn_batch_cancel.setVisible(True)
             w = tuple(sb.value()/100 for sb in self.weight_inputs)
             
+            # Sonuç penceresi hemen açılır; satırlar tamamlandıkça eklenir
+            self.results_window = BatchResultsWindow([], self)
+            self.results_window.show()
+
             self.batch_worker = BatchTestWorker(self.manager, self.manager.demands, w)
             self.batch_worker.progress_signal.connect(self.update_batch_progress)
+            self.batch_worker.row_signal.connect(self.results_window.add_row)
             self.batch_worker.finished_signal.connect(self.show_batch_results)
             self.batch_worker.start()
 
+    def cancel_batch_test(self):
+        if getattr(self, 'batch_worker', None) and self.batch_worker.isRunning():
+            self.batch_worker.cancel()
+            self.btn_batch_cancel.setEnabled(False)
+            self.path_box.setPlainText("DURUM: Toplu test durduruluyor...")
+
     def update_batch_progress(self, val, msg):
         self.btn_batch.setText(f"İşleniyor... (%{val})")
         self.path_box.setPlainText(f"DURUM: {msg}")
@@ -624,10 +1080,14 @@ class Window(QtWidgets.QWidget):
     def show_batch_results(self, report_data):
         self.btn_batch.setEnabled(True)
         self.btn_batch.setText("OTOMATİK TOPLU TEST")
-        self.path_box.setPlainText("Test tamamlandı. Sonuç penceresi açıldı.")
+        self.btn_batch_cancel.setVisible(False)
+        if self.batch_worker.cancelled:
+            self.path_box.setPlainText(f"Test durduruldu. Tamamlanan {len(report_data)} satır sonuç penceresinde.")
+        else:
+            self.path_box.setPlainText("Test tamamlandı. Sonuç penceresi açıldı.")
         
-        # Sonuç penceresini aç
-        self.results_window = BatchResultsWindow(report_data, self)
+        # Sonuç penceresi kapatıldıysa yeniden aç; tablo senaryo sırasına göre yenilenir
+        self.results_window.set_data(report_data)
         self.results_window.show()
 
     def export_results(self):
@@ -657,11 +1117,18 @@ class Window(QtWidgets.QWidget):
         sidebar = QtWidgets.QVBoxLayout()
         sidebar.setSpacing(15)
 
+        # -- Açılış Yükleme Göstergesi (veri + yerleşim arka planda hazırlanırken) --
+        self.load_bar = QtWidgets.QProgressBar()
+        self.load_bar.setRange(0, 0)   # Belirsiz (meşgul) gösterge
+        self.load_bar.setTextVisible(True); self.load_bar.setAlignment(QtCore.Qt.AlignCenter)
+        self.load_bar.setVisible(False)
+        sidebar.addWidget(self.load_bar)
+
         # -- Algoritma Seçimi --
         gb_algo = QtWidgets.QGroupBox("Algoritma Seçimi")
         l_algo = QtWidgets.QVBoxLayout()
         self.algo_combo = QtWidgets.QComboBox()
-        self.algo_combo.addItems(["Genetik Algoritma (GA)", "Q-Learning (RL)", "Yapay Arı (ABC)", "Benzetimli Tavlama (SA)"])
+        self.algo_combo.addItems(["Genetik Algoritma (GA)", "Q-Learning (RL)", "Yapay Arı (ABC)", "Benzetimli Tavlama (SA)", "Kesin Çözüm (A*)", "Pareto Cephesi (NSGA-II)"])
         l_algo.addWidget(self.algo_combo)
         gb_algo.setLayout(l_algo)
         sidebar.addWidget(gb_algo)
@@ -676,11 +1143,7 @@ class Window(QtWidgets.QWidget):
         # 1. Talep Listesi (Etiket üstte, Kutu altta)
         l_route.addWidget(QtWidgets.QLabel("Talep Listesi:"))
         self.scenario_combo = QtWidgets.QComboBox()
-        if self.manager and self.manager.demands:
-            for i, dem in enumerate(self.manager.demands): 
-                self.scenario_combo.addItem(f"Senaryo {i+1}: S:{dem['src']} -> D:{dem['dst']} | {dem['bw']} Mbps", dem)
-        else: 
-            self.scenario_combo.addItem("Manuel Giriş", {'src':0, 'dst':1, 'bw':0})
+        self.scenario_combo.addItem("Manuel Giriş", {'src':0, 'dst':1, 'bw':0})   # Veri yüklenince talepler gelir
         self.scenario_combo.currentIndexChanged.connect(self.on_scenario_changed)
         l_route.addWidget(self.scenario_combo)
         
@@ -786,6 +1249,14 @@ class Window(QtWidgets.QWidget):
         self.btn_compare.setObjectName("compareBtn"); self.btn_compare.clicked.connect(self.run_compare)
         sidebar.addWidget(self.btn_compare)
 
+        # Eğri düzleşince çözüm eldeki en iyi yolla erken bitirilebilir
+        self.btn_stop = QtWidgets.QPushButton("ERKEN DURDUR")
+        self.btn_stop.setMinimumHeight(36)
+        self.btn_stop.setStyleSheet("background-color: #ef4444; color: white; font-weight: bold; border-radius: 5px;")
+        self.btn_stop.clicked.connect(self.stop_solver)
+        self.btn_stop.setVisible(False)
+        sidebar.addWidget(self.btn_stop)
+
         # --- YENİ BATCH TEST BUTONU ---
         self.btn_batch = QtWidgets.QPushButton("OTOMATİK TOPLU TEST")
         self.btn_batch.setMinimumHeight(50)
@@ -793,6 +1264,13 @@ class Window(QtWidgets.QWidget):
         self.btn_batch.clicked.connect(self.run_batch_test)
         sidebar.addWidget(self.btn_batch)
 
+        self.btn_batch_cancel = QtWidgets.QPushButton("TOPLU TESTİ DURDUR")
+        self.btn_batch_cancel.setMinimumHeight(36)
+        self.btn_batch_cancel.setStyleSheet("background-color: #ef4444; color: white; font-weight: bold; border-radius: 5px;")
+        self.btn_batch_cancel.clicked.connect(self.cancel_batch_test)
+        self.btn_batch_cancel.setVisible(False)
+        sidebar.addWidget(self.btn_batch_cancel)
+
         self.btn_export = QtWidgets.QPushButton("Tekil Sonuç Kaydet"); self.btn_export.setStyleSheet("background-color: #4b5563; color: white; padding: 8px;")
         self.btn_export.clicked.connect(self.export_results); sidebar.addWidget(self.btn_export)
 
@@ -824,6 +1302,7 @@ class Window(QtWidgets.QWidget):
         tab1_layout.addLayout(zoom_toolbar); tab1_layout.addWidget(self.canvas_net); self.tabs.addTab(tab1_widget, "📍 AĞ TOPOLOJİSİ")
 
         self.canvas_perf = ComparisonCanvas(self); self.tabs.addTab(self.canvas_perf, "📊 ALGORİTMA PERFORMANS")
+        self.canvas_conv = ConvergenceCanvas(self); self.tabs.addTab(self.canvas_conv, "📈 YAKINSAMA")
         main_layout.addWidget(self.tabs, 1)
 
         right_layout = QtWidgets.QVBoxLayout(); right_layout.setSpacing(10)
@@ -890,7 +1369,8 @@ class Window(QtWidgets.QWidget):
                 if hasattr(self, 'weights_note'):
                     self.weights_note.setText("Toplam %100 olmalı; elle girin. Toplam 100%\'ü geçerse uyarı verir.")
                     self.weights_note.setStyleSheet("color:#a5b1c2; font-size:11px;")
-            # Butonları aktif et
+            # Butonları aktif et (veri henüz yükleniyorsa on_data_loaded açar)
+            if self.manager is None: return
             if hasattr(self, 'btn_run'): self.btn_run.setEnabled(True)
             if hasattr(self, 'btn_compare'): self.btn_compare.setEnabled(True)
             if hasattr(self, 'btn_batch'): self.btn_batch.setEnabled(True)
@@ -926,7 +1406,7 @@ class Window(QtWidgets.QWidget):
         except: return
 
         w = tuple(sb.value()/100 for sb in self.weight_inputs)
-        key = ["GA", "RL", "ABC", "SA"][self.algo_combo.currentIndex()]
+        key = ["GA", "RL", "ABC", "SA", "A*", "PF"][self.algo_combo.currentIndex()]
         
         self.tabs.setCurrentIndex(0)
         self.btn_run.setText("Hesaplanıyor...")
@@ -935,10 +1415,36 @@ class Window(QtWidgets.QWidget):
         
         self.worker = RoutingWorker("SINGLE", key, self.manager, s, d, w, bw)
         self.worker.finished_single.connect(self.on_single_done)
+        self.worker.progress_signal.connect(self.on_progress)
         self.worker.error.connect(self.on_error)
+        self.start_live_run()
         self.worker.start()
+
+    def start_live_run(self):
+        """Yakınsama grafiğini sıfırlar ve erken durdurma butonunu gösterir."""
+        self.canvas_conv.reset()
+        self.btn_stop.setEnabled(True); self.btn_stop.setVisible(True)
+
+    def stop_solver(self):
+        if getattr(self, 'worker', None) and self.worker.isRunning():
+            self.worker.stop()
+            self.btn_stop.setEnabled(False)
+            self.path_box.setPlainText("DURUM: Algoritma durduruluyor, eldeki en iyi yol kullanılacak...")
+
+    def on_progress(self, algo, iteration, cost, path):
+        self.canvas_conv.add_point(algo, iteration, cost)
+        if self.worker.mode == "SINGLE":
+            # Ara en iyi yol topolojide de gösterilir (sadece overlay güncellenir)
+            try: s, d = int(self.src_edit.text()), int(self.dst_edit.text())
+            except: s, d = None, None
+            self.canvas_net.draw_graph(self.G, path, s, d)
+        if self.btn_stop.isEnabled():
+            self.path_box.setPlainText(f"Algoritma çalışıyor... ({algo})\nİterasyon: {iteration}\n"
+                                       f"En İyi Maliyet: {clean_cost_value(cost):.4f}\nRota: {' -> '.join(map(str, path))}")
+
     def on_single_done(self, path, cost, metrics):
         self.btn_run.setText("HESAPLA VE ÇİZ"); self.btn_run.setEnabled(True)
+        self.btn_stop.setVisible(False)
         try: s, d = int(self.src_edit.text()), int(self.dst_edit.text())
         except: s, d = None, None
         self.canvas_net.draw_graph(self.G, path, s, d)
@@ -956,7 +1462,9 @@ class Window(QtWidgets.QWidget):
         self.val_total.setText(f"{display_cost:.4f}")
 
         self.lbl_time_val.setText(f"{metrics.get('time_ms',0):.2f} ms")
-        log = f"ALGORİTMA: {self.algo_combo.currentText()}\nTalep: {getattr(self, 'current_bw_demand', 0)} Mbps\nDurum: {'BAŞARILI' if path else 'BAŞARISIZ'}\nMaliyet: {display_cost:.4f}\nRota: {path_str}"
+        status = 'BAŞARILI' if path else 'BAŞARISIZ'
+        if metrics.get('stopped'): status += ' (erken durduruldu)'
+        log = f"ALGORİTMA: {self.algo_combo.currentText()}\nTalep: {getattr(self, 'current_bw_demand', 0)} Mbps\nDurum: {status}\nMaliyet: {display_cost:.4f}\nRota: {path_str}"
         self.path_box.setPlainText(log)
 
     def run_compare(self):
@@ -965,11 +1473,14 @@ class Window(QtWidgets.QWidget):
         w = tuple(sb.value()/100 for sb in self.weight_inputs)
         self.tabs.setCurrentIndex(1); self.btn_compare.setText("Kıyaslanıyor..."); self.btn_compare.setEnabled(False)
         self.worker = RoutingWorker("COMPARE", "ALL", self.manager, s, d, w, bw)
-        self.worker.finished_batch.connect(self.on_batch_done); self.worker.error.connect(self.on_error); self.worker.start()
+        self.worker.finished_batch.connect(self.on_batch_done); self.worker.error.connect(self.on_error)
+        self.worker.progress_signal.connect(self.on_progress)
+        self.start_live_run(); self.worker.start()
 
     def on_batch_done(self, results):
         self.last_results = results
         self.btn_compare.setText("TÜMÜNÜ KIYASLA"); self.btn_compare.setEnabled(True)
+        self.btn_stop.setVisible(False)
         succ = {k: v for k, v in results.items() if v.get('success', False)}
         best = min(succ, key=lambda k: succ[k].get("total_cost", float('inf'))) if succ else "-"
         html = f"<div><h2 style='color:#60a5fa;'>KIYASLAMA BİTTİ</h2><p><b>En İyi:</b> <span style='color:#22c55e; font-size:18px;'>{best}</span></p>"
@@ -988,6 +1499,7 @@ class Window(QtWidgets.QWidget):
     def on_error(self, msg):
         self.btn_run.setText("HESAPLA VE ÇİZ"); self.btn_run.setEnabled(True)
         self.btn_compare.setText("TÜMÜNÜ KIYASLA"); self.btn_compare.setEnabled(True)
+        self.btn_stop.setVisible(False)
         self.path_box.setPlainText(f"HATA OLUŞTU:\n{msg}"); QtWidgets.QMessageBox.critical(self, "Hata", msg)
 
 if __name__ == "__main__":
@@ -2,6 +2,11 @@ import random
 import math
 import copy
 import networkx as nx
+import numpy as np
+
+from algorithms.batch_walk import batch_random_walks, hop_distance_array
+from algorithms.path_repair import rebuild_subpath
+from algorithms.solution_archive import valid_seeds
 
 class ABCOptimizer:
     """
@@ -17,7 +22,7 @@ class ABCOptimizer:
     - Scout Bees (Kaşif Arılar): İyileşmeyen (limit aşan) çözümleri terk edip rastgele yeni yol arar.
     """
 
-    def __init__(self, manager, src, dst, bw_demand):
+    def __init__(self, manager, src, dst, bw_demand, max_delay=None, min_reliability=None, archive=None):
         """
         ABC Algoritması Başlatıcı.
         
@@ -26,11 +31,24 @@ class ABCOptimizer:
             src (int): Kaynak düğüm ID.
             dst (int): Hedef düğüm ID.
             bw_demand (float): Talep edilen bant genişliği (Mbps).
+            max_delay (float, optional): Sert gecikme bütçesi (ms).
+            min_reliability (float, optional): Sert güvenilirlik tabanı (0-1).
+            archive (SolutionArchive, optional): Sıcak başlangıç tohumlarının alındığı ve
+                bulunan en iyi yolun geri yazıldığı arşiv.
         """
         self.manager = manager
         self.src = src
         self.dst = dst
         self.bw_demand = bw_demand
+        self.max_delay = max_delay
+        self.min_reliability = min_reliability
+        # Kısmi yolları kısıt alt sınırlarıyla budayan yardımcı (kısıt yoksa None)
+        self._qos = manager.get_qos_constraints(dst, max_delay, min_reliability, src)
+        self.qos_rejections = 0               # Kısıtı sağlayamayacağı kesin olduğu için aranmayan mutasyon sayısı
+        self.archive = archive
+        self.progress = None                  # ProgressReporter: verilirse döngü başına ilerleme bildirilir, durdurulabilir
+        self.warm_cycles = 20                 # Sıcak başlangıçta (tohum varsa) döngü sayısı (None: max_cycles)
+        self.n_seeds = 0                      # Son çözümde kullanılan sıcak başlangıç tohumu sayısı
 
         # --- ABC Parametreleri ---
         self.colony_size = 40                 # Toplam arı sayısı
@@ -39,6 +57,14 @@ class ABCOptimizer:
         self.max_cycles = 60                  # Maksimum iterasyon
         self.limit = 15                       # Bir çözümün terk edilme limiti (Trial limit)
         self.max_hop_limit = 15               # Maksimum sekme (hop) sayısı
+        self.mutate_max_hops = 6              # Mutasyonda yeniden üretilen segmentin maksimum sekmesi
+        self.mutate_expansions = 50           # Segment aramasında genişletilecek maksimum düğüm sayısı
+        self.vectorized = True                # Döngüyü toplu (vektörel) seçim/değerlendirme ile çalıştır
+        self.hop_pruning = True               # Hedefe kalan sekme bütçesiyle ulaşılamayan komşuları baştan ele
+        self.use_bounds = True                # Alt sınırı mevcut maliyete ulaşan mutasyonları aramadan ele
+        self._bounds = None                   # Ağırlık profiline ait CostBounds (solve içinde atanır)
+        self.bound_rejections = 0             # Alt sınır ile erken elenen mutasyon sayısı
+        self.rng = np.random.default_rng(random.getrandbits(64)) # Segment araması için (random.seed ile tekrarlanabilir)
 
         # Food Sources: [{'path': [], 'cost': float, 'metrics': {}, 'trial': 0}]
         self.population = [] 
@@ -48,15 +74,22 @@ class ABCOptimizer:
         self.global_best_cost = float('inf')
         self.global_best_metrics = {}
 
+        # Yol üretim istatistikleri (deneme / başarısız deneme / budanan hamle), metriklerde raporlanır
+        self.walk_stats = {'attempts': 0, 'failures': 0, 'pruned': 0, 'qos_pruned': 0}
+
     def _generate_random_path(self, max_retries=10):
         """
         Rastgele (Random) geçerli bir yol üretir.
         DFS tabanlıdır, döngüleri engeller ve BW kısıtını gözetir.
         """
+        dist = self.manager.hop_distances_to(self.dst) if self.hop_pruning else None
+        qos = self._qos
         for _ in range(max_retries):
+            self.walk_stats['attempts'] += 1
             path = [self.src]
             visited = {self.src}
             curr = self.src
+            acc = qos.start(self.src) if qos else None # Birikmiş gecikme / -log güvenilirlik
             
             while curr != self.dst:
                 neighbors = list(self.manager.G.neighbors(curr))
@@ -73,10 +106,24 @@ class ABCOptimizer:
                 if not valid_neighbors:
                     valid_neighbors = [n for n in neighbors if n not in visited]
 
+                # Hop bütçesi: hedefe kalan sekme içinde ulaşılamayacak komşuları seçmeden ele
+                if dist is not None:
+                    budget = self.max_hop_limit - len(path) - 1
+                    feasible = [n for n in valid_neighbors if dist.get(n, float('inf')) <= budget]
+                    self.walk_stats['pruned'] += len(valid_neighbors) - len(feasible)
+                    valid_neighbors = feasible
+
+                # Sert QoS kısıtı: bütçeye sığan hiçbir tamamlaması olmayan komşuları ele
+                if qos:
+                    feasible = [n for n in valid_neighbors if qos.step_ok(acc, curr, n)]
+                    self.walk_stats['qos_pruned'] += len(valid_neighbors) - len(feasible)
+                    valid_neighbors = feasible
+
                 if not valid_neighbors:
                     break # Çıkmaz sokak
                 
                 next_node = random.choice(valid_neighbors)
+                if qos: acc = qos.advance(acc, curr, next_node)
                 path.append(next_node)
                 visited.add(next_node)
                 curr = next_node
@@ -86,43 +133,70 @@ class ABCOptimizer:
             
             if curr == self.dst:
                 return path
+            self.walk_stats['failures'] += 1
         return None
 
+    def _generate_random_paths(self, count, max_retries=10):
+        """
+        count adet rastgele yolu toplu yürüyüş (batch_random_walks) ile tek seferde üretir.
+        Her yol için _generate_random_path ile aynı deneme hakkı (max_retries) tanınır ve
+        aynı gevşek BW filtresi (talebin %50'si) tercih olarak uygulanır.
+        Hop bütçesi budaması açıkken yürüyüşler neredeyse hiç başarısız olmadığından, deneme
+        hakları tek seferde harcanmaz; turlar halinde sadece eksik kalan sayı kadar yürüyücü çalışır.
+        """
+        if count <= 0:
+            return []
+        ga = self.manager.get_graph_arrays()
+        budget_dist = None
+        if self.hop_pruning:
+            budget_dist = hop_distance_array(ga, self.manager.hop_distances_to(self.dst))
+
+        paths = []
+        walkers_left = count * max_retries
+        while len(paths) < count and walkers_left > 0:
+            n = min(walkers_left, count - len(paths)) if self.hop_pruning else walkers_left
+            paths += batch_random_walks(
+                ga, self.src, self.dst, n, self.max_hop_limit,
+                greedy_prob=0.0, bw_pref=self.bw_demand * 0.5,
+                budget_dist=budget_dist, stats=self.walk_stats, qos=self._qos
+            )
+            walkers_left -= n
+        return paths[:count]
+
     def _generate_heuristic_population(self, count):
         """
         K-Shortest Paths algoritması ile kaliteli başlangıç çözümleri üretir.
         """
-        paths = []
+        # En kısa yolları bul (Topology-aware initialization)
+        # Yollar (src, dst, BW kovası) bazında önbellekten gelir; gerekirse lazy genişletilir.
         try:
-            # En kısa yolları bul (Topology-aware initialization)
-            generator = nx.shortest_simple_paths(self.manager.G, self.src, self.dst)
-            for _ in range(count * 3): # Fazla üretip seç
-                try:
-                    p = next(generator)
-                    if len(p) <= self.max_hop_limit:
-                        paths.append(p)
-                except StopIteration:
-                    break
-            
-            if len(paths) > count:
-                return random.sample(paths, count)
-            return paths
-        except:
+            paths = self.manager.get_ksp_cache().get(
+                self.src, self.dst, self.bw_demand, count * 3, self.max_hop_limit, # Fazla üretip seç
+                should_stop=self.progress.should_stop if self.progress is not None else None
+            )
+        except (nx.NetworkXException, KeyError):
             return []
 
+        if len(paths) > count:
+            return random.sample(paths, count)
+        return paths
+
     def _evaluate(self, path, weights):
         """
         Bir yolun maliyetini hesaplar.
         """
         if not path:
             return float('inf'), {}
-        return self.manager.calculate_path_cost(path, weights, self.bw_demand)
+        return self.manager.calculate_path_cost(path, weights, self.bw_demand,
+                                                self.max_delay, self.min_reliability)
 
-    def _mutate(self, current_path):
+    def _mutate(self, current_path, reject_at=None):
         """
         Lokal Arama (Neighbor Generation):
         Mevcut yolun bir parçasını değiştirerek komşu bir çözüm üretir.
         (Sub-path regeneration)
+        reject_at verilirse (kaynağın mevcut maliyeti), seçilen segment için hiçbir aday bu
+        değerin altına inemiyorsa segment aranmaz ve yol değiştirilmeden döner.
         """
         if len(current_path) < 3:
             return list(current_path) # Değiştirilemez kadar kısa
@@ -136,35 +210,28 @@ class ABCOptimizer:
         
         node_a = new_path[idx_a]
         node_b = new_path[idx_b]
+
+        # Erken Ret: açgözlü seçimde iyileşme imkânsızsa (alt sınır >= mevcut maliyet) arama yapma
+        if reject_at is not None and self._bounds is not None:
+            if self._bounds.splice_bound(new_path, idx_a, idx_b, self.dst) >= reject_at:
+                self.bound_rejections += 1
+                return list(current_path)
+
+        # Sert QoS kısıtı: segment en ucuz hâliyle bile bütçeyi aşıyorsa uygun aday çıkamaz
+        if self._qos and not self._qos.splice_ok(new_path, idx_a, idx_b):
+            self.qos_rejections += 1
+            return list(current_path)
         
-        # node_a'dan node_b'ye alternatif, kısa bir yol bulmaya çalış (DFS/Random Walk)
-        # Orijinal segmenti atla
-        segment_nodes = set(new_path[idx_a+1 : idx_b])
-        
-        temp_path = [node_a]
-        curr = node_a
-        found = False
-        
-        # Küçük bir lokal arama (max 5 adım)
-        for _ in range(6):
-            neighbors = list(self.manager.G.neighbors(curr))
-            # Döngü oluşturmayacak komşular
-            valid_n = [
-                n for n in neighbors 
-                if n not in temp_path and n not in new_path[:idx_a] and n not in new_path[idx_b+1:]
-            ]
-            
-            # Hedef node_b komşulardaysa bağlan
-            if node_b in neighbors:
-                temp_path.append(node_b)
-                found = True
-                break
-            
-            if not valid_n: break
-            
-            curr = random.choice(valid_n)
-            temp_path.append(curr)
-        
+        # node_a'dan node_b'ye alternatif, kısa bir yol bulmaya çalış (sınırlı BFS)
+        # Orijinal segment serbest; önek ve sonek düğümleri yasak (döngü oluşmasın)
+        temp_path = rebuild_subpath(
+            self.manager.get_graph_arrays(), node_a, node_b,
+            new_path[:idx_a] + new_path[idx_b+1:],
+            max_hops=self.mutate_max_hops, max_expansions=self.mutate_expansions,
+            rng=self.rng
+        )
+        found = temp_path is not None
+
         if found:
             # Yeni yolu birleştir: [Başlangıç...A] + [Yeni Segment] + [B...Bitiş]
             # temp_path [A, ..., B] içerir.
@@ -176,15 +243,33 @@ class ABCOptimizer:
 
         return list(current_path) # Değişiklik yapılamadıysa eskisini döndür
 
-    def solve(self, weights):
+    def solve(self, weights, initial_solutions=None):
         """
         ABC Algoritması ana döngüsü.
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            initial_solutions (list, optional): Sıcak başlangıç yolları; sezgisel yarının yerine
+                besin kaynağı olarak konur. None ise ve archive verildiyse arşivden alınır.
         """
+        # Alt sınırlar (mutasyonların erken reddi için)
+        self._bounds = self.manager.get_cost_bounds(weights) if self.use_bounds else None
+        self.bound_rejections = 0
+        self.qos_rejections = 0
+
         # --- BAŞLANGIÇ POPÜLASYONU ---
         self.population = []
         
+        # Sıcak Başlangıç: tohumlar sezgisel yarının ilk sıralarını alır
+        if initial_solutions is None and self.archive is not None:
+            initial_solutions = self.archive.seeds(self.src, self.dst, self.bw_demand, weights,
+                                                   self.max_delay, self.min_reliability)
+        seeds = valid_seeds(self.manager, initial_solutions, self.src, self.dst,
+                            self.max_hop_limit)[:max(1, self.n_employed // 2)]
+        self.n_seeds = len(seeds)
+
         # %50 Heuristic
-        heuristic_paths = self._generate_heuristic_population(self.n_employed // 2)
+        heuristic_paths = seeds + self._generate_heuristic_population(self.n_employed // 2 - len(seeds))
         for p in heuristic_paths:
             cost, metrics = self._evaluate(p, weights)
             self.population.append({
@@ -194,13 +279,15 @@ class ABCOptimizer:
         # %50 Random
         attempts = 0
         while len(self.population) < self.n_employed and attempts < 100:
-            p = self._generate_random_path()
-            if p:
+            if self.progress is not None and self.progress.should_stop():
+                break
+            needed = self.n_employed - len(self.population)
+            for p in self._generate_random_paths(needed):
                 cost, metrics = self._evaluate(p, weights)
                 self.population.append({
                     'path': p, 'cost': cost, 'metrics': metrics, 'trial': 0
                 })
-            attempts += 1
+            attempts += needed
             
         # Eğer hiç yol yoksa
         if not self.population:
@@ -213,14 +300,36 @@ class ABCOptimizer:
         self.global_best_metrics = self.population[0]['metrics']
 
         # --- ANA DÖNGÜ (CYCLES) ---
-        for cycle in range(self.max_cycles):
+        # Tohumlar iyi bir bölgeden başlattığı için sıcak başlangıçta daha kısa bütçe yeterli
+        cycles = self.warm_cycles if (seeds and self.warm_cycles is not None) else self.max_cycles
+        if self.vectorized:
+            self._run_cycles_vectorized(weights, cycles)
+        else:
+            self._run_cycles(weights, cycles)
+        if self.progress is not None:
+            self.progress.finish(self.global_best_cost, self.global_best_path)
+
+        if self.archive is not None and self.global_best_path:
+            self.archive.add(self.src, self.dst, self.bw_demand, self.global_best_path,
+                             self.max_delay, self.min_reliability)
+
+        self.global_best_metrics = dict(self.global_best_metrics, walk_stats=dict(self.walk_stats),
+                                        bound_rejections=self.bound_rejections,
+                                        qos_rejections=self.qos_rejections, warm_seeds=self.n_seeds)
+        return self.global_best_path, self.global_best_cost, self.global_best_metrics
+
+    def _run_cycles(self, weights, cycles=None):
+        """
+        Klasik (sıralı) ABC döngüsü: her arı tek tek mutasyona uğratılır ve değerlendirilir.
+        """
+        for cycle in range(self.max_cycles if cycles is None else cycles):
             
             # 1. EMPLOYED BEES PHASE (İşçi Arılar)
             for i in range(len(self.population)):
                 bee = self.population[i]
                 
                 # Yeni çözüm üret (Mutation)
-                new_path = self._mutate(bee['path'])
+                new_path = self._mutate(bee['path'], bee['cost'])
                 new_cost, new_metrics = self._evaluate(new_path, weights)
                 
                 # Greedy Selection
@@ -252,7 +361,7 @@ class ABCOptimizer:
                 
                 # Seçilen kaynak üzerinde çalış
                 target_bee = self.population[selected_idx]
-                new_path = self._mutate(target_bee['path'])
+                new_path = self._mutate(target_bee['path'], target_bee['cost'])
                 new_cost, new_metrics = self._evaluate(new_path, weights)
                 
                 # Greedy Selection (Onlooker için)
@@ -265,19 +374,19 @@ class ABCOptimizer:
                     target_bee['trial'] += 1
 
             # 3. SCOUT BEES PHASE (Kaşif Arılar)
-            # Limiti aşan kaynakları bul ve yenile
-            for i in range(len(self.population)):
-                if self.population[i]['trial'] > self.limit:
-                    # Kaynağı terk et, rastgele yeni yol bul
-                    random_path = self._generate_random_path()
-                    if random_path:
-                        cost, metrics = self._evaluate(random_path, weights)
-                        self.population[i] = {
-                            'path': random_path, 'cost': cost, 'metrics': metrics, 'trial': 0
-                        }
-                    else:
-                        # Eğer rastgele yol bulunamazsa sadece trial'ı sıfırla (Soft reset)
-                        self.population[i]['trial'] = 0
+            # Limiti aşan kaynakları bul ve hepsi için yeni yolları tek seferde üret
+            scouts = [i for i in range(len(self.population)) if self.population[i]['trial'] > self.limit]
+            scout_paths = self._generate_random_paths(len(scouts))
+            for n, i in enumerate(scouts):
+                if n < len(scout_paths):
+                    # Kaynağı terk et, rastgele yeni yola geç
+                    cost, metrics = self._evaluate(scout_paths[n], weights)
+                    self.population[i] = {
+                        'path': scout_paths[n], 'cost': cost, 'metrics': metrics, 'trial': 0
+                    }
+                else:
+                    # Eğer rastgele yol bulunamazsa sadece trial'ı sıfırla (Soft reset)
+                    self.population[i]['trial'] = 0
 
             # 4. MEMORIZE BEST SOLUTION
             current_cycle_best = min(self.population, key=lambda x: x['cost'])
@@ -286,4 +395,93 @@ class ABCOptimizer:
                 self.global_best_path = list(current_cycle_best['path'])
                 self.global_best_metrics = current_cycle_best['metrics']
 
-        return self.global_best_path, self.global_best_cost, self.global_best_metrics
\ No newline at end of file
+            if self.progress is not None and self.progress.report(cycle + 1, self.global_best_cost, self.global_best_path):
+                break
+
+    def _run_cycles_vectorized(self, weights, cycles=None):
+        """
+        Vektörel ABC döngüsü. Her fazda adaylar toplu üretilir ve tek seferde değerlendirilir
+        (GraphArrays.evaluate_paths); açgözlü (greedy) değişim dizi maskeleriyle yapılır.
+
+        - Gözcü arıların tüm rulet seçimleri kümülatif olasılık dizisinden searchsorted ile
+          tek seferde çekilir.
+        - Aynı kaynağı seçen gözcüler aynı anlık görüntü (snapshot) üzerinde çalışır; kaynak
+          başına en iyi aday değerlendirilir, iyileşme yoksa trial seçen gözcü sayısı kadar artar.
+        - Kaşif arıların yeni yolları toplu yürüyüşle üretilip toplu değerlendirilir.
+        """
+        ga = self.manager.get_graph_arrays()
+        n = len(self.population)
+        paths = [b['path'] for b in self.population]
+        metrics = [b['metrics'] for b in self.population]
+        costs = np.array([b['cost'] for b in self.population], dtype=float)
+        trials = np.array([b['trial'] for b in self.population], dtype=np.int64)
+
+        def replace(targets, cand_paths, cand_costs, parts, rows):
+            for i, r in zip(targets.tolist(), rows.tolist()):
+                paths[i] = cand_paths[r]
+                costs[i] = cand_costs[r]
+                metrics[i] = ga.metrics_at(parts, cand_costs, r)
+
+        for cycle in range(self.max_cycles if cycles is None else cycles):
+
+            # 1. EMPLOYED BEES PHASE (İşçi Arılar): tüm kaynaklar için toplu mutasyon + değerlendirme
+            cand = [self._mutate(p, c) for p, c in zip(paths, costs.tolist())]
+            c_costs, parts = ga.evaluate_paths(cand, weights, self.bw_demand, self.max_delay, self.min_reliability)
+            better = c_costs < costs
+            idx = np.nonzero(better)[0]
+            replace(idx, cand, c_costs, parts, idx)
+            trials = np.where(better, 0, trials + 1)
+
+            # 2. ONLOOKER BEES PHASE (Gözcü Arılar)
+            # Fitness = 1 / (Cost + epsilon); tüm rulet seçimleri tek seferde (searchsorted)
+            fitness = 1.0 / (costs + 1e-9)
+            total = fitness.sum()
+            if total > 0:
+                cumulative = np.cumsum(fitness / total)
+                sel = np.searchsorted(cumulative, self.rng.random(self.n_onlooker))
+                sel = np.minimum(sel, n - 1)
+            else:
+                sel = self.rng.integers(0, n, self.n_onlooker)
+
+            cand = [self._mutate(paths[i], costs[i]) for i in sel]
+            c_costs, parts = ga.evaluate_paths(cand, weights, self.bw_demand, self.max_delay, self.min_reliability)
+
+            # Kaynak başına en iyi aday (çakışma çözümü)
+            order = np.lexsort((c_costs, sel))
+            sources, first = np.unique(sel[order], return_index=True)
+            best_rows = order[first]
+            better = c_costs[best_rows] < costs[sources]
+            replace(sources[better], cand, c_costs, parts, best_rows[better])
+            counts = np.bincount(sel, minlength=n)
+            trials[sources[better]] = 0
+            trials[sources[~better]] += counts[sources[~better]]
+
+            # 3. SCOUT BEES PHASE (Kaşif Arılar): limiti aşanlar için toplu üretim + değerlendirme
+            scouts = np.nonzero(trials > self.limit)[0]
+            if scouts.size:
+                scout_paths = self._generate_random_paths(scouts.size)
+                if scout_paths:
+                    s_costs, parts = ga.evaluate_paths(scout_paths, weights, self.bw_demand,
+                                                         self.max_delay, self.min_reliability)
+                    k = len(scout_paths)
+                    replace(scouts[:k], scout_paths, s_costs, parts, np.arange(k))
+                # Yol bulunamayanlarda sadece trial sıfırlanır (Soft reset)
+                trials[scouts] = 0
+
+            # 4. MEMORIZE BEST SOLUTION
+            b = int(np.argmin(costs))
+            if costs[b] < self.global_best_cost:
+                self.global_best_cost = float(costs[b])
+                self.global_best_path = list(paths[b])
+                self.global_best_metrics = metrics[b]
+
+            if self.progress is not None and self.progress.report(cycle + 1, self.global_best_cost, self.global_best_path):
+                break
+
+        self.population = [
+            {'path': paths[i], 'cost': float(costs[i]), 'metrics': metrics[i], 'trial': int(trials[i])}
+            for i in range(n)
+        ]
+        # Raporlanan değerler calculate_path_cost ile birebir aynı olsun
+        if self.global_best_path:
+            self.global_best_cost, self.global_best_metrics = self._evaluate(self.global_best_path, weights)
@@ -0,0 +1,39 @@
+import random
+import time
+
+from algorithms.parallel import worker_manager
+from algorithms.ga import GeneticOptimizer
+from algorithms.ql import QLearningOptimizer
+from algorithms.abc_alg import ABCOptimizer
+from algorithms.sa import SAOptimizer
+
+# Toplu testte kullanılan algoritmalar (GUI'deki kısaltmalarla)
+BATCH_OPTIMIZERS = {
+    "GA": GeneticOptimizer,
+    "RL": QLearningOptimizer,
+    "ABC": ABCOptimizer,
+    "SA": SAOptimizer,
+}
+
+def task_seed(scenario_idx, algo_name, repetition, base_seed=0):
+    """(senaryo, algoritma, tekrar) için kararlı tohum; süreç havuzunda işçilerin aynı rastgele diziyi üretmesini önler."""
+    algo_idx = list(BATCH_OPTIMIZERS).index(algo_name)
+    return base_seed + 1000003 * scenario_idx + 7919 * algo_idx + repetition
+
+def solve_task(task, manager=None):
+    """
+    İşçi süreçte (veya manager verilirse aynı süreçte) tek bir toplu test çözümü çalıştırır.
+
+    Args:
+        task (tuple): (anahtar, algoritma, src, dst, bw, ağırlıklar, tohum). Anahtar sonuçla
+            birlikte geri döner (tamamlanma sırası görev sırasından farklı olabilir).
+
+    Returns:
+        tuple: (anahtar, yol_bulundu_mu, maliyet, süre_ms)
+    """
+    key, algo_name, src, dst, bw, weights, seed = task
+    random.seed(seed)
+    optimizer = BATCH_OPTIMIZERS[algo_name](manager or worker_manager(), src, dst, bw)
+    start = time.perf_counter()
+    path, cost, _ = optimizer.solve(weights)
+    return key, bool(path), float(cost), (time.perf_counter() - start) * 1000
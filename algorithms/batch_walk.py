@@ -0,0 +1,137 @@
+import random
+import numpy as np
+
+def batch_random_walks(ga, src, dst, n_walkers, max_len, dist=None,
+                       greedy_prob=0.7, best_prob=0.8, bw_pref=None, rng=None,
+                       budget_dist=None, stats=None, qos=None):
+    """
+    Toplu Rastgele Yürüyüş (Batch Random Walk) ile yol üretimi.
+
+    n_walkers adet yürüyücü, dizi komşuluğu (GraphArrays) üzerinde aynı anda ilerletilir.
+    Her yürüyücünün ziyaret edilenleri (K, n) boyutlu bir bitmap'te tutulur (döngü engeli).
+
+    Seçim politikası (GA'nın _generate_random_path politikası ile aynı):
+        - greedy_prob (%70) ihtimalle adaylar hedefe hop mesafesine göre sıralanır;
+          best_prob (%80) ihtimalle en yakın, aksi halde ikinci en yakın aday seçilir.
+        - Aksi halde (%30) adaylar arasından düzgün rastgele seçim yapılır.
+    bw_pref verilirse, kapasitesi bw_pref'in altında olan kenarlar sadece başka aday
+    kalmadığında kullanılır (ABC'nin gevşek BW filtresi).
+
+    Args:
+        ga (GraphArrays): Grafın dizi temsili.
+        src, dst (int): Kaynak / hedef düğüm ID.
+        n_walkers (int): Aynı anda ilerletilecek yürüyücü sayısı.
+        max_len (int): Yoldaki maksimum düğüm sayısı (sekme sınırı).
+        dist (np.ndarray, optional): Düğüm indeksine göre hedefe hop mesafesi (ulaşılamaz: inf).
+            None ise (veya greedy_prob=0) sadece rastgele seçim yapılır.
+        rng (np.random.Generator, optional): Rastgele sayı üreteci.
+        budget_dist (np.ndarray, optional): Hedefe hop mesafesi. Verilirse, hedefe kalan sekme
+            bütçesi içinde ulaşamayacak komşular seçilmeden önce elenir (hop bütçesi budaması);
+            böylece yürüyüşler sınırı aşıp sonradan atılmaz.
+        stats (dict, optional): 'attempts', 'failures', 'pruned', 'qos_pruned' sayaçları buraya eklenir.
+        qos (QoSConstraints, optional): Sert gecikme/güvenilirlik kısıtları. Her yürüyücünün birikmiş
+            değeri tutulur; birikmiş + adım + hedefe kalan alt sınır kısıtı aşan komşular elenir.
+
+    Returns:
+        list: Sadece hedefe ulaşan (tamamlanmış) yollar, düğüm ID listeleri olarak.
+    """
+    if src not in ga.index or dst not in ga.index or n_walkers <= 0 or max_len < 2:
+        return []
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    src_i, dst_i = ga.index[src], ga.index[dst]
+    if src_i == dst_i:
+        return []
+    use_greedy = dist is not None and greedy_prob > 0
+
+    K = n_walkers
+    cur = np.full(K, src_i, dtype=np.int64)
+    visited = np.zeros((K, ga.n), dtype=bool)
+    visited[:, src_i] = True
+    paths = np.full((K, max_len), -1, dtype=np.int64)
+    paths[:, 0] = src_i
+    plen = np.ones(K, dtype=np.int64)
+    active = np.ones(K, dtype=bool)
+    pruned = 0
+    qos_pruned = 0
+    qos_terms = qos.walk_terms() if qos is not None and qos.active else []
+    qos_acc = [np.full(K, v) for v in qos.start(src)] if qos_terms else []
+
+    for _ in range(max_len - 1):
+        a = np.nonzero(active)[0]
+        if a.size == 0:
+            break
+        s = cur[a]
+        m = a.size
+        rows = np.arange(m)
+
+        nb = np.where(ga.valid[s], ga.nbr[s], 0)
+        cand = ga.valid[s] & ~visited[a[:, None], nb]
+        if budget_dist is not None:
+            # Komşuya geçince yol plen+1 düğüm olur; kalan mesafe max_len'i aşmamalı
+            remaining = max_len - plen[a] - 1
+            reachable = cand & (budget_dist[nb] <= remaining[:, None])
+            pruned += int(cand.sum() - reachable.sum())
+            cand = reachable
+        for (step, h, limit), acc in zip(qos_terms, qos_acc):
+            # Sert kısıt: birikmiş + adım + hedefe kalan alt sınır limiti aşmamalı
+            ok = cand & (acc[a][:, None] + step[s] + h[nb] <= limit)
+            qos_pruned += int(cand.sum() - ok.sum())
+            cand = ok
+        if bw_pref is not None:
+            pref = cand & (ga.edge_bw[s] >= bw_pref)
+            cand = np.where(pref.any(axis=1)[:, None], pref, cand)
+
+        # Çıkmaz sokak: gidecek aday kalmayan yürüyücüler başarısız olur
+        stuck = ~cand.any(axis=1)
+        if stuck.any():
+            active[a[stuck]] = False
+            keep = ~stuck
+            a, s, nb, cand = a[keep], s[keep], nb[keep], cand[keep]
+            m = a.size
+            rows = np.arange(m)
+            if m == 0:
+                break
+
+        # Keşif: adaylar arasından düzgün rastgele seçim
+        slot = np.argmax(cand * rng.random(cand.shape), axis=1)
+
+        if use_greedy:
+            # Sezgisel: hedefe en yakın (veya ikinci en yakın) aday; eşitlikte komşu sırası korunur
+            d = np.where(cand, dist[nb], np.inf)
+            best = np.argmin(d, axis=1)
+            d[rows, best] = np.inf
+            second = np.argmin(d, axis=1)
+            has_two = cand.sum(axis=1) >= 2
+            greedy_slot = np.where((rng.random(m) < best_prob) | ~has_two, best, second)
+            slot = np.where(rng.random(m) < greedy_prob, greedy_slot, slot)
+
+        nxt = nb[rows, slot]
+        for (step, _, _), acc in zip(qos_terms, qos_acc):
+            acc[a] += step[s, slot]
+        cur[a] = nxt
+        visited[a, nxt] = True
+        paths[a, plen[a]] = nxt
+        plen[a] += 1
+
+        # Hedefe ulaşanlar tamamlanır, yürüyüşten çıkar
+        active[a[nxt == dst_i]] = False
+
+    done = np.nonzero(cur == dst_i)[0]
+    if stats is not None:
+        stats['attempts'] = stats.get('attempts', 0) + K
+        stats['failures'] = stats.get('failures', 0) + K - done.size
+        stats['pruned'] = stats.get('pruned', 0) + pruned
+        if qos_terms:
+            stats['qos_pruned'] = stats.get('qos_pruned', 0) + qos_pruned
+    return [ga.to_nodes(paths[k, :plen[k]]) for k in done]
+
+def hop_distance_array(ga, dist_map):
+    """{düğüm: hop mesafesi} sözlüğünü düğüm indeksine göre diziye çevirir (eksikler: inf)."""
+    dist = np.full(ga.n, np.inf)
+    for node, d in dist_map.items():
+        i = ga.index.get(node)
+        if i is not None:
+            dist[i] = d
+    return dist
@@ -0,0 +1,237 @@
+import heapq
+import numpy as np
+
+# Opsiyonel: SciPy varsa ters Dijkstra seyrek (sparse) graf üzerinde C koduyla çalışır
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as sparse_dijkstra
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+class CostBounds:
+    """
+    Ağırlıklı amaç fonksiyonu için kabul edilebilir (admissible) alt sınırlar.
+
+    calculate_path_cost toplamsal terimlere ayrıştırılır. Bir u -> v adımının maliyeti:
+
+        c(u, v) = w_d * (kenar_gecikmesi + işlem_gecikmesi[v])
+                + w_r * (kenar_-log_r + düğüm_-log_r[v])
+                + w_res * 1000 / bw(u, v)
+
+    Böylece src -> ... -> dst yolunun (cezasız) maliyeti:
+
+        w_r * düğüm_-log_r[src] + Σ c(u, v) - w_d * işlem_gecikmesi[dst]
+
+    olur (kaynak ve hedefin işlem gecikmesi sayılmaz). Tüm terimler negatif olmadığı için,
+    hedefe ters Dijkstra ile bulunan en küçük c toplamı, herhangi bir tamamlamanın maliyetinden
+    büyük olamaz: h(v) <= v'den dst'ye gerçek en iyi maliyet. Basit yol, sekme sınırı ve BW
+    cezası gevşetildiği için sınır iyimserdir.
+
+    Kenar maliyetleri ağırlık profiline, h dizileri ayrıca (hedef, min_bw) ikilisine bağlıdır
+    ve önbelleklenir. NetworkManager.get_cost_bounds üzerinden kullanılır.
+    """
+
+    def __init__(self, ga, weights):
+        self.ga = ga
+        w_d, w_r, w_res = weights
+        nb = np.where(ga.valid, ga.nbr, 0)
+        with np.errstate(divide='ignore'):
+            step = (w_d * (ga.edge_delay + ga.node_delay[nb])
+                    + w_r * (ga.edge_rel_log + ga.node_rel_log[nb])
+                    + w_res * 1000.0 / ga.edge_bw)
+        self.edge_cost = np.where(ga.valid, step, np.inf)   # (n, max_deg) adım maliyetleri
+        self.src_cost = w_r * ga.node_rel_log               # Kaynak düğümün güvenilirlik terimi
+        self.dst_credit = w_d * ga.node_delay               # Hedefin işlem gecikmesi sayılmaz
+        self.entry_cost = w_d * ga.node_delay + w_r * ga.node_rel_log # Bir düğüme girişin düğüm terimleri
+        self._h = {}
+        self._cum = {}          # tuple(yol) -> kümülatif önek maliyetleri (splice_bound için)
+        self._step = None       # {u: {v: c}} (skaler hesaplar için, bkz. step_costs)
+
+    def cost_to_go(self, dst_i, min_bw=0):
+        """
+        Her düğümden dst_i'ye kalan maliyetin alt sınırını (indeks dizisi) döndürür.
+        min_bw > 0 ise sadece kapasitesi yeterli kenarlar kullanılır (BW-uygun tamamlamalar
+        için daha sıkı sınır). Ulaşılamayan düğümler: inf.
+        """
+        key = (dst_i, min_bw)
+        if key not in self._h:
+            if SCIPY_AVAILABLE:
+                dist = sparse_dijkstra(self._reverse_matrix(min_bw), indices=dst_i)
+            else:
+                dist = self._reverse_dijkstra(dst_i, min_bw)
+            # Hedefin işlem gecikmesi adım maliyetlerinde sayıldı; burada geri düşülür
+            # (h[dst] = -dst_credit: dst'de biten önek için önek maliyeti + h = tam yol maliyeti)
+            self._h[key] = dist - self.dst_credit[dst_i]
+        return self._h[key]
+
+    def _edge_list(self, min_bw):
+        """(u, v, c) kenar dizileri; min_bw > 0 ise kapasitesi yetersiz kenarlar hariç."""
+        ga = self.ga
+        keep = ga.valid & (ga.edge_bw >= min_bw) if min_bw > 0 else ga.valid
+        rows, slots = np.nonzero(keep)
+        return rows, ga.nbr[rows, slots], self.edge_cost[rows, slots]
+
+    def _reverse_matrix(self, min_bw):
+        """Ters graf (v -> u ağırlığı c(u, v)) CSR matrisi; min_bw başına bir kez kurulur."""
+        key = ('csr', min_bw)
+        if key not in self._h:
+            u, v, c = self._edge_list(min_bw)
+            self._h[key] = csr_matrix((c, (v, u)), shape=(self.ga.n, self.ga.n))
+        return self._h[key]
+
+    def _reverse_dijkstra(self, dst_i, min_bw):
+        """SciPy yoksa: ters kenar listeleri üzerinde heapq ile Dijkstra."""
+        key = ('rev', min_bw)
+        if key not in self._h:
+            preds = [[] for _ in range(self.ga.n)]
+            u, v, c = self._edge_list(min_bw)
+            for a, b, w in zip(u.tolist(), v.tolist(), c.tolist()):
+                preds[b].append((a, w))
+            self._h[key] = preds
+        preds = self._h[key]
+
+        dist = [float('inf')] * self.ga.n
+        dist[dst_i] = 0.0
+        heap = [(0.0, dst_i)]
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            for a, w in preds[x]:
+                nd = d + w
+                if nd < dist[a]:
+                    dist[a] = nd
+                    heapq.heappush(heap, (nd, a))
+        return np.array(dist)
+
+    def step_costs(self):
+        """{u: {v: c(u, v)}} sözlüğü (skaler sınır hesapları için; ilk çağrıda kurulur)."""
+        if self._step is None:
+            ga = self.ga
+            self._step = {
+                ga.nodes[i]: dict(zip(ga.to_nodes(ga.nbr[i, :ga.deg[i]]), self.edge_cost[i, :ga.deg[i]].tolist()))
+                for i in range(ga.n)
+            }
+        return self._step
+
+    def prefix_costs(self, path):
+        """
+        Yolun her önekinin maliyeti (kümülatif liste): out[k] = kaynak terimi + ilk k adımın maliyeti.
+        Kenarı olmayan adımdan itibaren inf. Aynı yol için tekrar tekrar sınır hesaplanacağından
+        küçük bir önbellekte tutulur.
+        """
+        key = tuple(path)
+        cum = self._cum.get(key)
+        if cum is None:
+            step = self.step_costs()
+            total = float(self.src_cost[self.ga.index[path[0]]])
+            cum = [total]
+            for u, v in zip(path, path[1:]):
+                total += step[u].get(v, float('inf'))
+                cum.append(total)
+            if len(self._cum) >= 4096:
+                self._cum.clear()
+            self._cum[key] = cum
+        return cum
+
+    def path_bound(self, prefix, dst, min_bw=0):
+        """
+        src'den başlayan bir önek (düğüm ID listesi) ile başlayan herhangi bir tam yolun
+        maliyetinin alt sınırı: önek maliyeti + h(önekin son düğümü).
+        Önek zaten dst'de bitiyorsa yolun kendi (cezasız) maliyetidir.
+        """
+        ga = self.ga
+        if not prefix or dst not in ga.index or any(n not in ga.index for n in prefix):
+            return float('inf')
+        h = self.cost_to_go(ga.index[dst], min_bw)
+        return self.prefix_costs(prefix)[-1] + float(h[ga.index[prefix[-1]]])
+
+    def splice_bound(self, path, idx_a, idx_b, dst):
+        """
+        path[:idx_a+1] + (yeni a -> b segmenti) + path[idx_b+1:] biçimindeki her adayın maliyeti
+        için alt sınır. Segmentin ara düğümleri bilinmediğinden en ucuz hâli (doğrudan b'ye
+        giriş) varsayılır; ayrıca önek + h(a) sınırı ile karşılaştırılıp büyüğü alınır.
+        """
+        ga = self.ga
+        cum = self.prefix_costs(path)
+        dst_i = ga.index[dst]
+        head = cum[idx_a]
+        tail = cum[-1] - cum[idx_b]            # b'den sonraki adımlar (b -> ... -> dst)
+        via_b = head + self.entry_cost[ga.index[path[idx_b]]] + tail - self.dst_credit[dst_i]
+        via_a = head + self.cost_to_go(dst_i)[ga.index[path[idx_a]]]
+        return max(via_b, via_a)
+
+    def swap_bound(self, path, idx, new_node, dst):
+        """
+        path[idx] düğümünün new_node ile değiştirilmesiyle oluşan tam yolun (cezasız) maliyeti.
+        Sadece değişen iki adım yeniden hesaplanır (artımlı); kenar yoksa inf.
+        """
+        step = self.step_costs()
+        cum = self.prefix_costs(path)
+        inf = float('inf')
+        new_steps = step[path[idx - 1]].get(new_node, inf) + step[new_node].get(path[idx + 1], inf)
+        old_steps = cum[idx + 1] - cum[idx - 1]
+        return cum[-1] - old_steps + new_steps - self.dst_credit[self.ga.index[dst]]
+
+
+class QoSConstraints:
+    """
+    Sert QoS kısıtları (gecikme bütçesi, güvenilirlik tabanı) için budama yardımcısı.
+
+    Gecikme ve -log güvenilirlik de toplamsal olduğundan, tek terimli ağırlık profilleri
+    (1, 0, 0) ve (0, 1, 0) için CostBounds hedefe kalan en küçük gecikmeyi / -log güvenilirliği
+    verir. Kısmi bir yol (önek), birikmiş değer + kalan alt sınır kısıtı aşıyorsa hiçbir
+    tamamlaması uygun olamayacağından aranmadan elenir.
+    """
+
+    def __init__(self, manager, dst, max_delay=None, min_reliability=None):
+        self.max_delay = max_delay
+        self.min_reliability = min_reliability
+        self.rel_limit = manager.reliability_log_limit(min_reliability)
+        ga = manager.get_graph_arrays()
+        self.ga = ga
+        self.dst = dst
+        self.dst_i = ga.index.get(dst)
+
+        # (CostBounds, limit, h) üçlüleri: gecikme ve güvenilirlik için
+        self.terms = []
+        if self.dst_i is not None and max_delay is not None:
+            b = manager.get_cost_bounds((1.0, 0.0, 0.0))
+            self.terms.append((b, max_delay + 1e-9, b.cost_to_go(self.dst_i)))
+        if self.dst_i is not None and np.isfinite(self.rel_limit):
+            b = manager.get_cost_bounds((0.0, 1.0, 0.0))
+            self.terms.append((b, self.rel_limit + 1e-12, b.cost_to_go(self.dst_i)))
+
+    @property
+    def active(self):
+        return bool(self.terms)
+
+    def start(self, src):
+        """Yürüyüş başında birikmiş değerler (gecikme, -log güvenilirlik sırasıyla)."""
+        i = self.ga.index[src]
+        return [float(b.src_cost[i]) for b, _, _ in self.terms]
+
+    def step_ok(self, acc, u, v):
+        """u -> v adımından sonra (acc birikmişken) kısıtlar hâlâ sağlanabilir mi?"""
+        vi = self.ga.index[v]
+        for (b, limit, h), a in zip(self.terms, acc):
+            if a + b.step_costs()[u].get(v, float('inf')) + h[vi] > limit:
+                return False
+        return True
+
+    def advance(self, acc, u, v):
+        """u -> v adımından sonraki birikmiş değerler."""
+        return [a + b.step_costs()[u][v] for (b, _, _), a in zip(self.terms, acc)]
+
+    def prefix_ok(self, prefix):
+        """Önekin (tam yol da olabilir) uygun bir tamamlaması var olabilir mi?"""
+        return all(b.path_bound(prefix, self.dst) <= limit for b, limit, _ in self.terms)
+
+    def splice_ok(self, path, idx_a, idx_b):
+        """path'in a..b segmenti yeniden üretildiğinde uygun bir aday çıkabilir mi?"""
+        return all(b.splice_bound(path, idx_a, idx_b, self.dst) <= limit for b, limit, _ in self.terms)
+
+    def walk_terms(self):
+        """Toplu yürüyüş için (adım maliyeti matrisi, kalan alt sınır dizisi, limit) listesi."""
+        return [(b.edge_cost, h, limit) for b, limit, h in self.terms]
@@ -0,0 +1,179 @@
+import heapq
+import numpy as np
+
+from algorithms.solution_archive import valid_seeds
+
+class ExactOptimizer:
+    """
+    QoS Odaklı Rotalama için Kesin (Exact) Çözüm: A* Araması.
+
+    Sezgisel fonksiyon olarak NetworkManager.get_cost_bounds ile hesaplanan, hedefe kalan
+    ağırlıklı maliyetin kabul edilebilir (admissible) ve tutarlı alt sınırı kullanılır;
+    böylece bulunan ilk hedef etiketi en iyi çözümdür. Metasezgisellerin (GA, ABC, SA, RL)
+    sonuçlarını karşılaştırmak için referans (optimum) değer üretir.
+
+    Kısıtlar:
+        - Bant genişliği: Arama sadece kapasitesi talebi karşılayan kenarlar üzerinde yapılır.
+          Böyle bir yol yoksa tüm graf üzerinde aranır (sonuç cezalı maliyetle döner).
+        - Sekme sınırı: Etiketler (düğüm, sekme sayısı) ikilisidir; maliyeti ve sekmesi
+          daha kötü olan (baskın olunan) etiketler elenir.
+        - Sert QoS kısıtları (max_delay, min_reliability): Kaynak Kısıtlı En Kısa Yol (RCSP).
+          Etiketler birikmiş gecikme ve -log güvenilirliği de taşır; baskınlık tüm kaynaklar
+          üzerinden kontrol edilir. Birikmiş + hedefe kalan alt sınır limiti aşan etiketler
+          hiç üretilmez. Uygun yol yoksa kısıtsız aramaya düşülür (sonuç cezalı maliyetle döner).
+        - Genişletme bütçesi (max_expansions) her arama denemesi için ayrı sayılır. Bütçe biterse
+          uygun yol olmadığı kanıtlanmadığından kısıtlar gevşetilmez; sonuç boş yol ve
+          metrics['budget_exhausted'] = True olur. progress (ProgressReporter) üzerinden gelen
+          durdurma isteği / süre sınırı da aynı şekilde (bütçe tükenmesi olarak) raporlanır.
+    """
+
+    def __init__(self, manager, src, dst, bw_demand, max_delay=None, min_reliability=None):
+        self.manager = manager
+        self.src = src
+        self.dst = dst
+        self.bw_demand = bw_demand
+        self.max_delay = max_delay
+        self.min_reliability = min_reliability
+        self._qos = manager.get_qos_constraints(dst, max_delay, min_reliability, src)
+
+        # --- A* Parametreleri ---
+        self.max_hop_limit = 20         # Yoldaki maksimum düğüm sayısı (GA ile aynı)
+        self.max_expansions = 200000    # Arama denemesi başına genişletme bütçesi (aşılırsa deneme sonuçsuz biter)
+
+        self.expanded = 0               # Son solve() çağrısında (tüm denemelerde) genişletilen etiket sayısı
+        self.budget_exhausted = False   # Son aramada genişletme bütçesi (veya süre) bitti mi?
+        self.progress = None            # ProgressReporter: verilirse durdurma isteği / süre sınırı kontrol edilir
+        self.stop_check_interval = 1024 # Kaç genişletmede bir durdurma kontrolü yapılır
+        self.qos_pruned = 0             # Son aramada kısıt alt sınırıyla üretilmeyen etiket sayısı
+
+    def _search(self, bounds, min_bw, qos=None, upper=None):
+        """
+        (düğüm, sekme[, gecikme, -log güvenilirlik]) etiketleri üzerinde A*; en iyi yolu
+        indeks listesi olarak döndürür. qos verilirse kaynak kısıtlı (RCSP) arama yapılır.
+        upper verilirse (bilinen uygun bir yolun maliyeti), f değeri bunu aşan etiketler üretilmez.
+        Yol bulunamazsa None döner; bunun nedeni bütçenin bitmesiyse budget_exhausted True olur.
+        """
+        self.budget_exhausted = False
+        ga = self.manager.get_graph_arrays()
+        s, t = ga.index[self.src], ga.index[self.dst]
+        h = bounds.cost_to_go(t, min_bw)
+        if not np.isfinite(h[s]):
+            return None
+
+        cost = bounds.edge_cost
+        if min_bw > 0:
+            cost = np.where(ga.edge_bw >= min_bw, cost, np.inf)
+
+        # Kaynaklar: (adım matrisi, hedefe kalan alt sınır, limit) üçlüleri
+        terms = qos.walk_terms() if qos is not None else []
+        res0 = tuple(qos.start(self.src)) if terms else ()
+
+        labels = [(s, -1, 1, res0)]                # (düğüm, ebeveyn etiket, yoldaki düğüm sayısı, kaynaklar)
+        frontier = {s: [(bounds.src_cost[s], 1, res0)]} # Düğüm başına baskın olunmayan (g, sekme, kaynaklar)
+        g0 = float(bounds.src_cost[s])
+        heap = [(g0 + h[s], g0, 0)]
+        expanded = 0
+
+        while heap:
+            f, g, lid = heapq.heappop(heap)
+            node, _, length, res = labels[lid]
+            if node == t:
+                path = []
+                while lid != -1:
+                    path.append(labels[lid][0])
+                    lid = labels[lid][1]
+                return path[::-1]
+
+            expanded += 1
+            self.expanded += 1
+            if expanded > self.max_expansions:
+                self.budget_exhausted = True
+                break
+            if self.progress is not None and expanded % self.stop_check_interval == 0 \
+                    and self.progress.should_stop():
+                self.budget_exhausted = True
+                break
+            if length >= self.max_hop_limit:
+                continue
+
+            deg = ga.deg[node]
+            row = ga.nbr[node, :deg]
+            step = cost[node, :deg]
+            ok = np.isfinite(step) & np.isfinite(h[row])
+            # Kaynak budaması: birikmiş + adım + hedefe kalan alt sınır limiti aşamaz
+            res_steps = []
+            for (r_step, r_h, limit), acc in zip(terms, res):
+                r = r_step[node, :deg]
+                feasible = ok & (acc + r + r_h[row] <= limit)
+                self.qos_pruned += int(ok.sum() - feasible.sum())
+                ok = feasible
+                res_steps.append(r)
+            res_steps = [r[ok].tolist() for r in res_steps]
+
+            for j, (v, c) in enumerate(zip(row[ok].tolist(), step[ok].tolist())):
+                ng = g + c
+                if upper is not None and ng + h[v] > upper:
+                    continue  # Bilinen çözümden daha iyi olamaz
+                nres = tuple(acc + r[j] for acc, r in zip(res, res_steps))
+                kept = frontier.setdefault(v, [])
+                if any(og <= ng and ol <= length + 1 and all(a <= b for a, b in zip(ores, nres))
+                       for og, ol, ores in kept):
+                    continue  # Her bakımdan (maliyet, sekme, kaynaklar) daha iyi bir etiket zaten var
+                kept[:] = [(og, ol, ores) for og, ol, ores in kept
+                           if not (ng <= og and length + 1 <= ol and all(b <= a for a, b in zip(ores, nres)))]
+                kept.append((ng, length + 1, nres))
+                labels.append((v, lid, length + 1, nres))
+                heapq.heappush(heap, (ng + h[v], ng, len(labels) - 1))
+        return None
+
+    def solve(self, weights, initial_solutions=None):
+        """
+        A* ile en iyi yolu bulur.
+
+        Returns:
+            tuple: (path, cost, metrics) - metrics ayrıca 'expanded' (genişletilen etiket),
+                   'lower_bound' (kaynaktaki alt sınır), 'budget_exhausted' ve kısıt verildiyse
+                   'qos_pruned' içerir. Bütçe biterse ([], 0.0, {'budget_exhausted': True, ...}) döner:
+                   bu "yol yok" değil, "sonuç bilinmiyor" demektir.
+
+        initial_solutions verilirse, tüm kısıtları sağlayan en ucuz tohumun maliyeti üst sınır
+        olarak kullanılır (sonuç değişmez, daha az etiket üretilir).
+        """
+        ga = self.manager.get_graph_arrays()
+        if self.src not in ga.index or self.dst not in ga.index or self.src == self.dst:
+            return [], 0.0, {}
+
+        bounds = self.manager.get_cost_bounds(weights)
+        self.expanded = 0
+        self.qos_pruned = 0
+        upper = None
+        for p in valid_seeds(self.manager, initial_solutions, self.src, self.dst, self.max_hop_limit):
+            cost, metrics = self.manager.calculate_path_cost(p, weights, self.bw_demand,
+                                                             self.max_delay, self.min_reliability)
+            if metrics.get('is_feasible') and (upper is None or cost < upper):
+                upper = cost
+        if upper is not None:
+            upper += 1e-9
+        # Önce tüm kısıtlarla; uygun yol yoksa sırasıyla BW, sonra QoS kısıtı gevşetilir
+        attempts = [(min_bw, qos)
+                    for qos in ((self._qos, None) if self._qos else (None,))
+                    for min_bw in ((self.bw_demand, 0) if self.bw_demand > 0 else (0,))]
+        for n, (min_bw, qos) in enumerate(attempts):
+            # Üst sınır sadece ilk (tüm kısıtlı) denemede geçerlidir
+            idx_path = self._search(bounds, min_bw, qos, upper if n == 0 else None)
+            if idx_path:
+                path = ga.to_nodes(idx_path)
+                cost, metrics = self.manager.calculate_path_cost(path, weights, self.bw_demand,
+                                                                 self.max_delay, self.min_reliability)
+                s = ga.index[self.src]
+                lower = float(bounds.src_cost[s] + bounds.cost_to_go(ga.index[self.dst], min_bw)[s])
+                metrics = dict(metrics, expanded=self.expanded, lower_bound=round(lower, 4),
+                               budget_exhausted=False)
+                if self._qos:
+                    metrics['qos_pruned'] = self.qos_pruned
+                return path, cost, metrics
+            if self.budget_exhausted:
+                # Bu denemede uygun yol olmadığı kanıtlanmadı: gevşetilmiş kısıtlarla devam etmek
+                # optimum yerine cezalı bir yol döndürürdü
+                return [], 0.0, {'budget_exhausted': True, 'expanded': self.expanded}
+        return [], 0.0, {}
@@ -1,18 +1,34 @@
 import random
 import copy
+import time
+import numpy as np
 import networkx as nx
 
+from algorithms.batch_walk import batch_random_walks, hop_distance_array
+from algorithms.parallel import make_pool, resolve_processes, worker_manager
+from algorithms.pareto import ParetoFront, non_dominated_sort, crowding_distance
+from algorithms.exact import ExactOptimizer
+from algorithms.solution_archive import valid_seeds
+
 class GeneticOptimizer:
     """
     QoS Odaklı Rotalama için Genetik Algoritma (GA) Sınıfı.
     Bu sınıf, bir kaynak (src) ve hedef (dst) arasındaki en iyi yolu bulmak için evrimsel bir süreç işletir.
     """
-    def __init__(self, manager, src, dst, bw_demand):
+    def __init__(self, manager, src, dst, bw_demand, max_delay=None, min_reliability=None, archive=None):
         # --- Temel Ayarlar ---
         self.manager = manager      # Ağ topolojisini ve maliyet hesaplamalarını yapan yönetici
         self.src = src              # Başlangıç düğümü (Kaynak)
         self.dst = dst              # Bitiş düğümü (Hedef)
         self.bw_demand = bw_demand  # Talep edilen bant genişliği (Constraint)
+        self.max_delay = max_delay              # Sert gecikme bütçesi (ms), None: kısıt yok
+        self.min_reliability = min_reliability  # Sert güvenilirlik tabanı (0-1), None: kısıt yok
+        # Kısmi yolları kısıt alt sınırlarıyla budayan yardımcı (kısıt yoksa None)
+        self._qos = manager.get_qos_constraints(dst, max_delay, min_reliability, src)
+        self.qos_rejections = 0     # Kısıtı ihlal ettiği için yeniden üretilen çocuk sayısı
+        self.archive = archive      # SolutionArchive: verilirse tohumlar buradan alınır, sonuç geri yazılır
+        self.n_seeds = 0            # Son çözümde popülasyona konan sıcak başlangıç tohumu sayısı
+        self.warm_stagnation_limit = 6 # Sıcak başlangıçta erken durdurma sınırı (None: stagnation_limit)
         
         # --- GA Hiper-Parametreleri ---
         self.pop_size = 40          # Popülasyon Büyüklüğü: Her nesilde kaç farklı yol (birey) yaşayacak?
@@ -23,6 +39,22 @@ class GeneticOptimizer:
         self.tournament_size = 3    # Turnuva Seçimi: Ebeveyn seçilirken kaç aday rastgele karşılaştırılacak?
         self.max_hop_limit = 20     # Yol Uzunluğu Sınırı: Bir yol en fazla 20 düğümden oluşabilir.
         self.stagnation_limit = 12  # Erken Durdurma: Eğer 12 nesil boyunca iyileşme olmazsa dur.
+        self.time_limit = None      # Zaman Bütçesi (saniye): None ise sadece nesil sayısı/durgunluk belirler.
+        self.progress = None        # ProgressReporter: verilirse solve() nesil başına ilerleme bildirir, durdurulabilir
+        self.hop_pruning = True     # Hop Bütçesi Budaması: hedefe kalan sekme içinde ulaşamayan komşuları baştan ele
+        self.use_bounds = True      # Alt Sınır Budaması: mevcut neslin en kötüsünü geçemeyecek çocukları ele
+        self.bound_retries = 3      # Üst üste en fazla kaç çocuk alt sınırla reddedilebilir (sonra kabul edilir)
+        self._bounds = None         # Ağırlık profiline ait CostBounds (solve içinde atanır)
+        self.bound_rejections = 0   # Alt sınır ile erken reddedilen çocuk sayısı
+
+        # --- Çok Amaçlı Mod (NSGA-II) Parametreleri - sadece solve_pareto() kullanır ---
+        self.pareto_anchors = True  # Başlangıca tek amaçlı (sadece gecikme / güvenilirlik / kaynak) kesin çözümleri ekle
+
+        # --- Ada Modeli (Island Model) Parametreleri - sadece solve_islands() kullanır ---
+        self.n_islands = 4                # Alt popülasyon (ada) sayısı; her ada pop_size bireylidir
+        self.migration_interval = 5       # Kaç nesilde bir göç yapılacak (M)
+        self.n_migrants = 2               # Her göçte halka (ring) üzerinde komşu adaya giden en iyi birey sayısı
+        self.island_stagnation_epochs = 3 # Küresel durgunluk: bu kadar göç turunda hiçbir ada iyileşmezse dur
 
         # --- GÜVENLİ OPTİMİZASYON (Akıllı Başlangıç) ---
         # 250 düğümlük büyük bir ağda tamamen rastgele gezinmek zordur.
@@ -30,20 +62,27 @@ class GeneticOptimizer:
         # Bu 'dist_map', algoritmanın körlemesine değil, hedefe doğru yönelmesini sağlar (Heuristic Bias).
         self.dist_map = {}
         try:
-            # NetworkX ile tüm düğümlerden hedefe olan en kısa mesafeyi hesapla
-            self.dist_map = dict(nx.single_source_shortest_path_length(self.manager.G, self.dst))
+            # Tüm düğümlerden hedefe olan en kısa mesafe (yönetici tarafından hedef başına önbelleklenir)
+            self.dist_map = self.manager.hop_distances_to(self.dst)
         except:
             self.dist_map = {} # Eğer graf parçalıysa veya hata olursa boş bırak
 
+        # Yol üretim istatistikleri (deneme / başarısız deneme / budanan hamle), metriklerde raporlanır
+        self.walk_stats = {'attempts': 0, 'failures': 0, 'pruned': 0, 'qos_pruned': 0}
+
     def _generate_random_path(self, max_attempts=50):
         """
         Rastgele (ama akıllı) bir başlangıç yolu (Birey/Kromozom) üretir.
         Random Walk algoritmasını kullanır ancak hedefe yönelimli (Biased) seçim yapar.
         """
+        prune = self.hop_pruning and bool(self.dist_map)
+        qos = self._qos
         for _ in range(max_attempts): # Başarılı bir yol bulana kadar 50 kere dene
+            self.walk_stats['attempts'] += 1
             path = [self.src]         # Yola kaynaktan başla
             curr = self.src           # Şu anki konum
             visited = {self.src}      # Ziyaret edilenler (Döngüye girmemek için)
+            acc = qos.start(self.src) if qos else None # Birikmiş gecikme / -log güvenilirlik
 
             while curr != self.dst:   # Hedefe varana kadar ilerle
                 try:
@@ -55,6 +94,19 @@ class GeneticOptimizer:
                 # Ziyaret edilmemiş komşuları filtrele (Cycle Prevention)
                 candidates = [n for n in neighbors if n not in visited]
 
+                # Hop bütçesi: komşudan hedefe kalan mesafe, sınırı aşacaksa o komşu hiç seçilmez
+                if prune:
+                    budget = self.max_hop_limit - len(path) - 1
+                    feasible = [n for n in candidates if self.dist_map.get(n, float('inf')) <= budget]
+                    self.walk_stats['pruned'] += len(candidates) - len(feasible)
+                    candidates = feasible
+
+                # Sert QoS kısıtı: hiçbir tamamlaması bütçeye sığmayacak komşular seçilmez
+                if qos:
+                    feasible = [n for n in candidates if qos.step_ok(acc, curr, n)]
+                    self.walk_stats['qos_pruned'] += len(candidates) - len(feasible)
+                    candidates = feasible
+
                 if not candidates: break # Gidecek yer yoksa döngüyü kır
 
                 # --- AKILLI SEÇİM (HEURISTIC) ---
@@ -73,6 +125,7 @@ class GeneticOptimizer:
                     next_node = random.choice(candidates)
 
                 # Yolu güncelle
+                if qos: acc = qos.advance(acc, curr, next_node)
                 path.append(next_node)
                 visited.add(next_node)
                 curr = next_node
@@ -82,6 +135,7 @@ class GeneticOptimizer:
 
             # Döngü bittiğinde hedefe ulaştıysak yolu döndür
             if curr == self.dst: return path
+            self.walk_stats['failures'] += 1
         
         return None # Hiç yol bulunamazsa None dön
 
@@ -91,7 +145,8 @@ class GeneticOptimizer:
         Düşük Maliyet = Yüksek Fitness (Uygunluk) demektir.
         """
         # NetworkManager'dan normalize edilmiş maliyeti al
-        total_cost, metrics = self.manager.calculate_path_cost(path, weights, self.bw_demand)
+        total_cost, metrics = self.manager.calculate_path_cost(path, weights, self.bw_demand,
+                                                               self.max_delay, self.min_reliability)
         
         penalty = 0
         path_min_bw = metrics.get('min_bw', 0)
@@ -174,22 +229,138 @@ class GeneticOptimizer:
             
         return new_path
 
-    def solve(self, weights):
+    def _init_population(self, seeds=None):
         """
-        Genetik Algoritma Ana Döngüsü.
+        Başlangıç popülasyonunu oluşturur.
+        Sıcak başlangıç tohumları (seeds) varsa önce onlar (en fazla popülasyonun yarısı) eklenir.
+        Kalan yollar toplu rastgele yürüyüş (batch_random_walks) ile çok sayıda yürüyücü aynı
+        anda ilerletilerek üretilir; seçim politikası _generate_random_path ile aynıdır
+        (%70 hedefe yönelimli, %30 rastgele). Popülasyon dolana veya yürüyüş bütçesi
+        bitene kadar devam edilir.
         """
-        population = []
-        attempts = 0
-        
-        # 1. ADIM: Başlangıç Popülasyonunu Oluştur
-        # Belirlenen popülasyon büyüklüğüne (40) ulaşana kadar rastgele yollar üret
-        while len(population) < self.pop_size and attempts < self.pop_size * 20:
-            p = self._generate_random_path()
-            if p: 
+        ga = self.manager.get_graph_arrays()
+        dist = hop_distance_array(ga, self.dist_map) if self.dist_map else None
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        # Çeşitlilik için popülasyonun en az yarısı yine rastgele yürüyüşlerden gelir
+        population = list(seeds or [])[:max(1, self.pop_size // 2)]
+        seen = set(map(tuple, population))
+        walks = 0
+        batch = self.pop_size * 2
+        qos = self._qos
+        while len(population) < self.pop_size and walks < self.pop_size * 100:
+            if self.progress is not None and self.progress.should_stop():
+                break # Süre sınırı / durdurma: eldeki bireylerle devam
+            if qos is not None and not population and walks >= self.pop_size * 50:
+                qos = None # Kısıta uygun yol üretilemiyor: kalan bütçe kısıtsız (cezalı) yollara
+            for p in batch_random_walks(ga, self.src, self.dst, batch, self.max_hop_limit, dist=dist, rng=rng,
+                                        budget_dist=dist if self.hop_pruning else None,
+                                        stats=self.walk_stats, qos=qos):
                 # Aynı yolu tekrar ekleme (Unique Population)
-                if not any(p == existing for existing in population):
+                key = tuple(p)
+                if key not in seen:
+                    seen.add(key)
                     population.append(p)
-            attempts += 1
+                    if len(population) >= self.pop_size:
+                        break
+            walks += batch
+        return population
+
+    def _evaluate_population(self, population, weights):
+        """Her bireyin uygunluğunu (fitness) hesaplar ve en iyiden kötüye sıralar."""
+        pop_data = []
+        for ind in population:
+            fit, met = self._calculate_fitness(ind, weights)
+            pop_data.append({'path': ind, 'fitness': fit, 'metrics': met})
+        pop_data.sort(key=lambda x: x['fitness'])
+        return pop_data
+
+    def _next_generation(self, pop_data):
+        """Sıralı popülasyondan elitizm, çaprazlama ve mutasyon ile yeni nesli üretir."""
+        # A. Elitizm: En iyi 2 bireyi doğrudan yeni nesle taşı
+        new_population = [d['path'] for d in pop_data[:self.elitism_count]]
+        
+        # Alt sınır eşiği: maliyet alt sınırı neslin en kötü uygunluğuna ulaşan çocuk, değerlendirilmeden
+        # reddedilir (uygunluk = maliyet + ceza + gürültü >= alt sınır)
+        worst = pop_data[-1]['fitness'] if (self._bounds is not None and pop_data) else None
+        rejected_in_row = 0
+
+        # B. Yeni Bireyler Üret (Çaprazlama ve Mutasyon)
+        while len(new_population) < self.pop_size:
+            
+            # EĞER YETERLİ POPÜLASYON YOKSA (Kritik Kontrol)
+            if len(pop_data) < 2:
+                # Yeterli ebeveyn yoksa rastgele yeni yol üretip ekle
+                p = self._generate_random_path()
+                if p: new_population.append(p)
+                else: 
+                    # Rastgele de bulamazsan eldekini mutasyona uğrat
+                    new_population.append(self._mutate(pop_data[0]['path']))
+                continue
+
+            # Turnuva Seçimi: Rastgele 5 birey al, en iyilerini seç
+            sample_size = min(len(pop_data), 5)
+            if sample_size < 2: sample_size = 2
+            
+            try:
+                # Rastgele adaylar seç
+                parents = random.sample(pop_data, sample_size)
+                # Adayları kendi içinde yarıştır (en düşük maliyetli kazanır)
+                parents.sort(key=lambda x: x['fitness'])
+                
+                # En iyi iki ebeveyni çiftleştir
+                child = self._crossover(parents[0]['path'], parents[1]['path'])
+                # Çocuğu mutasyona uğrat
+                child = self._mutate(child)
+
+                # Sert QoS kısıtı: ihlal eden çocuk değerlendirilmeden yeniden üretilir (sınırlı deneme)
+                if self._qos and rejected_in_row < self.bound_retries and not self._qos.prefix_ok(child):
+                    self.qos_rejections += 1
+                    rejected_in_row += 1
+                    continue
+
+                # Erken Ret: çocuk en iyi ihtimalle bile neslin en kötüsü kadar kötüyse yeniden üret
+                if worst is not None and rejected_in_row < self.bound_retries and \
+                        self._bounds.path_bound(child, self.dst) >= worst:
+                    self.bound_rejections += 1
+                    rejected_in_row += 1
+                    continue
+                rejected_in_row = 0
+                
+                # Yeni nüfusa ekle
+                new_population.append(child)
+            except ValueError:
+                # Hata durumunda (örneğin liste boşsa) yedek plan
+                new_population.append(self._mutate(pop_data[0]['path']))
+        
+        return new_population
+
+    def _warm_seeds(self, weights, initial_solutions):
+        """Verilen veya arşivden alınan başlangıç yollarından geçerli olanları döndürür."""
+        if initial_solutions is None and self.archive is not None:
+            initial_solutions = self.archive.seeds(self.src, self.dst, self.bw_demand, weights,
+                                                   self.max_delay, self.min_reliability)
+        return valid_seeds(self.manager, initial_solutions, self.src, self.dst, self.max_hop_limit)
+
+    def solve(self, weights, initial_solutions=None):
+        """
+        Genetik Algoritma Ana Döngüsü.
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            initial_solutions (list, optional): Sıcak başlangıç yolları (ör. önceki ağırlık
+                profilinin sonuçları); başlangıç popülasyonuna eklenir. None ise ve archive
+                verildiyse tohumlar arşivden alınır.
+        """
+        # Alt sınırlar (çocukların erken reddi için)
+        self._bounds = self.manager.get_cost_bounds(weights) if self.use_bounds else None
+        self.bound_rejections = 0
+        self.qos_rejections = 0
+
+        # 1. ADIM: Başlangıç Popülasyonunu Oluştur
+        seeds = self._warm_seeds(weights, initial_solutions)
+        self.n_seeds = len(seeds)
+        population = self._init_population(seeds)
             
         # Eğer hiç yol bulunamazsa boş dön
         if not population: return [], 0.0, {}
@@ -198,18 +369,16 @@ class GeneticOptimizer:
         global_best_fitness = float('inf')
         global_best_metrics = {}
         stagnation_counter = 0 # İyileşme olmayan nesil sayacı
+        start_time = time.perf_counter()
+        # Tohumlarla başlandıysa iyi bölge zaten bulunmuştur; durgunluk daha erken kabul edilir
+        stagnation_limit = self.stagnation_limit
+        if seeds and self.warm_stagnation_limit is not None:
+            stagnation_limit = self.warm_stagnation_limit
 
         # 2. ADIM: Nesiller Boyunca Evrim (Main Loop)
         for generation in range(self.max_generations):
-            pop_data = []
-            
-            # Her bireyin uygunluğunu (fitness) hesapla
-            for ind in population:
-                fit, met = self._calculate_fitness(ind, weights)
-                pop_data.append({'path': ind, 'fitness': fit, 'metrics': met})
-            
             # Bireyleri maliyetlerine göre sırala (En iyi en üstte)
-            pop_data.sort(key=lambda x: x['fitness'])
+            pop_data = self._evaluate_population(population, weights)
             current_best = pop_data[0]
             
             # Global en iyiyi güncelle
@@ -222,50 +391,243 @@ class GeneticOptimizer:
                 stagnation_counter += 1 # İyileşme yok
 
             # Erken Durdurma: Uzun süre gelişme olmazsa döngüyü bitir
-            if stagnation_counter >= self.stagnation_limit:
+            if stagnation_counter >= stagnation_limit:
+                break
+
+            # Zaman Bütçesi: Süre sınırı verildiyse aşıldığında dur
+            if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+                break
+
+            # İlerleme bildirimi; kullanıcı durdurduysa eldeki en iyiyle bitir
+            if self.progress is not None and self.progress.report(generation + 1, global_best_fitness, global_best_path):
                 break
             
             # --- YENİ NESİL OLUŞTURMA ---
-            
-            # A. Elitizm: En iyi 2 bireyi doğrudan yeni nesle taşı
-            new_population = [d['path'] for d in pop_data[:self.elitism_count]]
-            
-            # B. Yeni Bireyler Üret (Çaprazlama ve Mutasyon)
-            while len(new_population) < self.pop_size:
-                
-                # EĞER YETERLİ POPÜLASYON YOKSA (Kritik Kontrol)
-                if len(pop_data) < 2:
-                    # Yeterli ebeveyn yoksa rastgele yeni yol üretip ekle
-                    p = self._generate_random_path()
-                    if p: new_population.append(p)
-                    else: 
-                        # Rastgele de bulamazsan eldekini mutasyona uğrat
-                        new_population.append(self._mutate(pop_data[0]['path']))
-                    continue
+            population = self._next_generation(pop_data)
 
-                # Turnuva Seçimi: Rastgele 5 birey al, en iyilerini seç
-                sample_size = min(len(pop_data), 5)
-                if sample_size < 2: sample_size = 2
-                
-                try:
-                    # Rastgele adaylar seç
-                    parents = random.sample(pop_data, sample_size)
-                    # Adayları kendi içinde yarıştır (en düşük maliyetli kazanır)
-                    parents.sort(key=lambda x: x['fitness'])
-                    
-                    # En iyi iki ebeveyni çiftleştir
-                    child = self._crossover(parents[0]['path'], parents[1]['path'])
-                    # Çocuğu mutasyona uğrat
-                    child = self._mutate(child)
-                    
-                    # Yeni nüfusa ekle
-                    new_population.append(child)
-                except ValueError:
-                    # Hata durumunda (örneğin liste boşsa) yedek plan
-                    new_population.append(self._mutate(pop_data[0]['path']))
-            
-            # Popülasyonu güncelle
-            population = new_population
+        if self.archive is not None and global_best_path:
+            self.archive.add(self.src, self.dst, self.bw_demand, global_best_path,
+                             self.max_delay, self.min_reliability)
+        if self.progress is not None:
+            self.progress.finish(global_best_fitness, global_best_path)
 
         # En iyi sonucu döndür
-        return global_best_path, global_best_fitness, global_best_metrics
\ No newline at end of file
+        global_best_metrics = dict(global_best_metrics, walk_stats=dict(self.walk_stats),
+                                   bound_rejections=self.bound_rejections,
+                                   qos_rejections=self.qos_rejections, warm_seeds=self.n_seeds)
+        return global_best_path, global_best_fitness, global_best_metrics
+
+
+    def _pareto_evaluate(self, paths):
+        """
+        Yolların amaç vektörlerini (gecikme, -log güvenilirlik, kaynak maliyeti), ihlal sayılarını
+        ve uygunluklarını toplu hesaplar. Sekme sınırını aşmak da bir ihlal sayılır.
+        """
+        ga = self.manager.get_graph_arrays()
+        _, parts = ga.evaluate_paths(paths, (0.0, 0.0, 0.0), self.bw_demand, self.max_delay, self.min_reliability)
+        objs = np.column_stack((parts['delay'], parts['rel_log'], parts['res_cost']))
+        too_long = np.array([len(p) > self.max_hop_limit for p in paths])
+        violations = np.where(parts['valid'], parts['violations'] + too_long, np.inf)
+        return objs, violations
+
+    @staticmethod
+    def _crowded_tournament(ranks, crowd):
+        """İkili turnuva: düşük rank kazanır, eşitlikte kalabalık mesafesi büyük olan (seyrek bölge)."""
+        i, j = random.randrange(len(ranks)), random.randrange(len(ranks))
+        if ranks[i] != ranks[j]:
+            return i if ranks[i] < ranks[j] else j
+        return i if crowd[i] >= crowd[j] else j
+
+    def solve_pareto(self):
+        """
+        Çok Amaçlı Mod (NSGA-II): (gecikme, -log güvenilirlik, kaynak maliyeti) için baskın
+        olunmayan yolları tek çalıştırmada bulur. Ağırlık profili kullanılmaz; her profil daha
+        sonra ParetoFront.best_for(weights) ile arşivden cevaplanır.
+
+        - Ebeveynler (rank, kalabalık mesafesi) ikili turnuvasıyla seçilir; çaprazlama ve
+          mutasyon tek amaçlı GA ile aynıdır.
+        - Ebeveyn + çocuk havuzu kısıt-baskınlığıyla sıralanır (uygun yollar önce) ve en iyi
+          pop_size birey cephe/kalabalık sırasıyla sonraki nesle geçer.
+        - Her neslin ilk cephesi dış arşive (ParetoFront) eklenir; stagnation_limit nesil
+          boyunca arşiv değişmezse arama durur.
+
+        Returns:
+            ParetoFront: Baskın olunmayan yollar arşivi (yol yoksa boş).
+        """
+        front = ParetoFront(self.manager, self.bw_demand, self.max_delay, self.min_reliability)
+        population = self._init_population()
+        if self.pareto_anchors:
+            exact = ExactOptimizer(self.manager, self.src, self.dst, self.bw_demand, self.max_delay, self.min_reliability)
+            exact.max_hop_limit = self.max_hop_limit
+            for w in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)):
+                path, _, _ = exact.solve(w)
+                if path and path not in population:
+                    population.append(path)
+        if not population:
+            return front
+
+        def archive(paths, objs, violations, ranks):
+            changed = False
+            for i in np.nonzero(ranks == 0)[0]:
+                if np.isfinite(violations[i]):
+                    changed |= front.add(paths[i], objs[i], violations[i] == 0)
+            return changed
+
+        objs, violations = self._pareto_evaluate(population)
+        ranks = non_dominated_sort(objs, violations)
+        crowd = crowding_distance(objs, ranks)
+        archive(population, objs, violations, ranks)
+
+        stagnation_counter = 0
+        start_time = time.perf_counter()
+        for generation in range(self.max_generations):
+            # Çocuklar: aynı yol iki kez havuza girmez (cephe çeşitliliği)
+            seen = set(map(tuple, population))
+            offspring = []
+            tries = 0
+            while len(offspring) < self.pop_size and tries < self.pop_size * 5:
+                tries += 1
+                p1 = population[self._crowded_tournament(ranks, crowd)]
+                p2 = population[self._crowded_tournament(ranks, crowd)]
+                child = self._mutate(self._crossover(p1, p2))
+                if tuple(child) in seen:
+                    continue
+                if self._qos and not self._qos.prefix_ok(child):
+                    self.qos_rejections += 1
+                    continue
+                seen.add(tuple(child))
+                offspring.append(child)
+
+            combined = population + offspring
+            objs, violations = self._pareto_evaluate(combined)
+            ranks = non_dominated_sort(objs, violations)
+            crowd = crowding_distance(objs, ranks)
+            changed = archive(combined, objs, violations, ranks)
+
+            # Elitist seçim: önce cephe sırası, cephe içinde seyrek bölgedekiler
+            keep = np.lexsort((-crowd, ranks))[:self.pop_size]
+            population = [combined[i] for i in keep]
+            ranks, crowd = ranks[keep], crowd[keep]
+
+            stagnation_counter = 0 if changed else stagnation_counter + 1
+            if stagnation_counter >= self.stagnation_limit:
+                break
+            if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+                break
+        return front
+
+    def _evolve_epoch(self, population, weights, generations):
+        """
+        Bir adayı (alt popülasyonu) göçler arası süre boyunca evrimleştirir.
+        Çocukların alt sınırla erken reddi solve() ile aynı şekilde uygulanır.
+        Returns:
+            (sıralı popülasyon yolları, en iyi yol, en iyi fitness, en iyi metrikler)
+        """
+        self._bounds = self.manager.get_cost_bounds(weights) if self.use_bounds else None
+        best_path, best_fitness, best_metrics = None, float('inf'), {}
+        pop_data = self._evaluate_population(population, weights)
+        for _ in range(generations):
+            population = self._next_generation(pop_data)
+            pop_data = self._evaluate_population(population, weights)
+            if pop_data[0]['fitness'] < best_fitness:
+                best_path = pop_data[0]['path']
+                best_fitness = pop_data[0]['fitness']
+                best_metrics = pop_data[0]['metrics']
+        if pop_data and pop_data[0]['fitness'] < best_fitness:
+            best_path, best_fitness, best_metrics = pop_data[0]['path'], pop_data[0]['fitness'], pop_data[0]['metrics']
+        return [d['path'] for d in pop_data], best_path, best_fitness, best_metrics
+
+    def solve_islands(self, weights, processes=None):
+        """
+        Ada Modeli (Island Model) Paralel GA.
+
+        - n_islands adet alt popülasyon, her biri kendi tohumu (seed) ile ayrı bir
+          işçi süreçte (process) migration_interval nesil boyunca evrimleşir.
+        - Her göç turunda her adanın en iyi n_migrants bireyi halkadaki (ring) bir
+          sonraki adaya gönderilir ve oradaki en kötü bireylerin yerini alır.
+        - Küresel Durgunluk: island_stagnation_epochs tur boyunca hiçbir adada küresel
+          en iyi iyileşmezse, nesil bütçesi bitmeden arama sonlandırılır.
+        - time_limit verilmişse göç turu sınırlarında zaman bütçesi kontrol edilir.
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            processes (int, optional): İşçi süreç sayısı. None: min(ada, CPU);
+                0/1: adalar aynı süreçte sırayla çalıştırılır.
+
+        Returns:
+            best_path, best_cost, metrics
+        """
+        n_islands = max(1, self.n_islands)
+        interval = max(1, self.migration_interval)
+        n_epochs = max(1, -(-self.max_generations // interval))
+        params = {k: getattr(self, k) for k in _ISLAND_PARAMS}
+        base_seed = random.getrandbits(32)
+
+        processes = resolve_processes(processes, n_islands)
+        pool = make_pool(self.manager, processes) if processes > 1 else None
+
+        populations = [None] * n_islands
+        global_best_path, global_best_fitness, global_best_metrics = None, float('inf'), {}
+        stagnant_epochs = 0
+        start_time = time.perf_counter()
+        try:
+            for epoch in range(n_epochs):
+                tasks = [
+                    (self.src, self.dst, self.bw_demand, params, populations[i], weights, interval,
+                     base_seed + 7919 * i + epoch)
+                    for i in range(n_islands)
+                ]
+                if pool is not None:
+                    results = list(pool.map(_island_epoch, tasks))
+                else:
+                    results = [_island_epoch(t, self.manager) for t in tasks]
+
+                improved = False
+                for i, (pop, b_path, b_fit, b_met) in enumerate(results):
+                    populations[i] = pop
+                    if b_path is not None and b_fit < global_best_fitness:
+                        global_best_path, global_best_fitness, global_best_metrics = b_path, b_fit, b_met
+                        improved = True
+                stagnant_epochs = 0 if improved else stagnant_epochs + 1
+
+                if not any(populations):
+                    return [], 0.0, {}
+                if stagnant_epochs >= self.island_stagnation_epochs:
+                    break
+                if self.time_limit is not None and time.perf_counter() - start_time >= self.time_limit:
+                    break
+
+                # Halka Göçü (Ring Migration): ada i'nin en iyileri -> ada (i+1)'in en kötülerinin yerine
+                migrants = [pop[:self.n_migrants] for pop in populations]
+                for i in range(n_islands):
+                    target = populations[(i + 1) % n_islands]
+                    incoming = [m for m in migrants[i] if m not in target]
+                    if incoming:
+                        target[-len(incoming):] = incoming
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if global_best_path is None:
+            return [], 0.0, {}
+        return global_best_path, global_best_fitness, global_best_metrics
+
+
+# Ada modunda işçilere aktarılan hiper-parametreler
+_ISLAND_PARAMS = (
+    'pop_size', 'max_generations', 'mutation_rate', 'crossover_rate',
+    'elitism_count', 'tournament_size', 'max_hop_limit', 'max_delay', 'min_reliability', 'use_bounds',
+)
+
+def _island_epoch(task, manager=None):
+    """İşçi süreçte tek bir adanın bir göç turunu çalıştırır."""
+    src, dst, bw_demand, params, population, weights, generations, seed = task
+    random.seed(seed)
+    optimizer = GeneticOptimizer(manager or worker_manager(), src, dst, bw_demand,
+                                 params.get('max_delay'), params.get('min_reliability'))
+    optimizer.__dict__.update(params)
+    if population is None:
+        population = optimizer._init_population()
+        if not population:
+            return [], None, float('inf'), {}
+    return optimizer._evolve_epoch(population, weights, generations)
@@ -0,0 +1,171 @@
+import math
+import numpy as np
+
+class GraphArrays:
+    """
+    NetworkManager grafının dizi (NumPy array) tabanlı temsili.
+
+    Vektörleştirilmiş algoritmalar (toplu epizot, toplu yol üretimi vb.) düğüm ID'leri
+    yerine 0..n-1 indeksleriyle çalışır. Komşuluk, sabit genişlikte doldurulmuş
+    (padded) bir matris olarak tutulur:
+
+        nbr[i, k]  -> i. düğümün k. komşusunun indeksi (geçersiz slotlar -1)
+        valid[i, k] -> k < deg[i]
+
+    Kenar özellikleri (bw, gecikme, -log güvenilirlik) aynı (i, k) slot düzeninde,
+    düğüm özellikleri ise düğüm indeksiyle saklanır. Varsayılan değerler
+    NetworkManager.calculate_path_cost ile birebir aynıdır.
+    """
+
+    def __init__(self, G):
+        self.nodes = list(G.nodes())
+        self.index = {n: i for i, n in enumerate(self.nodes)}
+        self.n = len(self.nodes)
+
+        self.deg = np.array([G.out_degree(u) for u in self.nodes], dtype=np.int64)
+        self.max_deg = max(int(self.deg.max()) if self.n else 0, 1)
+
+        self.nbr = np.full((self.n, self.max_deg), -1, dtype=np.int64)
+        self.edge_bw = np.full((self.n, self.max_deg), np.inf)
+        self.edge_delay = np.zeros((self.n, self.max_deg))
+        self.edge_rel_log = np.zeros((self.n, self.max_deg))
+
+        for i, u in enumerate(self.nodes):
+            for k, (v, d) in enumerate(G[u].items()):
+                self.nbr[i, k] = self.index[v]
+                self.edge_bw[i, k] = d.get('bandwidth', 0.1)
+                self.edge_delay[i, k] = d.get('delay', 0)
+                self.edge_rel_log[i, k] = self._rel_log(d.get('reliability', 1.0))
+
+        self.valid = np.arange(self.max_deg)[None, :] < self.deg[:, None]
+
+        self.node_delay = np.array([G.nodes[u].get('processing_delay', 0) or 0 for u in self.nodes], dtype=float)
+        self.node_rel_log = np.array([self._rel_log(G.nodes[u].get('reliability', 1.0)) for u in self.nodes])
+
+        self._reverse = None
+
+        # Sıralı kenar anahtarları (u * n + v) -> düz (flat) slot indeksi; toplu kenar araması için
+        rows, slots = np.nonzero(self.valid)
+        keys = rows * self.n + self.nbr[rows, slots]
+        order = np.argsort(keys)
+        self.edge_keys = keys[order]
+        self.edge_flat = (rows * self.max_deg + slots)[order]
+
+    @staticmethod
+    def _rel_log(r):
+        """calculate_path_cost ile aynı kural: r > 0 ise -log(r), değilse 100."""
+        if r is not None and r > 0:
+            return -math.log(r)
+        return 100.0
+
+    def reverse_adjacency(self):
+        """
+        Ters (gelen kenar) komşuluğunu (rnbr, rvalid) olarak döndürür; ilk çağrıda kurulur.
+        rnbr[j, k] -> j düğümüne kenarı olan k. düğümün indeksi (geçersiz slotlar -1).
+        """
+        if self._reverse is None:
+            preds = [[] for _ in range(self.n)]
+            for i in range(self.n):
+                for j in self.nbr[i, :self.deg[i]].tolist():
+                    preds[j].append(i)
+            rdeg = np.array([len(p) for p in preds], dtype=np.int64)
+            width = max(int(rdeg.max()) if self.n else 0, 1)
+            rnbr = np.full((self.n, width), -1, dtype=np.int64)
+            for j, p in enumerate(preds):
+                rnbr[j, :len(p)] = p
+            rvalid = np.arange(width)[None, :] < rdeg[:, None]
+            self._reverse = (rnbr, rvalid)
+        return self._reverse
+
+    def edge_lookup(self, u, v):
+        """
+        u -> v kenarlarının düz slot indekslerini döndürür (dizi girdiler, sıralı anahtar + searchsorted).
+        Kenar yoksa -1.
+        """
+        keys = np.asarray(u, dtype=np.int64) * self.n + np.asarray(v, dtype=np.int64)
+        if self.edge_keys.size == 0:
+            return np.full(keys.shape, -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.edge_keys, keys), self.edge_keys.size - 1)
+        return np.where(self.edge_keys[pos] == keys, self.edge_flat[pos], -1)
+
+    def evaluate_paths(self, paths, weights, requested_bw=0, max_delay=None, min_reliability=None):
+        """
+        Yol listesini tek seferde değerlendirir (calculate_path_cost'un toplu karşılığı).
+
+        Args:
+            paths (list): Düğüm ID listeleri.
+            weights (list): [w_delay, w_reliability, w_resource].
+            requested_bw (float): Talep edilen bant genişliği (altında kalan yollara 1e6 ceza).
+            max_delay, min_reliability (float, optional): Sert gecikme bütçesi / güvenilirlik tabanı
+                (ihlal başına 1e6 ceza, calculate_path_cost ile aynı).
+
+        Returns:
+            tuple: (costs, parts) - costs (m,) dizisi (geçersiz yol: inf); parts ise
+                   'delay', 'rel_log', 'res_cost', 'min_bw', 'feasible', 'violations' (ihlal edilen
+                   kısıt sayısı), 'valid' dizileri.
+        """
+        m = len(paths)
+        lens = np.array([len(p) for p in paths], dtype=np.int64)
+        L = max(int(lens.max()) if m else 0, 2)
+        P = np.zeros((m, L), dtype=np.int64)
+        known = np.ones(m, dtype=bool)
+        for r, p in enumerate(paths):
+            try:
+                P[r, :len(p)] = [self.index[x] for x in p]
+            except KeyError:
+                known[r] = False
+        pos = np.arange(L)[None, :]
+        in_path = pos < lens[:, None]
+        inner = (pos >= 1) & (pos < lens[:, None] - 1)
+        on_edge = pos[:, :-1] < lens[:, None] - 1
+
+        flat = self.edge_lookup(P[:, :-1], P[:, 1:])
+        has_edges = ~(on_edge & (flat < 0)).any(axis=1)
+        flat = np.where(on_edge & (flat >= 0), flat, 0)
+
+        bw = np.where(on_edge, self.edge_bw.ravel()[flat], np.inf)
+        min_bw = bw.min(axis=1)
+        delay = (np.where(inner, self.node_delay[P], 0.0).sum(axis=1)
+                 + np.where(on_edge, self.edge_delay.ravel()[flat], 0.0).sum(axis=1))
+        rel_log = (np.where(in_path, self.node_rel_log[P], 0.0).sum(axis=1)
+                   + np.where(on_edge, self.edge_rel_log.ravel()[flat], 0.0).sum(axis=1))
+        res_cost = np.where(on_edge, 1000.0 / bw, 0.0).sum(axis=1)
+
+        violations = ((requested_bw > 0) & (min_bw < requested_bw)).astype(float)
+        if max_delay is not None:
+            violations += delay > max_delay + 1e-9
+        if min_reliability is not None:
+            rel_limit = -math.log(min_reliability) if min_reliability > 0 else np.inf
+            violations += rel_log > rel_limit + 1e-12
+        feasible = violations == 0
+        w_d, w_r, w_res = weights
+        costs = w_d * delay + w_r * rel_log + w_res * res_cost + 1000000 * violations
+        valid = known & has_edges & (lens >= 2)
+        costs = np.where(valid, costs, np.inf)
+        parts = {'delay': delay, 'rel_log': rel_log, 'res_cost': res_cost,
+                 'min_bw': min_bw, 'feasible': feasible, 'violations': violations, 'valid': valid}
+        return costs, parts
+
+    @staticmethod
+    def metrics_at(parts, costs, r):
+        """evaluate_paths çıktısından r. yol için calculate_path_cost ile aynı metrik sözlüğünü kurar."""
+        if not parts['valid'][r]:
+            return {}
+        return {
+            "delay": round(float(parts['delay'][r]), 2),
+            "rel_prob": round(math.exp(-float(parts['rel_log'][r])), 4),
+            "res_cost": round(float(parts['res_cost'][r]), 2),
+            "min_bw": float(parts['min_bw'][r]),
+            "total_cost": round(float(costs[r]), 4),
+            "is_feasible": bool(parts['feasible'][r])
+        }
+
+    def to_indices(self, path):
+        return [self.index[n] for n in path]
+
+    def to_nodes(self, idx_path):
+        return [self.nodes[i] for i in idx_path]
+
+    def slot_map(self, i):
+        """i. düğüm için {komşu_indeksi: slot} sözlüğü."""
+        return {int(j): k for k, j in enumerate(self.nbr[i, :self.deg[i]])}
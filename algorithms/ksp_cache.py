@@ -0,0 +1,123 @@
+import math
+from collections import OrderedDict
+import networkx as nx
+import numpy as np
+
+class KShortestPathCache:
+    """
+    (kaynak, hedef, bant genişliği kovası) bazında K-En Kısa Basit Yol önbelleği.
+
+    Yen algoritması (nx.shortest_simple_paths) her çözümde baştan çalıştırılmaz:
+    her anahtar için üretilen yollar ve üreteç (generator) saklanır, daha fazla yol
+    istendiğinde kaldığı yerden devam edilir (lazy genişletme).
+
+    Hızlandırmalar:
+        - Arama, kapasitesi kova alt sınırının altında olan kenarları içermeyen
+          budanmış graf üzerinde yapılır (budanmış graflar kova başına bir kez kurulur).
+        - Yen yolları sekme sayısına göre artan sırada ürettiği için, sekme sınırını
+          aşan ilk yolda üretim durdurulur.
+    Budanmış grafta yol yoksa (talep karşılanamıyorsa) tüm graf kullanılır.
+    """
+
+    def __init__(self, manager, bw_bucket_size=50.0, max_entries=512):
+        self.manager = manager
+        self.bw_bucket_size = bw_bucket_size
+        self.max_entries = max_entries
+        self._graphs = {}                 # kova -> budanmış nx.DiGraph
+        self._entries = OrderedDict()     # (src, dst, kova) -> {'paths', 'gen', 'done'} (LRU)
+
+    def _bucket(self, bw):
+        return int(math.floor(max(bw, 0.0) / self.bw_bucket_size))
+
+    def _pruned_graph(self, bucket):
+        """Kapasitesi kova alt sınırından (bucket * bucket_size) küçük olmayan kenarlardan oluşan graf."""
+        if bucket not in self._graphs:
+            ga = self.manager.get_graph_arrays()
+            floor = bucket * self.bw_bucket_size
+            keep = ga.valid & (ga.edge_bw >= floor)
+            if keep.sum() == ga.valid.sum():
+                # Budanacak kenar yok: grafı kopyalamadan doğrudan kullan
+                self._graphs[bucket] = self.manager.G
+                return self.manager.G
+            rows, slots = np.nonzero(keep)
+            H = nx.DiGraph()
+            H.add_nodes_from(ga.nodes)
+            H.add_edges_from(zip((ga.nodes[i] for i in rows), (ga.nodes[j] for j in ga.nbr[rows, slots])))
+            self._graphs[bucket] = H
+        return self._graphs[bucket]
+
+    def _entry(self, src, dst, bucket):
+        key = (src, dst, bucket)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = {'paths': [], 'gen': None, 'done': False}
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _extend(self, entry, src, dst, bucket, k, max_len, should_stop=None):
+        """
+        Geçerli (max_len sınırındaki) yol sayısı k olana veya üretim bitene kadar üreteci ilerletir.
+        should_stop() True dönerse erken çıkılır; üreteç saklandığı için sonraki istek kaldığı yerden devam eder.
+        """
+        paths = entry['paths']
+        if entry['gen'] is None and not entry['done']:
+            H = self._pruned_graph(bucket)
+            if src not in H or dst not in H or not nx.has_path(H, src, dst):
+                entry['done'] = True
+                return
+            entry['gen'] = nx.shortest_simple_paths(H, src, dst)
+            # Serileştirme (pickle) sonrası: önceden üretilen yolları atla
+            for _ in range(len(paths)):
+                next(entry['gen'], None)
+
+        while len(paths) < k and not entry['done']:
+            if paths and len(paths[-1]) > max_len:
+                break                        # Yollar artan uzunlukta: sınır aşıldı
+            if should_stop is not None and should_stop():
+                break
+            p = next(entry['gen'], None)
+            if p is None:
+                entry['done'] = True
+                entry['gen'] = None
+                break
+            paths.append(p)
+
+    def get(self, src, dst, bw, k, max_len, should_stop=None):
+        """
+        src -> dst için en fazla k adet, en çok max_len düğümlü en kısa basit yolu döndürür.
+
+        Args:
+            bw (float): Talep edilen bant genişliği (budama kovasını belirler).
+            k (int): İstenen yol sayısı.
+            max_len (int): Yoldaki maksimum düğüm sayısı (sekme sınırı).
+            should_stop (callable, optional): True dönerse o ana kadar üretilen yollarla dönülür
+                (ör. ProgressReporter.should_stop ile süre sınırı).
+
+        Returns:
+            list: Yol listelerinin kopyaları (sekme sayısına göre artan sırada).
+        """
+        for bucket in (self._bucket(bw), 0):
+            entry = self._entry(src, dst, bucket)
+            self._extend(entry, src, dst, bucket, k, max_len, should_stop)
+            valid = [list(p) for p in entry['paths'][:k] if len(p) <= max_len]
+            if valid or bucket == 0:
+                return valid
+        return []
+
+    def clear(self):
+        self._graphs.clear()
+        self._entries.clear()
+
+    def __getstate__(self):
+        # Üreteçler serileştirilemez; işçi süreçlere sadece üretilmiş yollar gider
+        state = self.__dict__.copy()
+        state['_graphs'] = {}
+        state['_entries'] = OrderedDict(
+            (key, {'paths': e['paths'], 'gen': None, 'done': e['done']})
+            for key, e in self._entries.items()
+        )
+        return state
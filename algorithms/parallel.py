@@ -0,0 +1,27 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Her işçi süreçte (worker process) bir kez kurulan ağ yöneticisi.
+# Görevlerle birlikte grafın tekrar tekrar serileştirilmesini (pickle) önler.
+_WORKER_MANAGER = None
+
+def _init_worker(manager):
+    global _WORKER_MANAGER
+    _WORKER_MANAGER = manager
+
+def worker_manager():
+    """İşçi süreçteki NetworkManager örneğini döndürür."""
+    return _WORKER_MANAGER
+
+def resolve_processes(processes, n_tasks):
+    """
+    İşçi sayısını belirler.
+    None -> min(görev sayısı, CPU sayısı); 0 veya 1 -> süreç havuzu kullanılmaz.
+    """
+    if processes is None:
+        processes = min(n_tasks, os.cpu_count() or 1)
+    return max(0, int(processes))
+
+def make_pool(manager, processes):
+    """Yöneticiyi her işçiye bir kez yükleyen bir süreç havuzu oluşturur."""
+    return ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(manager,))
@@ -0,0 +1,129 @@
+import numpy as np
+
+def dominates(a, b):
+    """a amaç vektörü b'yi domine eder mi? (her amaçta <= ve en az birinde <; küçük daha iyi)"""
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+def non_dominated_sort(objs, violations=None):
+    """
+    Hızlı baskın olmayan sıralama (NSGA-II). objs (m, k) dizisi; dönen rank dizisinde 0 ilk cephedir.
+
+    violations verilirse kısıt-baskınlığı uygulanır: daha az kısıt ihlal eden her zaman önde
+    gelir, eşit ihlal sayısına sahip bireyler kendi aralarında amaçlara göre sıralanır.
+    """
+    objs = np.asarray(objs, dtype=float)
+    m = objs.shape[0]
+    ranks = np.zeros(m, dtype=np.int64)
+    if m == 0:
+        return ranks
+    if violations is None:
+        violations = np.zeros(m)
+
+    offset = 0
+    for level in np.unique(violations):
+        group = np.nonzero(violations == level)[0]
+        g = objs[group]
+        # dom[i, j]: i, j'yi domine eder
+        le = (g[:, None, :] <= g[None, :, :]).all(axis=2)
+        lt = (g[:, None, :] < g[None, :, :]).any(axis=2)
+        dom = le & lt
+        dominated_by = dom.sum(axis=0)
+        remaining = np.ones(len(group), dtype=bool)
+        r = 0
+        while remaining.any():
+            front = remaining & (dominated_by == 0)
+            ranks[group[front]] = offset + r
+            remaining &= ~front
+            dominated_by -= dom[front].sum(axis=0)
+            r += 1
+        offset += r
+    return ranks
+
+def crowding_distance(objs, ranks):
+    """Her bireyin kendi cephesindeki kalabalık mesafesi (uç noktalar: inf)."""
+    objs = np.asarray(objs, dtype=float)
+    dist = np.zeros(objs.shape[0])
+    for r in np.unique(ranks):
+        idx = np.nonzero(ranks == r)[0]
+        if idx.size <= 2:
+            dist[idx] = np.inf
+            continue
+        for k in range(objs.shape[1]):
+            order = idx[np.argsort(objs[idx, k], kind='stable')]
+            span = objs[order[-1], k] - objs[order[0], k]
+            dist[order[0]] = dist[order[-1]] = np.inf
+            if span > 0:
+                dist[order[1:-1]] += (objs[order[2:], k] - objs[order[:-2], k]) / span
+    return dist
+
+
+class ParetoFront:
+    """
+    Bir talep için (gecikme, -log güvenilirlik, kaynak maliyeti) uzayında baskın olunmayan yollar arşivi.
+
+    calculate_path_cost ağırlıkların doğrusal bir toplamı olduğundan, her ağırlık profilinin
+    en iyi yolu cephe üzerindedir; best_for(weights) yeniden çözmeden arşivde arama yapar.
+    Uygun (kısıtları sağlayan) yollar ayrı tutulur; hiç uygun yol yoksa ihlal eden cephe kullanılır.
+    """
+
+    def __init__(self, manager, bw_demand=0, max_delay=None, min_reliability=None):
+        self.manager = manager
+        self.bw_demand = bw_demand
+        self.max_delay = max_delay
+        self.min_reliability = min_reliability
+        self.entries = []        # Uygun yollar: [{'path': [...], 'objectives': (d, r, c)}]
+        self.infeasible = []     # Kısıt ihlal eden baskın olunmayan yollar (sadece yedek)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def add(self, path, objectives, feasible=True):
+        """Yolu arşive ekler; başka bir yolca domine ediliyorsa eklemez. Eklendiyse True döner."""
+        archive = self.entries if feasible else self.infeasible
+        objectives = tuple(float(x) for x in objectives)
+        for e in archive:
+            if e['objectives'] == objectives or dominates(e['objectives'], objectives):
+                return False
+        archive[:] = [e for e in archive if not dominates(objectives, e['objectives'])]
+        archive.append({'path': list(path), 'objectives': objectives})
+        return True
+
+    def add_path(self, path):
+        """Yolu amaçları ve kısıtları hesaplanarak ekler (path_objectives ile)."""
+        result = self.manager.path_objectives(path)
+        if result is None:
+            return False
+        objectives, min_bw = result
+        return self.add(path, objectives, self._is_feasible(objectives, min_bw))
+
+    def _is_feasible(self, objectives, min_bw):
+        delay, rel_log, _ = objectives
+        if self.bw_demand > 0 and min_bw < self.bw_demand:
+            return False
+        if self.max_delay is not None and delay > self.max_delay + 1e-9:
+            return False
+        return rel_log <= self.manager.reliability_log_limit(self.min_reliability) + 1e-12
+
+    def objectives(self):
+        """(n, 3) amaç dizisi (uygun yollar)."""
+        return np.array([e['objectives'] for e in self.entries], dtype=float).reshape(-1, 3)
+
+    def best_for(self, weights):
+        """
+        Ağırlık profili için arşivdeki en iyi yolu döndürür (yeniden çözüm yapmadan).
+
+        Returns:
+            tuple: (path, cost, metrics) - calculate_path_cost ile aynı; arşiv boşsa ([], 0.0, {}).
+        """
+        archive = self.entries or self.infeasible
+        if not archive:
+            return [], 0.0, {}
+        w = np.asarray(weights, dtype=float)
+        objs = np.array([e['objectives'] for e in archive], dtype=float)
+        best = archive[int(np.argmin(objs @ w))]
+        cost, metrics = self.manager.calculate_path_cost(best['path'], weights, self.bw_demand,
+                                                         self.max_delay, self.min_reliability)
+        return list(best['path']), cost, dict(metrics, front_size=len(self.entries))
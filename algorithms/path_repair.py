@@ -0,0 +1,157 @@
+import random
+from collections import deque
+import numpy as np
+
+# Alt Yol Onarım / Yeniden İnşa Motoru (SA ve ABC komşu üretimi için ortak).
+# Tüm aramalar GraphArrays dizi komşuluğu üzerinde, düğüm indeksleriyle çalışır:
+#   - Yasaklı düğümler (yolun korunan kısımları) bir bitmap ile tutulur.
+#   - Ebeveyn işaretçileri (parent pointers) dizide saklanır; yollar kopyalanmaz.
+#   - Komşu sırası rastgele karıştırılır; eşit uzunluktaki yollar arasından
+#     rastgele biri döner (çeşitlilik).
+
+def _forbidden_bitmap(ga, nodes):
+    mask = np.zeros(ga.n, dtype=bool)
+    idx = [ga.index[n] for n in nodes if n in ga.index]
+    if idx:
+        mask[idx] = True
+    return mask
+
+def _trace(parent, node):
+    out = []
+    while node != -1:
+        out.append(int(node))
+        node = parent[node]
+    out.reverse()
+    return out
+
+def bounded_bfs(ga, s, t, forbidden, max_hops, max_expansions, rng):
+    """
+    Kuyruk (deque) tabanlı, derinlik ve genişletme sayısı sınırlı BFS (indeks uzayında).
+    Hedef, kuyruğa eklenirken (üretim anında) kontrol edilir.
+
+    Returns:
+        list | None: s..t indeks yolu (en az sekmeli, eşitlikte rastgele).
+    """
+    if s == t:
+        return [s]
+    seen = forbidden.copy()
+    seen[s] = True
+    if seen[t]:
+        return None
+    parent = np.full(ga.n, -1, dtype=np.int64)
+    queue = deque([(s, 0)])
+    expansions = 0
+    while queue and expansions < max_expansions:
+        u, d = queue.popleft()
+        if d >= max_hops:
+            continue
+        expansions += 1
+        row = ga.nbr[u, :ga.deg[u]]
+        cand = row[~seen[row]]
+        if cand.size == 0:
+            continue
+        if (cand == t).any():
+            parent[t] = u
+            return _trace(parent, t)
+        cand = rng.permutation(cand)
+        seen[cand] = True
+        parent[cand] = u
+        # Bütçe dışında kalacak düğümler kuyruğa hiç eklenmez (zaten genişletilemezler)
+        room = max_expansions - expansions - len(queue)
+        if room > 0:
+            queue.extend((v, d + 1) for v in cand[:room].tolist())
+    return None
+
+def _expand_level(nbr, valid, frontier, blocked, parent, cap, rng):
+    """Seviye-eşzamanlı (level-synchronous) bir BFS genişletmesi; yeni keşfedilen düğümleri döndürür."""
+    if frontier.size > cap:
+        frontier = rng.choice(frontier, size=cap, replace=False)
+    ok = valid[frontier]
+    nb = np.where(ok, nbr[frontier], 0)
+    mask = ok & ~blocked[nb]
+    cand = nb[mask]
+    parents = np.repeat(frontier, mask.sum(axis=1))
+    if cand.size == 0:
+        return cand
+    # Rastgele sıra + ilk görülen: aynı düğüme gelen ebeveynler arasında rastgele seçim
+    perm = rng.permutation(cand.size)
+    cand, parents = cand[perm], parents[perm]
+    uniq, first = np.unique(cand, return_index=True)
+    parent[uniq] = parents[first]
+    blocked[uniq] = True
+    return uniq
+
+def bidirectional_search(ga, s, t, forbidden, max_hops, max_expansions, rng):
+    """
+    Çift yönlü (bidirectional) BFS: s'den ileri, t'den geri (ters komşuluk) aynı anda
+    aranır; her adımda küçük olan sınır (frontier) genişletilir. Toplam sekme
+    max_hops ile, genişletilen düğüm sayısı max_expansions ile sınırlıdır.
+
+    Returns:
+        list | None: s..t indeks yolu (en az sekmeli, eşitlikte rastgele).
+    """
+    if s == t:
+        return [s]
+    if forbidden[s] or forbidden[t]:
+        return None
+    rnbr, rvalid = ga.reverse_adjacency()
+
+    seen_f = forbidden.copy()
+    seen_b = forbidden.copy()
+    seen_f[s] = True
+    seen_b[t] = True
+    parent_f = np.full(ga.n, -1, dtype=np.int64)
+    parent_b = np.full(ga.n, -1, dtype=np.int64)
+    front_f = np.array([s], dtype=np.int64)
+    front_b = np.array([t], dtype=np.int64)
+    hops = 0
+    budget = max_expansions
+
+    while hops < max_hops and budget > 0 and front_f.size and front_b.size:
+        forward = front_f.size <= front_b.size
+        if forward:
+            cap = min(budget, front_f.size)
+            budget -= cap
+            front_f = _expand_level(ga.nbr, ga.valid, front_f, seen_f, parent_f, cap, rng)
+            new, other_seen = front_f, seen_b
+        else:
+            cap = min(budget, front_b.size)
+            budget -= cap
+            front_b = _expand_level(rnbr, rvalid, front_b, seen_b, parent_b, cap, rng)
+            new, other_seen = front_b, seen_f
+        hops += 1
+
+        # Buluşma: yeni keşfedilen düğümlerden diğer yönün ulaştığı (yasaklı olmayan) biri
+        meet = new[other_seen[new] & ~forbidden[new]]
+        if meet.size:
+            m = int(rng.choice(meet))
+            head = _trace(parent_f, m)      # s .. m
+            tail = _trace(parent_b, m)      # t .. m (geri yönde)
+            return head + tail[::-1][1:]
+    return None
+
+def rebuild_subpath(ga, start, goal, forbidden_nodes, max_hops, max_expansions=50,
+                    rng=None, bidirectional=False):
+    """
+    start -> goal arasında, forbidden_nodes düğümlerinden geçmeyen kısa bir alt yol üretir.
+
+    Args:
+        ga (GraphArrays): Grafın dizi temsili.
+        start, goal (int): Düğüm ID'leri.
+        forbidden_nodes (iterable): Alt yolda yer alamayacak düğümler (korunan yol parçaları).
+        max_hops (int): Alt yoldaki maksimum sekme sayısı.
+        max_expansions (int): Genişletilecek maksimum düğüm sayısı (arama bütçesi).
+        bidirectional (bool): True ise çift yönlü arama kullanılır.
+
+    Returns:
+        list | None: [start, ..., goal] düğüm ID listesi.
+    """
+    if start not in ga.index or goal not in ga.index:
+        return None
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    forbidden = _forbidden_bitmap(ga, forbidden_nodes)
+    s, t = ga.index[start], ga.index[goal]
+    search = bidirectional_search if bidirectional else bounded_bfs
+    idx_path = search(ga, s, t, forbidden, max_hops, max_expansions, rng)
+    return ga.to_nodes(idx_path) if idx_path else None
@@ -0,0 +1,59 @@
+import time
+
+class ProgressReporter:
+    """
+    Optimizasyonun ara durumunu (iterasyon, en iyi maliyet, en iyi yol) dışarıya bildirir.
+
+    Algoritmalar her iterasyonda report() çağırır; geri çağırma (callback) en fazla
+    interval saniyede bir tetiklenir, böylece GUI sinyalleri çözümü yavaşlatmaz.
+    request_stop() ile istenen erken durdurma, report()'un dönüş değeriyle döngüye iletilir.
+    time_limit verilirse süre dolduğunda durdurma kendiliğinden istenir; bu kontrol, henüz yol
+    bulunmamış olsa da (ve yol üretilen başlangıç aşamalarında should_stop() ile) yapılır.
+    """
+
+    def __init__(self, callback=None, interval=0.25, time_limit=None):
+        """
+        Args:
+            callback (callable): callback(iterasyon, en_iyi_maliyet, en_iyi_yol). Başka bir
+                iş parçacığından (thread) çağrılabileceği için hızlı olmalıdır (ör. sinyal yayma).
+            interval (float): İki bildirim arasındaki en kısa süre (saniye).
+            time_limit (float, optional): Oluşturulduğu andan itibaren çözüm süresi sınırı (saniye).
+        """
+        self.callback = callback
+        self.interval = interval
+        self.time_limit = time_limit
+        self.started = time.perf_counter()
+        self.stop_requested = False
+        self.iteration = 0          # Son report() çağrısındaki iterasyon (bildirilmemiş olsa bile)
+        self._last = float('-inf')
+
+    def request_stop(self):
+        """Algoritmanın bir sonraki report() çağrısında en iyi sonucuyla durmasını ister."""
+        self.stop_requested = True
+
+    def should_stop(self):
+        """Durdurma istendiyse veya süre sınırı dolduysa True döner (bildirim yapmaz)."""
+        if not self.stop_requested and self.time_limit is not None \
+                and time.perf_counter() - self.started > self.time_limit:
+            self.stop_requested = True
+        return self.stop_requested
+
+    def report(self, iteration, best_cost, best_path, force=False):
+        """
+        İlerlemeyi bildirir. Son bildirimden bu yana interval geçmediyse (force değilse) veya
+        henüz yol bulunmadıysa geri çağırma yapılmaz.
+
+        Returns:
+            bool: Durdurma istendiyse veya süre sınırı dolduysa True (döngü kırılmalı).
+        """
+        self.iteration = iteration
+        if self.callback is not None and best_path:
+            now = time.perf_counter()
+            if force or now - self._last >= self.interval:
+                self._last = now
+                self.callback(iteration, float(best_cost), list(best_path or []))
+        return self.should_stop()
+
+    def finish(self, best_cost, best_path):
+        """Çözüm sonunda son durumu seyreltmeden bildirir (grafikteki son nokta)."""
+        self.report(self.iteration, best_cost, best_path, force=True)
@@ -0,0 +1,148 @@
+import math
+import struct
+import zlib
+from collections import OrderedDict
+
+class QTableStore:
+    """
+    Q-Learning için hedef (dst) koşullu Q-tablosu deposu.
+
+    Aynı hedefe, aynı ağırlıklarla ve benzer bant genişliği talebiyle gelen
+    taleplerde eğitim sıfırdan başlamak zorunda değildir. Depo, eğitilmiş
+    tabloları şu anahtarla saklar:
+        (dst, ağırlıklar, bant genişliği kovası, topoloji sürümü[, max_delay, min_reliability])
+
+    - Tabloyla birlikte, kaynak başına bulunmuş en iyi rota da saklanır; böylece
+      tekrar eden taleplerde sıcak başlangıç en az önceki sonuç kadar iyi olur.
+    - Bellekte LRU (en az kullanılan silinir) mantığıyla sınırlı sayıda tablo tutulur.
+    - save()/load() ile tablolar diske sıkıştırılmış ikili (binary) formatta yazılır.
+    """
+
+    MAGIC = b"QTS2"
+    _HEADER = struct.Struct("<q3dq16s2dI") # dst, w_d, w_r, w_res, bw kovası, topoloji sürümü,
+                                           # max_delay, min_reliability (NaN: kısıt yok), kayıt sayısı
+    _ENTRY = struct.Struct("<qqd")          # state, action, q_value
+    _ROUTE = struct.Struct("<qI")           # src, düğüm sayısı (ardından int64 düğüm listesi)
+
+    def __init__(self, bw_bucket_size=50.0, max_tables=256):
+        """
+        Args:
+            bw_bucket_size (float): Bant genişliği talebini kovalara ayırma aralığı (Mbps).
+            max_tables (int): Bellekte tutulacak maksimum tablo sayısı.
+        """
+        self.bw_bucket_size = bw_bucket_size
+        self.max_tables = max_tables
+        self._tables = OrderedDict()
+        self._routes = {}   # key -> {src: path}
+
+    def __len__(self):
+        return len(self._tables)
+
+    def __contains__(self, key):
+        return key in self._tables
+
+    def make_key(self, manager, dst, weights, bw_demand, max_delay=None, min_reliability=None):
+        """
+        Talep bilgilerinden depo anahtarını üretir.
+        Sert QoS kısıtları ödülü değiştirdiğinden, verildiklerinde anahtara eklenir.
+        """
+        w = tuple(round(float(x), 4) for x in weights)
+        bucket = int(bw_demand // self.bw_bucket_size) if self.bw_bucket_size > 0 else 0
+        key = (int(dst), w, bucket, manager.topology_version())
+        if max_delay is not None or min_reliability is not None:
+            key += (max_delay, min_reliability)
+        return key
+
+    def get(self, key):
+        """Kayıtlı tablonun bir kopyasını döndürür (yoksa None)."""
+        table = self._tables.get(key)
+        if table is None:
+            return None
+        self._tables.move_to_end(key)
+        return {s: dict(actions) for s, actions in table.items()}
+
+    def get_route(self, key, src):
+        """Bu tablo ile daha önce src için bulunmuş en iyi rotayı döndürür (yoksa None)."""
+        path = self._routes.get(key, {}).get(src)
+        return list(path) if path else None
+
+    def put(self, key, Q, routes=None):
+        """
+        Eğitilmiş tabloyu (kopyalayarak) depoya yazar.
+        Args:
+            routes (dict, optional): {src: path} - tabloyla birlikte saklanacak rotalar.
+        """
+        self._tables[key] = {s: dict(actions) for s, actions in Q.items() if actions}
+        self._tables.move_to_end(key)
+        if routes:
+            self._routes.setdefault(key, {}).update({s: list(p) for s, p in routes.items() if p})
+        while len(self._tables) > self.max_tables:
+            old_key, _ = self._tables.popitem(last=False)
+            self._routes.pop(old_key, None)
+
+    def clear(self):
+        self._tables.clear()
+        self._routes.clear()
+
+    def save(self, file_path):
+        """Tüm tabloları zlib ile sıkıştırılmış ikili dosyaya kaydeder."""
+        chunks = []
+        nan = float("nan")
+        for key, table in self._tables.items():
+            dst, w, bucket, version = key[:4]
+            max_delay, min_reliability = key[4:] if len(key) > 4 else (None, None)
+            entries = [(s, a, q) for s, actions in table.items() for a, q in actions.items()]
+            chunks.append(self._HEADER.pack(dst, w[0], w[1], w[2], bucket,
+                                            str(version).encode("ascii")[:16],
+                                            nan if max_delay is None else max_delay,
+                                            nan if min_reliability is None else min_reliability,
+                                            len(entries)))
+            chunks.extend(self._ENTRY.pack(s, a, q) for s, a, q in entries)
+            routes = self._routes.get(key, {})
+            chunks.append(struct.pack("<I", len(routes)))
+            for s, path in routes.items():
+                chunks.append(self._ROUTE.pack(s, len(path)))
+                chunks.append(struct.pack(f"<{len(path)}q", *path))
+        payload = struct.pack("<I", len(self._tables)) + b"".join(chunks)
+        with open(file_path, "wb") as f:
+            f.write(self.MAGIC + zlib.compress(payload, 6))
+
+    def load(self, file_path):
+        """
+        Diskten tabloları okuyup depoya ekler.
+        Returns:
+            int: Yüklenen tablo sayısı.
+        """
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        if raw[:4] != self.MAGIC:
+            raise ValueError(f"Geçersiz Q-tablosu dosyası: {file_path}")
+        payload = zlib.decompress(raw[4:])
+
+        (n_tables,) = struct.unpack_from("<I", payload, 0)
+        offset = 4
+        for _ in range(n_tables):
+            (dst, w_d, w_r, w_res, bucket, version,
+             max_delay, min_reliability, n_entries) = self._HEADER.unpack_from(payload, offset)
+            offset += self._HEADER.size
+            table = {}
+            end = offset + n_entries * self._ENTRY.size
+            for s, a, q in self._ENTRY.iter_unpack(payload[offset:end]):
+                table.setdefault(s, {})[a] = q
+            offset = end
+
+            routes = {}
+            (n_routes,) = struct.unpack_from("<I", payload, offset)
+            offset += 4
+            for _ in range(n_routes):
+                s, length = self._ROUTE.unpack_from(payload, offset)
+                offset += self._ROUTE.size
+                routes[s] = list(struct.unpack_from(f"<{length}q", payload, offset))
+                offset += 8 * length
+
+            key = (dst, (w_d, w_r, w_res), bucket, version.rstrip(b"\x00").decode("ascii"))
+            if not (math.isnan(max_delay) and math.isnan(min_reliability)):
+                key += (None if math.isnan(max_delay) else max_delay,
+                        None if math.isnan(min_reliability) else min_reliability)
+            self.put(key, table, routes)
+        return n_tables
@@ -1,7 +1,10 @@
 import random
 import math
+import numpy as np
 import networkx as nx
 
+from algorithms.solution_archive import valid_seeds
+
 class QLearningOptimizer:
     """
     QoS Odaklı Rotalama için Q-Learning (Pekiştirmeli Öğrenme) Implementasyonu.
@@ -14,7 +17,8 @@ class QLearningOptimizer:
     - Ödül Yapısı: QoS maliyet fonksiyonunun negatifi ve kısıt ihlali cezaları.
     """
 
-    def __init__(self, manager, src, dst, bw_demand):
+    def __init__(self, manager, src, dst, bw_demand, q_store=None, max_delay=None, min_reliability=None,
+                 archive=None):
         """
         Q-Learning Optimizer Başlatıcı.
         
@@ -23,11 +27,25 @@ class QLearningOptimizer:
             src (int): Kaynak düğüm ID.
             dst (int): Hedef düğüm ID.
             bw_demand (float): Talep edilen bant genişliği (Mbps).
+            q_store (QTableStore, optional): Eğitilmiş Q-tablolarının paylaşıldığı depo.
+                Verilirse aynı hedef/ağırlık için önceki tablodan sıcak başlangıç yapılır.
+            max_delay (float, optional): Sert gecikme bütçesi (ms).
+            min_reliability (float, optional): Sert güvenilirlik tabanı (0-1).
+                Durum (düğüm) birikmiş gecikmeyi içermediğinden kısıtlar budama için değil,
+                ödüldeki ihlal cezası olarak uygulanır (sıralı eğitimde calculate_path_cost,
+                toplu eğitimde aynı 1e6 cezası vektörel olarak).
+            archive (SolutionArchive, optional): Sıcak başlangıç yollarının alındığı ve bulunan
+                en iyi yolun geri yazıldığı arşiv.
         """
         self.manager = manager
         self.src = src
         self.dst = dst
         self.bw_demand = bw_demand
+        self.q_store = q_store
+        self.archive = archive
+        self.progress = None    # ProgressReporter: verilirse epizot başına ilerleme bildirilir, durdurulabilir
+        self.max_delay = max_delay
+        self.min_reliability = min_reliability
 
         # Q-Table: {state: {action: q_value}}
         self.Q = {}
@@ -42,6 +60,14 @@ class QLearningOptimizer:
         self.episodes = 800       # Toplam epizot sayısı
         self.max_hops = 20        # Maksimum adım (sonsuz döngü koruması)
 
+        # Sıcak Başlangıç (Warm Start) Ayarları - sadece q_store verildiğinde kullanılır
+        self.warm_episodes = 100  # Depoda tablo varsa çalıştırılacak epizot sayısı (None: self.episodes)
+        self.warm_epsilon = 0.2   # Öğrenilmiş tablo üzerinde daha az keşif yeterli
+        self.is_warm = False      # Son solve() çağrısı sıcak başladı mı?
+
+        # Toplu (Batched) Eğitim: >1 ise K epizot aynı anda, kilit adımda (lock-step) ilerletilir
+        self.batch_size = 1
+
         # Ceza ve Ödül Sabitleri
         self.PENALTY_CYCLE = -1000.0
         self.PENALTY_BW = -500.0
@@ -53,6 +79,35 @@ class QLearningOptimizer:
         self.best_cost = float('inf')
         self.best_metrics = {}
 
+        # Tüm kaynaklar modu (solve_routing_table) için kaynak başına en iyi rotalar
+        # {start: (cost, path, metrics)} - None ise takip edilmez
+        self.best_routes = None
+        self.table_episodes_per_source = 6  # Tablo modunda kaynak başına epizot bütçesi
+        self.table_relax_rounds = 3         # Tablo modunda mesafe-vektörü gevşetme turu sayısı
+
+    def _path_cost(self, path, weights):
+        """calculate_path_cost'u talebin BW ve sert QoS kısıtlarıyla çağırır."""
+        return self.manager.calculate_path_cost(path, weights, self.bw_demand,
+                                                self.max_delay, self.min_reliability)
+
+    def _seed_q_table(self, paths, weights):
+        """
+        Sıcak başlangıç yollarıyla Q tablosunu önyükler: her yolun kenarlarına, o yolu izleyen
+        politikanın Bellman getirisi yazılır (son adım: -2 * maliyet, geriye doğru
+        Q_i = REWARD_STEP + gamma * Q_(i+1)). Mevcut daha iyi değerler korunur.
+        Yollar ayrıca en iyi çözüm adayı olarak kaydedilir.
+        """
+        for path in paths:
+            total_cost, metrics = self._path_cost(path, weights)
+            if not metrics.get('is_feasible'):
+                continue
+            self._update_best(path, total_cost, metrics, weights)
+            value = -total_cost * 2.0
+            for u, v in reversed(list(zip(path, path[1:]))):
+                if self.Q.get(u, {}).get(v, -float('inf')) < value:
+                    self._set_q(u, v, value)
+                value = self.REWARD_STEP + self.gamma * value
+
     def _get_q(self, state, action):
         """Q tablosundan değer okur, yoksa 0.0 döndürür."""
         if state not in self.Q:
@@ -89,19 +144,62 @@ class QLearningOptimizer:
         candidates = [n for n, q in zip(valid_neighbors, q_values) if q == max_q]
         return random.choice(candidates) if candidates else random.choice(valid_neighbors)
 
-    def solve(self, weights):
+    def _extract_greedy_path(self, start):
         """
-        Q-Learning eğitim döngüsü.
-        
-        Args:
-            weights (tuple): (w_delay, w_reliability, w_resource)
-            
-        Returns:
-            best_path, best_cost, metrics
+        Öğrenilmiş Q tablosunu açgözlü (greedy) takip ederek start -> dst yolunu çıkarır.
+        Döngü veya bant genişliği ihlali olan aksiyonlar atlanır.
         """
-        # Eğitim Döngüsü
-        for episode in range(self.episodes):
-            curr_state = self.src
+        G = self.manager.G
+        path = [start]
+        visited = {start}
+        curr = start
+        while curr != self.dst and len(path) <= self.max_hops:
+            actions = self.Q.get(curr)
+            if not actions:
+                return None
+            ranked = sorted(actions.items(), key=lambda kv: kv[1], reverse=True)
+            next_node = None
+            for a, _ in ranked:
+                if a not in visited and G.has_edge(curr, a) and G[curr][a].get('bandwidth', 0) >= self.bw_demand:
+                    next_node = a
+                    break
+            if next_node is None:
+                return None
+            path.append(next_node)
+            visited.add(next_node)
+            curr = next_node
+        return path if curr == self.dst else None
+
+    def _update_best(self, path, total_cost, metrics, weights):
+        """Hedefe ulaşan bir epizodun yolunu, başladığı kaynağın en iyi sonucu ile karşılaştırır."""
+        if not metrics.get('is_feasible'):
+            return
+        start = path[0]
+        if start == self.src and total_cost < self.best_cost:
+            self.best_cost = total_cost
+            self.best_path = list(path)
+            self.best_metrics = metrics
+        if self.best_routes is not None:
+            known = self.best_routes.get(start)
+            if known is None or total_cost < known[0]:
+                self.best_routes[start] = (total_cost, list(path), metrics)
+            # Hedefe ulaşan yolun her son eki (suffix), üzerindeki ara düğümler için de geçerli bir rotadır
+            for i in range(1, len(path) - 1):
+                node = path[i]
+                suffix = path[i:]
+                s_cost, s_metrics = self._path_cost(suffix, weights)
+                known = self.best_routes.get(node)
+                if s_metrics.get('is_feasible') and (known is None or s_cost < known[0]):
+                    self.best_routes[node] = (s_cost, suffix, s_metrics)
+
+    def _train_sequential(self, weights, episodes, start_nodes=None):
+        """
+        Klasik eğitim: epizotlar tek tek, sırayla koşulur.
+        start_nodes verilirse epizotlar bu düğümlerden sırayla (round-robin) başlar.
+        """
+        start_nodes = start_nodes or [self.src]
+        for episode in range(episodes):
+            curr_state = start_nodes[episode % len(start_nodes)]
             path = [curr_state]
             visited = {curr_state}
             
@@ -141,13 +239,10 @@ class QLearningOptimizer:
                     path.append(next_node)
                     
                     # Gerçek QoS Maliyetini Hesapla
-                    total_cost, metrics = self.manager.calculate_path_cost(path, weights, self.bw_demand)
+                    total_cost, metrics = self._path_cost(path, weights)
                     
                     # En iyi yolu güncelle
-                    if metrics['is_feasible'] and total_cost < self.best_cost:
-                        self.best_cost = total_cost
-                        self.best_path = list(path)
-                        self.best_metrics = metrics
+                    self._update_best(path, total_cost, metrics, weights)
                     
                     # Ödül: Maliyet ne kadar düşükse ödül o kadar yüksek (sıfıra yakın) olmalı.
                     # Q-Learning maksimizasyon yaptığı için maliyetin negatifini ödül olarak veriyoruz.
@@ -180,7 +275,381 @@ class QLearningOptimizer:
             if self.epsilon > self.epsilon_min:
                 self.epsilon *= self.epsilon_decay
 
+            if self.progress is not None and self.progress.report(episode + 1, self.best_cost, self.best_path):
+                break
+
+    def _q_to_arrays(self, ga):
+        """Sözlük Q tablosunu (n, max_deg) boyutlu Q ve 'görüldü' dizilerine çevirir."""
+        Qa = np.zeros((ga.n, ga.max_deg))
+        seen = np.zeros((ga.n, ga.max_deg), dtype=bool)
+        for state, actions in self.Q.items():
+            if state not in ga.index or not actions:
+                continue
+            i = ga.index[state]
+            slots = ga.slot_map(i)
+            for action, q in actions.items():
+                k = slots.get(ga.index.get(action, -1))
+                if k is not None:
+                    Qa[i, k] = q
+                    seen[i, k] = True
+        return Qa, seen
+
+    def _arrays_to_q(self, ga, Qa, seen):
+        """Dizi Q tablosunu sözlük formatına (self.Q) geri yazar."""
+        self.Q = {}
+        for i, k in zip(*np.nonzero(seen)):
+            self.Q.setdefault(ga.nodes[i], {})[ga.nodes[ga.nbr[i, k]]] = float(Qa[i, k])
+
+    def _train_batched(self, weights, episodes, start_nodes=None):
+        """
+        Toplu eğitim: K = batch_size epizot kilit adımda (lock-step) ilerletilir.
+
+        Her adımda K ajan için epsilon-greedy seçim, maskelenmiş komşu dizileri
+        üzerinde vektörel yapılır; ziyaret kontrolü (K, n) boyutlu bitmap ile,
+        Bellman güncellemeleri ise tek seferde uygulanır.
+
+        Eşzamanlı güncellemelerin birleştirilmesi:
+            - Bir adımdaki tüm hedef değerler (R + gamma * max Q(s')) adım başındaki
+              tablo anlık görüntüsünden (snapshot) hesaplanır.
+            - Aynı adımda aynı (s, a) çiftine gelen hedeflerin ORTALAMASI alınır ve
+              o çift için tek bir güncelleme yapılır: Q += alpha * (ort_hedef - Q).
+        Epsilon, sıralı eğitimle aynı takvimi izlemek için her epizot başına azaltılır.
+        start_nodes verilirse epizotlar bu düğümlerden sırayla (round-robin) başlar.
+        """
+        ga = self.manager.get_graph_arrays()
+        start_nodes = [s for s in (start_nodes or [self.src]) if s in ga.index]
+        if not start_nodes or self.dst not in ga.index:
+            return
+        rng = np.random.default_rng(random.getrandbits(64))  # random.seed() ile tekrarlanabilir
+        w_d, w_r, w_res = weights
+        n, max_deg, nbr = ga.n, ga.max_deg, ga.nbr
+        dst_i = ga.index[self.dst]
+        starts = np.array(ga.to_indices(start_nodes), dtype=np.int64)
+
+        Qa, seen = self._q_to_arrays(ga)
+        Q_flat, seen_flat = Qa.reshape(-1), seen.reshape(-1)
+
+        # Adım başına maliyet bileşenleri (slot düzeninde önceden hesaplanır)
+        safe_nbr = np.where(ga.valid, nbr, 0)
+        step_delay = ga.edge_delay + np.where(safe_nbr == dst_i, 0.0, ga.node_delay[safe_nbr])
+        step_rel = ga.edge_rel_log + ga.node_rel_log[safe_nbr]
+        step_res = 1000.0 / ga.edge_bw
+        bw_ok = ga.edge_bw >= self.bw_demand
+        # Sert QoS kısıtları: hedefte ihlal başına calculate_path_cost ile aynı ceza
+        delay_limit = float('inf') if self.max_delay is None else self.max_delay + 1e-9
+        rel_limit = self.manager.reliability_log_limit(self.min_reliability) + 1e-12
+
+        done_episodes = 0
+        while done_episodes < episodes:
+            k = min(self.batch_size, episodes - done_episodes)
+            rows = np.arange(k)
+            cur = starts[np.arange(done_episodes, done_episodes + k) % len(starts)]
+            visited = np.zeros((k, n), dtype=bool)
+            visited[rows, cur] = True
+            active = np.ones(k, dtype=bool)
+            paths = np.full((k, self.max_hops + 2), -1, dtype=np.int64)
+            paths[:, 0] = cur
+            plen = np.ones(k, dtype=np.int64)
+            acc_delay = np.zeros(k)
+            acc_rel = ga.node_rel_log[cur].copy()
+            acc_res = np.zeros(k)
+
+            for _ in range(self.max_hops):
+                a = np.nonzero(active)[0]
+                # Çıkmaz sokak: güncelleme yapılmadan epizot biter (sıralı sürümle aynı)
+                dead = ga.deg[cur[a]] == 0
+                active[a[dead]] = False
+                a = a[~dead]
+                if a.size == 0:
+                    break
+                s = cur[a]
+                m = a.size
+
+                # 1. Vektörel Epsilon-Greedy (eşitlikte rastgele seçim)
+                explore = rng.random(m) < self.epsilon
+                rand_slot = (rng.random(m) * ga.deg[s]).astype(np.int64)
+                q = np.where(ga.valid[s], Qa[s], -np.inf)
+                ties = q == q.max(axis=1)[:, None]
+                greedy_slot = np.argmax(ties * rng.random((m, max_deg)), axis=1)
+                slot = np.where(explore, rand_slot, greedy_slot)
+                nxt = nbr[s, slot]
+
+                # 2. Kısıt kontrolleri ve ödüller
+                cycle = visited[a, nxt]
+                bw_bad = ~cycle & ~bw_ok[s, slot]
+                moved = ~cycle & ~bw_bad
+                reach = moved & (nxt == dst_i)
+                mid = moved & ~reach
+
+                reward = np.full(m, self.REWARD_STEP)
+                reward[cycle] = self.PENALTY_CYCLE
+                reward[bw_bad] = self.PENALTY_BW
+
+                am = a[moved]
+                acc_delay[am] += step_delay[s[moved], slot[moved]]
+                acc_rel[am] += step_rel[s[moved], slot[moved]]
+                acc_res[am] += step_res[s[moved], slot[moved]]
+                paths[am, plen[am]] = nxt[moved]
+                plen[am] += 1
+
+                if reach.any():
+                    ar = a[reach]
+                    costs = w_d * acc_delay[ar] + w_r * acc_rel[ar] + w_res * acc_res[ar]
+                    costs += 1000000 * ((acc_delay[ar] > delay_limit).astype(float) + (acc_rel[ar] > rel_limit))
+                    reward[reach] = -costs * 2.0
+                    # En iyi yol adayları: kesin metrikler için manager ile yeniden hesaplanır
+                    for j in np.argsort(costs):
+                        start = ga.nodes[paths[ar[j], 0]]
+                        if self.best_routes is not None:
+                            known = self.best_routes.get(start, (float('inf'),))[0]
+                        else:
+                            known = self.best_cost if start == self.src else float('-inf')
+                        if costs[j] >= known + 1e-9:
+                            continue
+                        path = ga.to_nodes(paths[ar[j], :plen[ar[j]]])
+                        total_cost, metrics = self._path_cost(path, weights)
+                        self._update_best(path, total_cost, metrics, weights)
+
+                # 3. Toplu Bellman güncellemesi (snapshot + ortalama ile birleştirme)
+                max_next = np.zeros(m)
+                if mid.any():
+                    nm = nxt[mid]
+                    q_next = np.where(ga.valid[nm] & seen[nm], Qa[nm], -np.inf).max(axis=1)
+                    max_next[mid] = np.where(np.isfinite(q_next), q_next, 0.0)
+                target = reward + self.gamma * max_next
+
+                flat = s * max_deg + slot
+                uniq, inv = np.unique(flat, return_inverse=True)
+                mean_target = np.bincount(inv, weights=target) / np.bincount(inv)
+                Q_flat[uniq] += self.alpha * (mean_target - Q_flat[uniq])
+                seen_flat[uniq] = True
+
+                # 4. Durum geçişi
+                cur[a[mid]] = nxt[mid]
+                visited[a[mid], nxt[mid]] = True
+                active[a[~mid]] = False
+
+            # Epsilon Decay (epizot başına)
+            for _ in range(k):
+                if self.epsilon > self.epsilon_min:
+                    self.epsilon *= self.epsilon_decay
+            done_episodes += k
+
+            if self.progress is not None and self.progress.report(done_episodes, self.best_cost, self.best_path):
+                break
+
+        self._arrays_to_q(ga, Qa, seen)
+
+    def _relax_routing_table(self, table, weights):
+        """
+        Mesafe-vektörü (distance-vector) gevşetmesi: u -> v kenarı ve v'nin rotası,
+        u'nun rotasından ucuzsa u'nun rotası [u] + rota(v) olur.
+        Maliyet toplamsal olduğu için yeni maliyet, rotayı yeniden hesaplamadan
+        kenar ve düğüm katkıları eklenerek bulunur. Sert QoS kısıtları için her kayıt
+        birikmiş gecikmeyi ve -log güvenilirliği de taşır; bütçeyi aşan aday atlanır,
+        uygun olmayan rotalar başka rotaya uzatılmaz. Metrikler sadece değişen rotalar
+        için en sonda yeniden hesaplanır; gerçek maliyeti artan değişiklik geri alınır.
+        """
+        G = self.manager.G
+        w_d, w_r, w_res = weights
+        delay_limit = float('inf') if self.max_delay is None else self.max_delay + 1e-9
+        rel_limit = self.manager.reliability_log_limit(self.min_reliability) + 1e-12
+
+        def rel_log(r):
+            return -math.log(r) if r > 0 else 100
+
+        # {düğüm: (gecikme, -log güvenilirlik, kaynak maliyeti)} - uygun olmayan rotalar için None
+        acc = {}
+        for u, route in table.items():
+            acc[u] = self.manager.path_objectives(route['path'])[0] if route['metrics'].get('is_feasible') else None
+
+        original = {}
+        for _ in range(self.table_relax_rounds):
+            improved = False
+            for u in list(table):
+                u_rel = rel_log(G.nodes[u].get('reliability', 1.0))
+                best, best_acc = table[u], acc[u]
+                for v, d in G[u].items():
+                    route_v = table.get(v)
+                    if route_v is None or acc[v] is None or u in route_v['path'] or len(route_v['path']) > self.max_hops:
+                        continue
+                    if d.get('bandwidth', 0) < self.bw_demand:
+                        continue
+                    v_delay, v_rel, v_res = acc[v]
+                    delay = v_delay + d.get('delay', 0) + G.nodes[v].get('processing_delay', 0)
+                    rel = v_rel + u_rel + rel_log(d.get('reliability', 1.0))
+                    if delay > delay_limit or rel > rel_limit:
+                        continue
+                    res = v_res + 1000.0 / d.get('bandwidth', 0.1)
+                    cost = w_d * delay + w_r * rel + w_res * res
+                    if cost < best['cost'] - 1e-9:
+                        best = {'next_hop': v, 'path': [u] + route_v['path'], 'cost': cost}
+                        best_acc = (delay, rel, res)
+                if best is not table[u]:
+                    original.setdefault(u, table[u])
+                    table[u], acc[u] = best, best_acc
+                    improved = True
+            if not improved:
+                break
+
+        for u, route in original.items():
+            cost, metrics = self._path_cost(table[u]['path'], weights)
+            if cost > route['cost'] + 1e-9:
+                table[u] = route
+                continue
+            table[u]['cost'] = cost
+            table[u]['metrics'] = metrics
+
+    def solve_routing_table(self, weights, sources=None):
+        """
+        Tüm Kaynaklar Modu: Tek bir eğitimle, dst'ye giden tam bir yönlendirme tablosu üretir.
+
+        Epizotlar verilen kaynaklara (varsayılan: dst'ye ulaşabilen tüm düğümler) yayılarak
+        başlatılır. Hedefe ulaşan her yolun son ekleri (suffix) üzerindeki ara düğümlere de
+        rota olarak yazılır. Eğitim sonunda her kaynak için; bulunan en iyi rota, öğrenilmiş
+        politikanın (greedy) rotası ve BW kısıtlı en az sekmeli yol karşılaştırılır,
+        en ucuzu seçilir. Son olarak tablo komşu rotalar üzerinden birkaç tur gevşetilir.
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            sources (list, optional): Tabloya girecek kaynak düğümler.
+
+        Returns:
+            dict: {kaynak: {'next_hop': int, 'path': list, 'cost': float, 'metrics': dict}}
+                  Ulaşılamayan kaynaklar tabloda yer almaz. Rotalar kaynak bazlıdır
+                  (her kayıt kendi tam yolunu taşır).
+        """
+        G = self.manager.G
+        if sources is None:
+            sources = list(nx.ancestors(G, self.dst)) if self.dst in G else []
+        sources = [s for s in sources if s != self.dst and s in G]
+        if not sources:
+            return {}
+
+        self.best_routes = {}
+        episodes = max(self.episodes, self.table_episodes_per_source * len(sources))
+        if self.batch_size > 1:
+            self._train_batched(weights, episodes, start_nodes=sources)
+        else:
+            self._train_sequential(weights, episodes, start_nodes=sources)
+
+        # Aday: BW kısıtını sağlayan kenarlarla hedefe en az sekmeli yollar (tüm kaynaklar için tek seferde)
+        valid_edges = [
+            (u, v) for u, v, d in G.edges(data=True)
+            if d.get('bandwidth', 0) >= self.bw_demand
+        ]
+        temp_G = G.edge_subgraph(valid_edges)
+        fallback_paths = nx.shortest_path(temp_G, target=self.dst) if self.dst in temp_G else {}
+
+        table = {}
+        for s in sources:
+            candidates = []
+            if s in self.best_routes:
+                candidates.append(self.best_routes[s])
+            greedy_path = self._extract_greedy_path(s)
+            if greedy_path:
+                g_cost, g_metrics = self._path_cost(greedy_path, weights)
+                if g_metrics.get('is_feasible'):
+                    candidates.append((g_cost, greedy_path, g_metrics))
+            fb_path = fallback_paths.get(s)
+            if fb_path and len(fb_path) > 1:
+                fb_cost, fb_metrics = self._path_cost(fb_path, weights)
+                candidates.append((fb_cost, fb_path, fb_metrics))
+            if not candidates:
+                continue
+
+            cost, path, metrics = min(candidates, key=lambda c: c[0])
+            table[s] = {'next_hop': path[1], 'path': list(path), 'cost': cost, 'metrics': metrics}
+
+        self._relax_routing_table(table, weights)
+
+        # Depo verildiyse tablo ve tüm rotalar sonraki tekil solve() çağrıları için saklanır
+        if self.q_store is not None:
+            store_key = self.q_store.make_key(self.manager, self.dst, weights, self.bw_demand,
+                                             self.max_delay, self.min_reliability)
+            self.q_store.put(store_key, self.Q, {s: r['path'] for s, r in table.items()})
+
+        if self.src in table:
+            self.best_path = table[self.src]['path']
+            self.best_cost = table[self.src]['cost']
+            self.best_metrics = table[self.src]['metrics']
+        return table
+
+    def solve(self, weights, initial_solutions=None):
+        """
+        Q-Learning eğitim döngüsü.
+        
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            initial_solutions (list, optional): Sıcak başlangıç yolları; Q tablosu bu yollarla
+                önyüklenir ve eğitim sıcak başlangıç ayarlarıyla (warm_episodes, warm_epsilon)
+                kısaltılır. None ise ve archive verildiyse arşivden alınır.
+            
+        Returns:
+            best_path, best_cost, metrics
+        """
+        # Sıcak Başlangıç: Depoda bu hedef için eğitilmiş tablo varsa oradan devam et
+        episodes = self.episodes
+        store_key = None
+        self.is_warm = False
+        if self.q_store is not None:
+            store_key = self.q_store.make_key(self.manager, self.dst, weights, self.bw_demand,
+                                             self.max_delay, self.min_reliability)
+            cached_q = self.q_store.get(store_key)
+            if cached_q is not None:
+                self.Q = cached_q
+                self.is_warm = True
+                self.epsilon = min(self.epsilon, self.warm_epsilon)
+                if self.warm_episodes is not None:
+                    episodes = self.warm_episodes
+
+                # Aynı kaynak için daha önce bulunan rota başlangıç adayıdır
+                known_path = self.q_store.get_route(store_key, self.src)
+                if known_path:
+                    k_cost, k_metrics = self._path_cost(known_path, weights)
+                    if k_metrics.get('is_feasible'):
+                        self.best_cost = k_cost
+                        self.best_path = known_path
+                        self.best_metrics = k_metrics
+
+        # Sıcak Başlangıç (tohum yollar): Q tablosunu yolların getirileriyle önyükle
+        if initial_solutions is None and self.archive is not None:
+            initial_solutions = self.archive.seeds(self.src, self.dst, self.bw_demand, weights,
+                                                   self.max_delay, self.min_reliability)
+        seeds = valid_seeds(self.manager, initial_solutions, self.src, self.dst, self.max_hops + 1)
+        if seeds:
+            self._seed_q_table(seeds, weights)
+            if not self.is_warm:
+                self.is_warm = True
+                self.epsilon = min(self.epsilon, self.warm_epsilon)
+                if self.warm_episodes is not None:
+                    episodes = self.warm_episodes
+
+        # Eğitim Döngüsü
+        if self.batch_size > 1:
+            self._train_batched(weights, episodes)
+        else:
+            self._train_sequential(weights, episodes)
+
         # Eğitim Bitti
+
+        # Öğrenilmiş politikanın önerdiği yol, keşif sırasında bulunandan iyi olabilir
+        # (Sıcak başlangıçta az epizot koşulduğu için özellikle önemlidir)
+        greedy_path = self._extract_greedy_path(self.src)
+        if greedy_path:
+            g_cost, g_metrics = self._path_cost(greedy_path, weights)
+            if g_metrics.get('is_feasible') and g_cost < self.best_cost:
+                self.best_cost = g_cost
+                self.best_path = greedy_path
+                self.best_metrics = g_metrics
+        if self.progress is not None:
+            self.progress.finish(self.best_cost, self.best_path)
+
+        if store_key is not None:
+            self.q_store.put(store_key, self.Q, {self.src: self.best_path})
+        if self.archive is not None and self.best_path:
+            self.archive.add(self.src, self.dst, self.bw_demand, self.best_path,
+                             self.max_delay, self.min_reliability)
         
         # Eğer hiç yol bulunamadıysa Shortest Path Fallback (Sistem çökmemesi için)
         if not self.best_path:
@@ -193,9 +662,7 @@ class QLearningOptimizer:
                 temp_G = self.manager.G.edge_subgraph(valid_edges)
                 if nx.has_path(temp_G, self.src, self.dst):
                     self.best_path = nx.shortest_path(temp_G, self.src, self.dst)
-                    self.best_cost, self.best_metrics = self.manager.calculate_path_cost(
-                        self.best_path, weights, self.bw_demand
-                    )
+                    self.best_cost, self.best_metrics = self._path_cost(self.best_path, weights)
                 else:
                     # Hiçbir çare yok
                     return [], 0.0, {}
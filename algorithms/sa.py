@@ -1,7 +1,12 @@
 import random
 import math
 import copy
+import time
 import networkx as nx
+import numpy as np
+
+from algorithms.path_repair import rebuild_subpath
+from algorithms.solution_archive import valid_seeds
 
 class SAOptimizer:
     """
@@ -10,7 +15,7 @@ class SAOptimizer:
     en uygun (minimum maliyetli) yolu bulmaya çalışır.
     """
 
-    def __init__(self, manager, src, dst, bw_demand):
+    def __init__(self, manager, src, dst, bw_demand, max_delay=None, min_reliability=None, archive=None):
         """
         Algoritmanın temel değişkenlerini ve ağ parametrelerini hazırlar.
         """
@@ -18,6 +23,15 @@ class SAOptimizer:
         self.src = src              # Kaynak düğüm (başlangıç)
         self.dst = dst              # Hedef düğüm (bitiş)
         self.bw_demand = bw_demand  # Talep edilen minimum bant genişliği
+        self.max_delay = max_delay              # Sert gecikme bütçesi (ms), None: kısıt yok
+        self.min_reliability = min_reliability  # Sert güvenilirlik tabanı (0-1), None: kısıt yok
+        # Kısmi yolları kısıt alt sınırlarıyla budayan yardımcı (kısıt yoksa None)
+        self._qos = manager.get_qos_constraints(dst, max_delay, min_reliability, src)
+        self.qos_rejections = 0     # Kısıtı ihlal ettiği için değerlendirilmeden reddedilen komşu sayısı
+        self.archive = archive      # SolutionArchive: verilirse başlangıç yolu buradan alınır, sonuç geri yazılır
+        self.warm_temp_ratio = 0.1  # Sıcak başlangıçta T0 çarpanı: iyi bir yoldan başlandığı için daha soğuk başla
+        self.is_warm = False        # Son solve() çağrısı bir tohumdan mı başladı?
+        self.progress = None        # ProgressReporter: verilirse solve() iterasyon başına ilerleme bildirir, durdurulabilir
 
         # --- SA Parametreleri (Soğutma Çizelgesi) ---
         self.initial_temp = 500.0     # T0: Başlangıç sıcaklığı (Yüksek olması daha fazla rastgeleliğe izin verir)
@@ -26,6 +40,23 @@ class SAOptimizer:
         self.max_iterations = 800     # Toplamda yapılacak maksimum deneme sayısı
         self.stagnation_limit = 50    # İyileşme olmazsa algoritmayı erken sonlandırmak için limit
         self.max_hop_limit = 15       # Yolun çok uzamasını engellemek için maksimum sekme sınırı
+        self.rebuild_max_hops = 4     # Yeniden inşa edilen alt yolun (kesim noktası -> hedef) maksimum sekmesi
+        self.rebuild_expansions = 50  # Alt yol aramasında genişletilecek maksimum düğüm sayısı
+        self.rng = np.random.default_rng(random.getrandbits(64)) # Alt yol araması için (random.seed ile tekrarlanabilir)
+        self.hop_pruning = True       # Rastgele yürüyüşte hedefe kalan sekme bütçesini aşacak komşuları baştan ele
+        self.use_bounds = True        # Alt sınırı kabul eşiğini aşan komşuları değerlendirmeden reddet
+        self._bounds = None           # Ağırlık profiline ait CostBounds (solve içinde atanır)
+        self.bound_rejections = 0     # Alt sınır ile erken reddedilen komşu sayısı
+        self.evaluations = 0          # Son solve() çağrısındaki yol değerlendirme sayısı
+
+        # Yol üretim istatistikleri (deneme / başarısız deneme / budanan hamle), metriklerde raporlanır
+        self.walk_stats = {'attempts': 0, 'failures': 0, 'pruned': 0, 'qos_pruned': 0}
+
+        # --- Paralel Tavlama (Replica Exchange) Parametreleri - sadece solve_tempering() kullanır ---
+        self.n_chains = 4                 # Farklı sıcaklıklarda çalışan zincir (replica) sayısı
+        self.tempering_min_temp = 0.05    # Sıcaklık merdiveninin en soğuk basamağı (en sıcak: initial_temp)
+        self.swap_interval = 10           # Kaç adımda bir komşu zincirler arasında durum takası denenir
+        self.tempering_patience = 8       # Bu kadar takas turunda (swap_interval adımlık) küresel en iyi iyileşmezse dur
 
     def _evaluate(self, path, weights):
         """
@@ -34,14 +65,18 @@ class SAOptimizer:
         """
         if not path:
             return float('inf'), {} # Yol yoksa sonsuz maliyet döndür
+        self.evaluations += 1
         # NetworkManager aracılığıyla gecikme, jitter ve kayıp bazlı maliyeti hesapla
-        return self.manager.calculate_path_cost(path, weights, self.bw_demand)
+        return self.manager.calculate_path_cost(path, weights, self.bw_demand,
+                                                self.max_delay, self.min_reliability)
 
     def _generate_initial_solution(self):
         """
         Arama işlemine başlamak için ilk geçerli yolu bulur (Hibrit Yaklaşım).
         """
         # 1. Aşama: Sezgisel (Heuristic) yaklaşım denemesi
+        # Sert QoS kısıtını ihlal eden sezgisel yol yedekte tutulur; önce kısıta uygun yürüyüş denenir
+        fallback = None
         try:
             # Sadece bant genişliği yeterli olan kenarları filtrele
             valid_edges = [
@@ -56,15 +91,21 @@ class SAOptimizer:
                 path = nx.shortest_path(temp_G, self.src, self.dst)
                 # Hop limiti içindeyse bu yolu başlangıç çözümü kabul et
                 if len(path) <= self.max_hop_limit:
-                    return path
+                    if not self._qos or self._qos.prefix_ok(path):
+                        return path
+                    fallback = path
         except:
             pass # Heuristic bulunamazsa rastgele yürüyüşe geç
 
         # 2. Aşama: Rastgele Yürüyüş (Random Walk) - 20 kez dene
+        dist = self.manager.hop_distances_to(self.dst) if self.hop_pruning else None
+        qos = self._qos
         for _ in range(20):
+            self.walk_stats['attempts'] += 1
             path = [self.src]
             visited = {self.src}
             curr = self.src
+            acc = qos.start(self.src) if qos else None # Birikmiş gecikme / -log güvenilirlik
             
             while curr != self.dst:
                 neighbors = list(self.manager.G.neighbors(curr))
@@ -78,11 +119,25 @@ class SAOptimizer:
                 # Sıkı kısıtla komşu bulunamazsa, en azından ziyaret edilmemiş olanlara bak
                 if not valid_neighbors:
                     valid_neighbors = [n for n in neighbors if n not in visited]
+
+                # Hop bütçesi: hedefe kalan sekme içinde ulaşılamayacak komşuları seçmeden ele
+                if dist is not None:
+                    budget = self.max_hop_limit - len(path) - 1
+                    feasible = [n for n in valid_neighbors if dist.get(n, float('inf')) <= budget]
+                    self.walk_stats['pruned'] += len(valid_neighbors) - len(feasible)
+                    valid_neighbors = feasible
+
+                # Sert QoS kısıtı: bütçeye sığan hiçbir tamamlaması olmayan komşuları ele
+                if qos:
+                    feasible = [n for n in valid_neighbors if qos.step_ok(acc, curr, n)]
+                    self.walk_stats['qos_pruned'] += len(valid_neighbors) - len(feasible)
+                    valid_neighbors = feasible
                 
                 if not valid_neighbors: break # Çıkmaz sokak
                 
                 # Rastgele bir komşu seç ve ilerle
                 next_node = random.choice(valid_neighbors)
+                if qos: acc = qos.advance(acc, curr, next_node)
                 path.append(next_node)
                 visited.add(next_node)
                 curr = next_node
@@ -91,12 +146,16 @@ class SAOptimizer:
             
             if curr == self.dst: # Hedefe ulaşıldıysa yolu döndür
                 return path
+            self.walk_stats['failures'] += 1
         
-        return None # Hiçbir şekilde yol bulunamadı
+        return fallback # Kısıta uygun yol bulunamadı (yedek de yoksa None)
 
-    def _generate_neighbor(self, current_path):
+    def _generate_neighbor(self, current_path, reject_above=None):
         """
         Mevcut yolda küçük değişiklikler yaparak yeni bir 'komşu' yol türetir.
+        reject_above verilirse, düğüm değiştirme hamlesinin maliyet alt sınırı bu eşiği aşıyorsa
+        None döner (kabul edilemeyecek komşu). Yeniden inşada sınır kullanılmaz: korunan önek,
+        mevcut yolun kendi sonekiyle tamamlanabildiğinden sınırı hiçbir zaman eşiği aşamaz.
         """
         if len(current_path) < 3:
             return list(current_path) # Değiştirilecek orta düğüm yoksa aynı yolu dön
@@ -119,54 +178,184 @@ class SAOptimizer:
             candidates = [n for n in common if n not in new_path]
             
             if candidates:
-                new_path[idx] = random.choice(candidates) # Rastgele biriyle değiştir
+                new_node = random.choice(candidates) # Rastgele biriyle değiştir
+                # Erken Ret: değişen iki adımdan artımlı hesaplanan (cezasız) maliyet eşiği aşıyorsa
+                # komşu kabul edilemez; tam değerlendirmeye gerek yok
+                if reject_above is not None and \
+                        self._bounds.swap_bound(new_path, idx, new_node, self.dst) > reject_above:
+                    return None
+                new_path[idx] = new_node
                 return new_path
 
         # --- Yöntem 2: Alt Yol İnşası (Rebuild) ---
         cut_idx = random.randint(1, len(new_path) - 2) # Yolu ortadan bir yerden kes
         prefix = new_path[:cut_idx+1] # Kesilen yere kadar olan kısmı koru
         curr = prefix[-1]
-        
-        # Kesilen noktadan hedefe BFS (Genişlik Öncelikli Arama) ile kısa bir yol ara
-        queue = [(curr, [curr])]
-        visited_local = {curr}
-        temp_visited = set(prefix)
-        depth_limit = 5 # Çok uzağa sapmadan lokal bir değişim yap
-        path_found = None
-        
-        iterations = 0
-        while queue and iterations < 50:
-            node, p = queue.pop(0)
-            iterations += 1
-            if len(p) > depth_limit: continue
-            
-            if node == self.dst: # Hedef bulunursa prefix ile birleştir
-                path_found = prefix + p[1:]
-                break
-            
-            neighbors = list(self.manager.G.neighbors(node))
-            random.shuffle(neighbors) # Çeşitlilik için komşuları karıştır
-            for n in neighbors:
-                if n not in temp_visited and n not in visited_local:
-                    visited_local.add(n)
-                    queue.append((n, p + [n]))
-        
+
+        # Kesilen noktadan hedefe çift yönlü BFS ile kısa bir alt yol ara (önek düğümleri yasak)
+        segment = rebuild_subpath(
+            self.manager.get_graph_arrays(), curr, self.dst, prefix[:-1],
+            max_hops=self.rebuild_max_hops, max_expansions=self.rebuild_expansions,
+            rng=self.rng, bidirectional=True
+        )
+        path_found = prefix + segment[1:] if segment else None
+
         if path_found and len(path_found) <= self.max_hop_limit:
             return path_found
 
         return list(current_path) # Yeni yol üretilemezse orijinali dön
 
-    def solve(self, weights):
+    def _metropolis_accept(self, delta_E, T, u=None):
+        """
+        Metropolis kabul kriteri: daha iyi yol her zaman, daha kötüsü exp(-ΔE/T) olasılıkla kabul edilir.
+        u: önceden çekilmiş düzgün rastgele sayı (alt sınırla erken retteki eşikle aynı karar için).
+        """
+        if delta_E < 0:
+            # Yeni yol daha iyiyse doğrudan kabul et
+            return True
+        # Yeni yol daha kötüyse, sıcaklığa bağlı bir olasılıkla kabul et
+        # Bu adım 'yerel minimum' tuzaklarından kurtulmayı sağlar.
+        try:
+            prob = math.exp(-delta_E / T) # Kabul olasılığı formülü
+        except OverflowError:
+            prob = 0
+        if u is None:
+            u = random.random()
+        return u < prob
+
+    def _run_chain(self, state, T, steps, weights):
+        """
+        Sabit sıcaklıkta tek bir zinciri 'steps' adım ilerletir (Paralel Tavlama için).
+        Args:
+            state (tuple): (path, cost, metrics)
+        Returns:
+            (son durum, zincirin bu turdaki en iyisi, kabul sayısı, önerilen hamle sayısı)
+            Mevcut yolla aynı olan (değişmeyen) komşular hamle sayılmaz.
+        """
+        path, cost, metrics = state
+        best = (list(path), cost, metrics)
+        accepted = 0
+        proposed = 0
+        for _ in range(steps):
+            neighbor_path = self._generate_neighbor(path)
+            if neighbor_path == path:
+                continue
+            proposed += 1
+            n_cost, n_metrics = self._evaluate(neighbor_path, weights)
+            if self._metropolis_accept(n_cost - cost, T):
+                path, cost, metrics = neighbor_path, n_cost, n_metrics
+                accepted += 1
+                if cost < best[1]:
+                    best = (list(path), cost, metrics)
+        return (path, cost, metrics), best, accepted, proposed
+
+    def solve_tempering(self, weights):
+        """
+        Paralel Tavlama (Parallel Tempering / Replica Exchange) modu.
+
+        - n_chains zincir geometrik bir sıcaklık merdiveninde (ladder) sabit sıcaklıkta
+          Metropolis adımı atar. Merdiven initial_temp ile tempering_min_temp arasındadır.
+        - Her swap_interval adımda komşu sıcaklıktaki zincirler arasında durum takası
+          min(1, exp((1/T_i - 1/T_j) * (E_i - E_j))) olasılığıyla kabul edilir
+          (çift/tek çiftler dönüşümlü denenir). Böylece sıcak zincirlerin bulduğu
+          bölgeler soğuk zincirlere taşınır.
+        - Zincirler bu süreçte sırayla koşturulur: bir tur yalnızca swap_interval adım
+          sürdüğünden zincirleri ayrı süreçlere dağıtmanın IPC maliyeti zincir işini aşar.
+          Çok çekirdekten faydalanmak için talepler paralel çözülür (algorithms/batch.py).
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+
+        Returns:
+            best_path, best_cost, metrics
+            metrics ayrıca 'chain_temps', 'chain_acceptance' (zincir başına kabul oranı) ve
+            'swap_rates' (komşu çift başına takas kabul oranı), 'evaluations' ve 'rounds' anahtarlarını içerir.
+        """
+        self.evaluations = 0
+        initial_path = self._generate_initial_solution()
+        if not initial_path:
+            return [], 0.0, {}
+        initial_cost, initial_metrics = self._evaluate(initial_path, weights)
+
+        n = max(1, self.n_chains)
+        t_hot, t_cold = self.initial_temp, min(self.tempering_min_temp, self.initial_temp)
+        temps = [t_hot * (t_cold / t_hot) ** (i / (n - 1)) for i in range(n)] if n > 1 else [t_cold]
+
+        states = [(list(initial_path), initial_cost, initial_metrics) for _ in range(n)]
+        best_path, best_cost, best_metrics = list(initial_path), initial_cost, initial_metrics
+        accepted = [0] * n
+        proposed = [0] * n
+        swap_accepted = [0] * max(n - 1, 0)
+        swap_tried = [0] * max(n - 1, 0)
+
+        n_rounds = max(1, -(-self.max_iterations // self.swap_interval))
+
+        stagnant_rounds = 0
+        for rnd in range(n_rounds):
+            results = [self._run_chain(states[i], temps[i], self.swap_interval, weights) for i in range(n)]
+
+            improved = False
+            for i, (state, chain_best, acc, prop) in enumerate(results):
+                states[i] = state
+                accepted[i] += acc
+                proposed[i] += prop
+                if chain_best[1] < best_cost:
+                    best_path, best_cost, best_metrics = chain_best
+                    improved = True
+            stagnant_rounds = 0 if improved else stagnant_rounds + 1
+            if stagnant_rounds >= self.tempering_patience:
+                break
+
+            # Durum Takası (Replica Exchange): çift turlarda (0,1),(2,3)..; tek turlarda (1,2),(3,4)..
+            for i in range(rnd % 2, n - 1, 2):
+                swap_tried[i] += 1
+                e_i, e_j = states[i][1], states[i + 1][1]
+                try:
+                    prob = math.exp(min(0.0, (1.0 / temps[i] - 1.0 / temps[i + 1]) * (e_i - e_j)))
+                except OverflowError:
+                    prob = 0
+                if random.random() < prob:
+                    states[i], states[i + 1] = states[i + 1], states[i]
+                    swap_accepted[i] += 1
+
+        self.tempering_stats = {
+            'chain_temps': [round(t, 4) for t in temps],
+            'chain_acceptance': [round(a / p, 4) if p else 0.0 for a, p in zip(accepted, proposed)],
+            'swap_rates': [round(a / t, 4) if t else 0.0 for a, t in zip(swap_accepted, swap_tried)],
+            'evaluations': self.evaluations,
+            'rounds': rnd + 1,
+        }
+        metrics = dict(best_metrics)
+        metrics.update(self.tempering_stats)
+        return best_path, best_cost, metrics
+
+    def solve(self, weights, initial_solutions=None):
         """
         Simulated Annealing algoritmasını çalıştıran ana motor.
+
+        Args:
+            weights (tuple): (w_delay, w_reliability, w_resource)
+            initial_solutions (list, optional): Sıcak başlangıç yolları; zincir bunların bu
+                ağırlıklarla en ucuzundan, warm_temp_ratio ile soğutulmuş T0 ile başlar.
+                None ise ve archive verildiyse arşivden alınır.
         """
-        # 1. Başlangıç çözümünü oluştur
-        current_path = self._generate_initial_solution()
-        if not current_path:
-            return [], 0.0, {} # Yol bulunamazsa boş dön
+        self.evaluations = 0
+        # 1. Başlangıç çözümünü oluştur (sıcak başlangıçta tohumların en iyisi)
+        if initial_solutions is None and self.archive is not None:
+            initial_solutions = self.archive.seeds(self.src, self.dst, self.bw_demand, weights,
+                                                   self.max_delay, self.min_reliability)
+        seeds = valid_seeds(self.manager, initial_solutions, self.src, self.dst, self.max_hop_limit)
+        self.is_warm = bool(seeds)
+        if seeds:
+            scored = [(self._evaluate(p, weights), p) for p in seeds]
+            (current_cost, current_metrics), current_path = min(scored, key=lambda x: x[0][0])
+        else:
+            current_path = self._generate_initial_solution()
+            if not current_path:
+                return [], 0.0, {} # Yol bulunamazsa boş dön
 
-        # İlk çözümün maliyetini hesapla
-        current_cost, current_metrics = self._evaluate(current_path, weights)
+            # İlk çözümün maliyetini hesapla
+            current_cost, current_metrics = self._evaluate(current_path, weights)
         
         # En iyi çözümü takip etmek için değişkenleri ilklendir
         best_path = list(current_path)
@@ -175,41 +364,60 @@ class SAOptimizer:
         
         # 2. Tavlama (Döngü) Başlangıcı
         T = self.initial_temp
+        if self.is_warm:
+            # Durma sıcaklığı aynı kalır: daha kısa, yerel iyileştirme odaklı bir tavlama
+            T *= self.warm_temp_ratio
+        start_temp = T
         iteration = 0
         stagnation_counter = 0
 
+        # Alt sınırlar: kabul rastgele sayısı (u) hamleden önce çekilir. Metropolis kuralı
+        # "maliyet < mevcut - T*ln(u)" ile eşdeğer olduğundan, alt sınırı bu eşiği aşan
+        # komşu tam değerlendirmeden reddedilebilir (karar değişmez).
+        self._bounds = self.manager.get_cost_bounds(weights) if self.use_bounds else None
+        self.bound_rejections = 0
+        self.qos_rejections = 0
+        # Mevcut yol sert QoS kısıtlarını sağlıyorsa, ihlal eden komşular değerlendirilmeden reddedilir
+        # (mevcut yol da ihlal ediyorsa ceza ile karşılaştırılır ki uygun bölgeye geçilebilsin)
+        current_qos_ok = not self._qos or self._qos.prefix_ok(current_path)
+
         # Sistem soğuyana veya max iterasyona ulaşana kadar dön
         while T > self.final_temp and iteration < self.max_iterations:
             # A. Mevcut yola komşu yeni bir yol üret
-            neighbor_path = self._generate_neighbor(current_path)
-            
-            # B. Yeni yolun maliyetini hesapla
-            neighbor_cost, neighbor_metrics = self._evaluate(neighbor_path, weights)
-            
-            # C. Enerji farkını (maliyet farkını) hesapla
-            delta_E = neighbor_cost - current_cost
-            
-            # D. Kabul Kriteri (Metropolis Algoritması)
-            accepted = False
-            if delta_E < 0:
-                # Yeni yol daha iyiyse doğrudan kabul et
-                accepted = True
+            u = random.random()
+            reject_above = None
+            if self._bounds is not None and u > 0:
+                reject_above = current_cost - T * math.log(u)
+            neighbor_path = self._generate_neighbor(current_path, reject_above)
+
+            if neighbor_path is None:
+                # Erken Ret: bu komşu kabul edilemez, maliyet hesaplanmaz
+                self.bound_rejections += 1
+                neighbor_path = current_path
+                accepted = False
+            elif current_qos_ok and self._qos and neighbor_path != current_path \
+                    and not self._qos.prefix_ok(neighbor_path):
+                # Kısıt budaması: uygun bir yoldan ihlal eden bir yola geçilmez
+                self.qos_rejections += 1
+                neighbor_path = current_path
+                accepted = False
             else:
-                # Yeni yol daha kötüyse, sıcaklığa bağlı bir olasılıkla kabul et
-                # Bu adım 'yerel minimum' tuzaklarından kurtulmayı sağlar.
-                try:
-                    prob = math.exp(-delta_E / T) # Kabul olasılığı formülü
-                except OverflowError:
-                    prob = 0
-                
-                if random.random() < prob:
-                    accepted = True
+                # B. Yeni yolun maliyetini hesapla
+                neighbor_cost, neighbor_metrics = self._evaluate(neighbor_path, weights)
+
+                # C. Enerji farkını (maliyet farkını) hesapla
+                delta_E = neighbor_cost - current_cost
+
+                # D. Kabul Kriteri (Metropolis Algoritması)
+                accepted = self._metropolis_accept(delta_E, T, u)
             
             # E. Eğer yeni çözüm kabul edildiyse güncelle
             if accepted:
                 current_path = neighbor_path
                 current_cost = neighbor_cost
                 current_metrics = neighbor_metrics
+                if self._qos and not current_qos_ok:
+                    current_qos_ok = self._qos.prefix_ok(current_path)
                 
                 # Eğer bu yeni yol şimdiye kadar bulunan en iyi yolsa kaydet
                 if current_cost < best_cost:
@@ -225,11 +433,25 @@ class SAOptimizer:
             # F. Sıcaklığı düşür (Sistem soğuyor)
             T *= self.alpha
             iteration += 1
-            
+
             # G. Erken Durdurma (Stagnation)
             # Sıcaklık iyice düştüyse ve uzun süredir iyileşme yoksa aramayı bitir
-            if stagnation_counter > self.stagnation_limit and T < (self.initial_temp * 0.1):
+            if stagnation_counter > self.stagnation_limit and T < (start_temp * 0.1):
                 break
 
+            if self.progress is not None and self.progress.report(iteration, best_cost, best_path):
+                break
+
+        if self.progress is not None:
+            self.progress.finish(best_cost, best_path)
+        if self.archive is not None and best_path:
+            self.archive.add(self.src, self.dst, self.bw_demand, best_path,
+                             self.max_delay, self.min_reliability)
+
         # Bulunan en iyi yolu, maliyeti ve metrikleri döndür
-        return best_path, best_cost, best_metrics
\ No newline at end of file
+        best_metrics = dict(best_metrics, walk_stats=dict(self.walk_stats),
+                            bound_rejections=self.bound_rejections,
+                            qos_rejections=self.qos_rejections,
+                            iterations=iteration,
+                            evaluations=self.evaluations)
+        return best_path, best_cost, best_metrics
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+
+from algorithms.pareto import ParetoFront
+
+def valid_seeds(manager, paths, src, dst, max_len):
+    """
+    Sıcak başlangıç için verilen yollardan kullanılabilir olanları süzer: src ile başlayıp
+    dst ile biten, kenarları var olan, döngüsüz ve en çok max_len düğümlü yollar (sıra korunur).
+    """
+    seeds = []
+    seen = set()
+    for p in paths or []:
+        p = list(p)
+        key = tuple(p)
+        if len(p) < 2 or p[0] != src or p[-1] != dst or len(p) > max_len or key in seen:
+            continue
+        if len(set(p)) != len(p) or not all(manager.G.has_edge(u, v) for u, v in zip(p, p[1:])):
+            continue
+        seen.add(key)
+        seeds.append(p)
+    return seeds
+
+
+class SolutionArchive:
+    """
+    (kaynak, hedef, bant genişliği[, QoS kısıtları]) başına iyi yollar arşivi (sıcak başlangıç).
+
+    Ağırlık profili değiştiğinde en iyi yol genellikle çok az değişir. Arşiv her talep için
+    (gecikme, -log güvenilirlik, kaynak maliyeti) uzayında baskın olunmayan yolları tutar;
+    doğrusal ağırlıklı maliyetin her profildeki en iyisi bu kümede olduğundan, seeds(weights)
+    yeni profile göre sıralanmış tohumlar döndürür. Optimizasyon algoritmaları archive
+    parametresiyle verildiğinde tohumları buradan alır ve bulduğu en iyi yolu geri yazar.
+
+    Yollar topolojiye bağlıdır; NetworkManager.invalidate_topology arşivi sıfırlar.
+    """
+
+    def __init__(self, manager, max_paths=8, max_keys=512):
+        self.manager = manager
+        self.max_paths = max_paths        # Talep başına saklanacak en fazla yol
+        self.max_keys = max_keys          # Bellekte tutulacak en fazla talep (LRU)
+        self._fronts = OrderedDict()      # anahtar -> ParetoFront
+
+    def __len__(self):
+        return len(self._fronts)
+
+    def _front(self, src, dst, bw, max_delay, min_reliability, create=False):
+        key = (src, dst, float(bw), max_delay, min_reliability)
+        front = self._fronts.get(key)
+        if front is None and create:
+            front = ParetoFront(self.manager, bw, max_delay, min_reliability)
+            self._fronts[key] = front
+            while len(self._fronts) > self.max_keys:
+                self._fronts.popitem(last=False)
+        if front is not None:
+            self._fronts.move_to_end(key)
+        return front
+
+    def add(self, src, dst, bw, paths, max_delay=None, min_reliability=None):
+        """Yolları (tek yol veya yol listesi) talebin arşivine ekler; domine edilenler atılır."""
+        if paths and not isinstance(paths[0], (list, tuple)):
+            paths = [paths]
+        front = self._front(src, dst, bw, max_delay, min_reliability, create=True)
+        for p in paths or []:
+            if p:
+                front.add_path(p)
+        # Sınır aşılırsa en eski kayıtlar atılır (yeni çözümler güncel ağırlıklara daha yakındır)
+        for archive in (front.entries, front.infeasible):
+            del archive[:-self.max_paths]
+
+    def seeds(self, src, dst, bw, weights, max_delay=None, min_reliability=None, k=None):
+        """
+        Talep için arşivdeki yolları verilen ağırlıklarla en iyiden kötüye sıralı döndürür
+        (önce kısıtları sağlayanlar). Kayıt yoksa boş liste.
+        """
+        front = self._front(src, dst, bw, max_delay, min_reliability)
+        if front is None:
+            return []
+        ranked = []
+        for archive in (front.entries, front.infeasible):
+            scored = sorted(archive, key=lambda e: sum(w * o for w, o in zip(weights, e['objectives'])))
+            ranked += [list(e['path']) for e in scored]
+        return ranked[:k] if k is not None else ranked
+
+    def clear(self):
+        self._fronts.clear()
@@ -0,0 +1,147 @@
+import os
+import math
+import hashlib
+import numpy as np
+import networkx as nx
+
+# Bu düğüm sayısına kadar Kamada-Kawai (O(n^2) bellek, tüm çift en kısa yollar) kullanılır;
+# daha büyük graflarda spektral başlangıç + kısa seyrek yay (spring) iyileştirmesi
+KK_MAX_NODES = 300
+FAST_SPRING_ITERATIONS = 50
+FAST_REPULSION_SAMPLES = 256     # İtme kuvveti her iterasyonda bu kadar rastgele düğümden tahmin edilir
+FAST_GRAVITY = 1.0               # Merkeze çekim katsayısı
+
+def structure_key(G):
+    """Sadece düğüm/kenar kümesine bağlı kısa özet (topoloji sürümü verilmediğinde anahtar olarak)."""
+    h = hashlib.sha1()
+    for n in sorted(G.nodes()):
+        h.update(f"n{n};".encode())
+    for u, v in sorted(G.edges()):
+        h.update(f"e{u},{v};".encode())
+    return h.hexdigest()[:16]
+
+def layout_method(G, method="auto"):
+    """'auto' seçimini grafın boyutuna göre 'kk' veya 'fast' olarak çözer."""
+    if method == "auto":
+        return "kk" if G.number_of_nodes() <= KK_MAX_NODES else "fast"
+    return method
+
+def compute_layout(G, method="auto", seed=42):
+    """
+    Graf yerleşimini (düğüm -> (x, y)) hesaplar; koordinatlar [-1, 1] aralığına ölçeklenir
+    (GraphCanvas'taki fare yakalama yarıçapları bu ölçeğe göre seçilmiştir).
+
+    Args:
+        method (str): 'kk' (Kamada-Kawai), 'fast' (spektral + seyrek spring), 'spring' veya 'auto'.
+    """
+    if G.number_of_nodes() == 0:
+        return {}
+    method = layout_method(G, method)
+    if method == "kk":
+        try:
+            pos = nx.kamada_kawai_layout(G)
+        except Exception:
+            pos = nx.spring_layout(G, seed=seed)
+    elif method == "fast":
+        pos = fast_layout(G, seed=seed)
+    else:
+        pos = nx.spring_layout(G, seed=seed)
+    return nx.rescale_layout_dict(pos, scale=1)
+
+def fast_layout(G, iterations=FAST_SPRING_ITERATIONS, samples=FAST_REPULSION_SAMPLES, seed=42):
+    """
+    Büyük graflar için hızlı yerleşim: spektral başlangıç + örneklemeli Fruchterman-Reingold.
+
+    Spektral yerleşim (seyrek özdeğer çözümü) hızlıdır ama düğümleri kümelere sıkıştırır; yay
+    iterasyonları onları açar. networkx'in spring_layout'u her iterasyonda O(n^2) itme hesabı
+    (büyük graflarda düğüm başına Python döngüsü) yaptığından, burada itme kuvveti rastgele
+    örneklenen düğümlerden tahmin edilir (O(n * samples)); çekme kenarlar üzerinden vektörel.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n <= 2:
+        return nx.circular_layout(G)
+    index = {u: i for i, u in enumerate(nodes)}
+    try:
+        init = nx.spectral_layout(G.to_undirected(as_view=True))
+        X = np.array([init[u] for u in nodes], dtype=float)
+    except Exception:
+        X = None
+    rng = np.random.default_rng(seed)
+    if X is None or not np.isfinite(X).all():
+        X = rng.uniform(-1, 1, (n, 2))
+    X = X - X.mean(axis=0)
+    X /= max(np.abs(X).max(), 1e-9)
+    X += rng.normal(0, 1e-3, X.shape)     # Çakışan spektral koordinatları ayırmak için küçük sarsıntı
+
+    # Yönlü graflarda u -> v ve v -> u kenarları çekmeyi iki kez sayar; yerleşim için sorun değil
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+    eu, ev = edges[:, 0], edges[:, 1]
+    k2 = 4.0 / n                           # [-1, 1]^2 alanında ideal kenar uzunluğunun karesi
+    k = math.sqrt(k2)
+    s = min(samples, n)
+    t = 0.1
+    dt = t / (iterations + 1)
+    for _ in range(iterations):
+        # İtme: sum_j (x_i - x_j) * k^2 / d_ij^2; (n, s, 2) ara dizisi yerine matris çarpımlarıyla
+        Y = X[rng.choice(n, s, replace=False)]
+        sq = (X ** 2).sum(axis=1)
+        d2 = np.maximum(sq[:, None] + (Y ** 2).sum(axis=1)[None, :] - 2.0 * (X @ Y.T), 1e-4)
+        w = k2 / d2
+        disp = (X * w.sum(axis=1)[:, None] - w @ Y) * (n / s)
+        disp -= FAST_GRAVITY * X           # Bağlantısız bileşenler uzaklaşıp ölçeği bozmasın
+        if eu.size:
+            e = X[eu] - X[ev]
+            f = e * (np.sqrt((e ** 2).sum(axis=1)) / k)[:, None]
+            np.add.at(disp, eu, -f)
+            np.add.at(disp, ev, f)
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-9)
+        X += disp * (np.minimum(length, t) / length)[:, None]
+        t -= dt
+    return dict(zip(nodes, X))
+
+def provisional_layout(G):
+    """Yerleşim hesaplanırken ilk çizim için anında (O(n)) dairesel yerleşim."""
+    return nx.circular_layout(G)
+
+def cache_path(cache_dir, key, method):
+    return os.path.join(cache_dir, f"layout_{key}_{method}.npz")
+
+def load_layout(cache_dir, key, G, method="auto"):
+    """
+    Diskteki yerleşimi okur. Dosya yoksa, bozuksa veya düğüm kümesi grafla uyuşmuyorsa None.
+    """
+    path = cache_path(cache_dir, key, layout_method(G, method))
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            nodes = data["nodes"].tolist()
+            xy = data["xy"]
+    except Exception:
+        return None
+    if len(nodes) != G.number_of_nodes() or any(n not in G for n in nodes):
+        return None
+    return {n: xy[i] for i, n in enumerate(nodes)}
+
+def save_layout(cache_dir, key, G, pos, method="auto"):
+    """Yerleşimi (düğüm listesi + koordinat dizisi) diske yazar; hata olursa sessizce geçer."""
+    nodes = list(pos.keys())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = cache_path(cache_dir, key, layout_method(G, method))
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, nodes=np.asarray(nodes), xy=np.array([pos[n] for n in nodes], dtype=float))
+        os.replace(tmp, path)   # Yarım yazılmış dosya okunmasın diye atomik değiştirme
+    except (OSError, ValueError):
+        pass
+
+def cached_layout(G, cache_dir, key=None, method="auto"):
+    """Önbellekte varsa oradan okur, yoksa hesaplayıp kaydeder. Returns: (pos, önbellekten_mi)."""
+    key = key or structure_key(G)
+    pos = load_layout(cache_dir, key, G, method)
+    if pos is not None:
+        return pos, True
+    pos = compute_layout(G, method)
+    save_layout(cache_dir, key, G, pos, method)
+    return pos, False
@@ -1,29 +1,43 @@
 import pandas as pd
 import numpy as np
 import random
+import os
 
-def generate_network(n=250, p=0.4, seed=42):
+# Bu düğüm sayısına kadar her düğüm çifti tek tek denenir (klasik üretim, aynı tohumla aynı ağ);
+# daha büyük ağlarda kenarlar numpy ile örneklenir (n^2 döngü 50 bin düğümde mümkün değil)
+DENSE_MAX_NODES = 2000
+
+def _sparse_edges(n, p, seed):
     """
-    Erdős-Rényi modeline göre rastgele ağ topolojisi oluşturur.
-    N=250 düğüm, P=0.4 bağlantı olasılığı kısıtlarını uygular.
+    G(n, p) kenarlarını çift çift denemeden üretir: kenar sayısı Binom(n(n-1)/2, p)'den çekilir,
+    bu kadar farklı düğüm çifti düzgün rastgele seçilir. Çıktı _dense_edges ile aynı sütunlardadır.
     """
-    random.seed(seed)
-    np.random.seed(seed)
-    
-    # 1. Düğüm Verilerini Oluştur (NodeData)
-    # s_ms: 0.51 - 1.99 ms arası işlem gecikmesi
-    # r_node: 0.95 - 0.999 arası güvenilirlik
-    nodes = []
-    for i in range(n):
-        nodes.append({
-            'node_id': i,
-            's_ms': round(random.uniform(0.51, 1.99), 2),
-            'r_node': round(random.uniform(0.95, 0.999), 4)
-        })
-    nodes_df = pd.DataFrame(nodes)
-    
-    # 2. Bağlantı Verilerini Oluştur (EdgeData)
-    # p=0.4 olasılığıyla her düğüm çifti arasına kenar ekle
+    rng = np.random.default_rng(seed)
+    m = int(rng.binomial(n * (n - 1) // 2, p))
+    keys = np.zeros(0, dtype=np.int64)
+    while keys.size < m:
+        need = m - keys.size
+        i = rng.integers(0, n, int(need * 1.1) + 16)
+        j = rng.integers(0, n, i.size)
+        ok = i != j
+        lo, hi = np.minimum(i[ok], j[ok]), np.maximum(i[ok], j[ok])
+        keys = np.unique(np.concatenate([keys, lo * n + hi]))
+    keys = rng.permutation(keys)[:m]
+    src, dst = keys // n, keys % n
+    capacity = rng.integers(100, 1001, m)
+    delay = np.round(rng.uniform(3.0, 15.0, m), 2)
+    rel = np.round(rng.uniform(0.95, 0.999, m), 4)
+    # Çift yönlü ağ olduğu için her kenar iki yönde de yazılır
+    return pd.DataFrame({
+        'src': np.concatenate([src, dst]),
+        'dst': np.concatenate([dst, src]),
+        'capacity_mbps': np.concatenate([capacity, capacity]),
+        'delay_ms': np.concatenate([delay, delay]),
+        'r_link': np.concatenate([rel, rel]),
+    })
+
+def _dense_edges(n, p):
+    # p olasılığıyla her düğüm çifti arasına kenar ekle
     edges = []
     for i in range(n):
         for j in range(i + 1, n):
@@ -45,13 +59,46 @@ def generate_network(n=250, p=0.4, seed=42):
                     'delay_ms': edges[-1]['delay_ms'],
                     'r_link': edges[-1]['r_link']
                 })
-    
-    edges_df = pd.DataFrame(edges)
-    
+    return pd.DataFrame(edges)
+
+def generate_network(n=250, p=0.4, seed=42, avg_degree=None, output_dir="."):
+    """
+    Erdős-Rényi modeline göre rastgele ağ topolojisi oluşturur.
+    N=250 düğüm, P=0.4 bağlantı olasılığı kısıtlarını uygular.
+
+    Args:
+        avg_degree (float, optional): Verilirse p yerine ortalama derece ile yoğunluk belirlenir
+            (p = avg_degree / (n - 1)); büyük ağları ölçeklenebilirlik testleri için seyrek tutar.
+        output_dir (str): CSV dosyalarının yazılacağı klasör.
+
+    Returns:
+        tuple: (nodes_df, edges_df)
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    if avg_degree is not None:
+        p = min(1.0, avg_degree / max(n - 1, 1))
+
+    # 1. Düğüm Verilerini Oluştur (NodeData)
+    # s_ms: 0.51 - 1.99 ms arası işlem gecikmesi
+    # r_node: 0.95 - 0.999 arası güvenilirlik
+    nodes = []
+    for i in range(n):
+        nodes.append({
+            'node_id': i,
+            's_ms': round(random.uniform(0.51, 1.99), 2),
+            'r_node': round(random.uniform(0.95, 0.999), 4)
+        })
+    nodes_df = pd.DataFrame(nodes)
+
+    # 2. Bağlantı Verilerini Oluştur (EdgeData)
+    edges_df = _dense_edges(n, p) if n <= DENSE_MAX_NODES else _sparse_edges(n, p, seed)
+
     # Dosyaları Kaydet (network_manager.py'nin okuduğu isimler)
-    nodes_df.to_csv('BSM307_317_Guz2025_TermProject_NodeData(in).csv', index=False, sep=';')
-    edges_df.to_csv('BSM307_317_Guz2025_TermProject_EdgeData(in).csv', index=False, sep=';')
+    nodes_df.to_csv(os.path.join(output_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv'), index=False, sep=';')
+    edges_df.to_csv(os.path.join(output_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv'), index=False, sep=';')
     print(f"Ağ başarıyla oluşturuldu: {n} düğüm, {len(edges_df)//2} bağlantı.")
+    return nodes_df, edges_df
 
 if __name__ == "__main__":
-    generate_network()
\ No newline at end of file
+    generate_network()
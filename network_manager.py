@@ -2,11 +2,20 @@ import pandas as pd
 import networkx as nx
 import math
 import random
+import hashlib
+import numpy as np
 
 class NetworkManager:
     def __init__(self):
         self.G = nx.DiGraph()
         self.demands = []
+        self._topology_version = None  # Topoloji özeti (lazy hesaplanır, bkz. topology_version)
+        self._graph_arrays = None      # Dizi tabanlı graf temsili (lazy, bkz. get_graph_arrays)
+        self._ksp_cache = None         # K-en kısa yol önbelleği (lazy, bkz. get_ksp_cache)
+        self._hop_dist = {}            # Hedef -> {düğüm: hedefe hop mesafesi} (bkz. hop_distances_to)
+        self._cost_bounds = {}         # Ağırlık profili -> CostBounds (bkz. get_cost_bounds)
+        self._pareto = {}              # (src, dst, bw, kısıtlar) -> ParetoFront (bkz. get_pareto_front)
+        self._solution_archive = None  # Sıcak başlangıç yol arşivi (lazy, bkz. get_solution_archive)
 
     def safe_float(self, value):
         """Virgüllü sayıları (0,85) noktalı sayıya (0.85) çevirip float yapar."""
@@ -80,6 +89,7 @@ class NetworkManager:
                     bw_req = self.safe_float(row.iloc[2])
                     self.demands.append({'src': s, 'dst': d, 'bw': bw_req})
 
+            self.invalidate_topology()
             print(f"Veri Yüklendi: {len(self.G.nodes)} Düğüm, {len(self.G.edges)} Bağlantı.")
             return True
 
@@ -87,15 +97,139 @@ class NetworkManager:
             print(f"Veri Yükleme Hatası: {e}")
             return False
 
-    def calculate_path_cost(self, path, weights, requested_bw=0):
+    def invalidate_topology(self):
+        """Graf değiştiğinde çağrılır; topolojiye bağlı önbelleklerin anahtarını sıfırlar."""
+        self._topology_version = None
+        self._graph_arrays = None
+        self._ksp_cache = None
+        self._hop_dist = {}
+        self._cost_bounds = {}
+        self._pareto = {}
+        self._solution_archive = None
+
+    @staticmethod
+    def reliability_log_limit(min_reliability):
+        """Güvenilirlik tabanını -log uzayına çevirir (r >= taban  <=>  -log r <= limit)."""
+        if min_reliability is None or min_reliability <= 0:
+            return float('inf')
+        return -math.log(min_reliability)
+
+    def get_graph_arrays(self):
+        """Vektörleştirilmiş algoritmalar için grafın dizi temsilini (önbellekli) döndürür."""
+        if self._graph_arrays is None:
+            from algorithms.graph_arrays import GraphArrays
+            self._graph_arrays = GraphArrays(self.G)
+        return self._graph_arrays
+
+    def get_ksp_cache(self):
+        """(kaynak, hedef, BW kovası) bazlı K-en kısa yol önbelleğini döndürür."""
+        if self._ksp_cache is None:
+            from algorithms.ksp_cache import KShortestPathCache
+            self._ksp_cache = KShortestPathCache(self)
+        return self._ksp_cache
+
+    def get_solution_archive(self):
+        """Talep bazlı sıcak başlangıç yol arşivini (SolutionArchive) döndürür."""
+        if self._solution_archive is None:
+            from algorithms.solution_archive import SolutionArchive
+            self._solution_archive = SolutionArchive(self)
+        return self._solution_archive
+
+    def hop_distances_to(self, dst):
+        """
+        Her düğümden dst'ye en az sekme (hop) sayısını {düğüm: mesafe} olarak döndürür (önbellekli).
+        Ulaşamayan düğümler sözlükte yer almaz. Yol üreticileri bunu hop bütçesi budaması için kullanır.
+        """
+        if dst not in self._hop_dist:
+            if dst in self.G:
+                self._hop_dist[dst] = dict(nx.single_source_shortest_path_length(self.G.reverse(copy=False), dst))
+            else:
+                self._hop_dist[dst] = {}
+        return self._hop_dist[dst]
+
+    def get_cost_bounds(self, weights):
+        """
+        Ağırlık profili için kabul edilebilir maliyet alt sınırlarını (CostBounds) döndürür.
+        cost_to_go(hedef) ters Dijkstra ile hedef başına bir kez hesaplanır ve önbelleklenir.
+        """
+        key = tuple(round(float(w), 6) for w in weights)
+        if key not in self._cost_bounds:
+            from algorithms.bounds import CostBounds
+            if len(self._cost_bounds) >= 32:
+                self._cost_bounds.clear()
+            self._cost_bounds[key] = CostBounds(self.get_graph_arrays(), key)
+        return self._cost_bounds[key]
+
+    def get_qos_constraints(self, dst, max_delay=None, min_reliability=None, src=None):
+        """
+        Sert gecikme bütçesi / güvenilirlik tabanı için budama yardımcısını (QoSConstraints) döndürür.
+        Kısıt verilmemişse None döner (optimizasyon algoritmaları budamayı tamamen atlar).
+        src verilirse ve kaynaktan kısıtları sağlayan hiçbir yol olamayacağı alt sınırlardan
+        kesinse de None döner: budama her yürüyüşü öldürecektir, yollar sadece cezalandırılır.
+        """
+        if max_delay is None and min_reliability is None:
+            return None
+        from algorithms.bounds import QoSConstraints
+        qos = QoSConstraints(self, dst, max_delay, min_reliability)
+        if not qos.active or (src is not None and (src not in self.G or not qos.prefix_ok([src]))):
+            return None
+        return qos
+
+    def cost_lower_bounds(self, dst, weights, min_bw=0):
+        """
+        Her düğümden dst'ye giden en iyi yolun ağırlıklı maliyeti için alt sınır: {düğüm: sınır}.
+        Düğüm kaynak olarak alınır (kendi güvenilirlik terimi dahil); dst ve ulaşılamayanlar hariç.
+        """
+        ga = self.get_graph_arrays()
+        if dst not in ga.index:
+            return {}
+        bounds = self.get_cost_bounds(weights)
+        lb = bounds.src_cost + bounds.cost_to_go(ga.index[dst], min_bw)
+        return {n: float(lb[i]) for i, n in enumerate(ga.nodes) if n != dst and np.isfinite(lb[i])}
+
+    def get_pareto_front(self, src, dst, bw_demand=0, max_delay=None, min_reliability=None):
+        """
+        Talebin Pareto cephesini (ParetoFront) döndürür; yoksa NSGA-II ile bir kez hesaplanır.
+        Farklı ağırlık profilleri aynı cepheden front.best_for(weights) ile cevaplanır.
+        """
+        key = (src, dst, bw_demand, max_delay, min_reliability)
+        if key not in self._pareto:
+            from algorithms.ga import GeneticOptimizer
+            if len(self._pareto) >= 64:
+                self._pareto.clear()
+            optimizer = GeneticOptimizer(self, src, dst, bw_demand, max_delay, min_reliability)
+            self._pareto[key] = optimizer.solve_pareto()
+        return self._pareto[key]
+
+    def topology_version(self):
+        """
+        Graf yapısının ve kenar/düğüm özelliklerinin kısa özetini (hash) döndürür.
+        Topolojiye bağlı önbellekler (Q-tabloları vb.) bu değeri anahtar olarak kullanır;
+        içerik tabanlı olduğu için oturumlar arasında da kararlıdır.
+        """
+        if self._topology_version is None:
+            h = hashlib.sha1()
+            for n in sorted(self.G.nodes()):
+                d = self.G.nodes[n]
+                h.update(f"n{n}:{d.get('processing_delay')}:{d.get('reliability')};".encode())
+            for u, v in sorted(self.G.edges()):
+                d = self.G[u][v]
+                h.update(f"e{u},{v}:{d.get('delay')}:{d.get('bandwidth')}:{d.get('reliability')};".encode())
+            self._topology_version = h.hexdigest()[:16]
+        return self._topology_version
+
+    def path_objectives(self, path):
+        """
+        Yolun ağırlıklandırılmamış amaç değerlerini döndürür: ((gecikme, -log güvenilirlik, kaynak maliyeti), min_bw).
+        Çok amaçlı (Pareto) arama bu üçlüyü, calculate_path_cost ise ağırlıklı toplamını kullanır.
+        Geçersiz yol (2 düğümden kısa veya kenarı olmayan adım) için None döner.
+        """
         if not path or len(path) < 2:
-            return float('inf'), {}
+            return None
 
-        w_d, w_r, w_res = weights
         total_delay = 0       
         rel_cost_log = 0          
         res_cost = 0   
-        penalty = 0
 
         for node in path[1:-1]: 
             node_data = self.G.nodes[node]
@@ -110,7 +244,7 @@ class NetworkManager:
         min_path_bw = float('inf') 
         for i in range(len(path) - 1):
             u, v = path[i], path[i+1]
-            if not self.G.has_edge(u, v): return float('inf'), {}
+            if not self.G.has_edge(u, v): return None
             edge_data = self.G[u][v]
             bw = edge_data.get('bandwidth', 0.1) 
             if bw < min_path_bw: min_path_bw = bw
@@ -120,8 +254,29 @@ class NetworkManager:
             else: rel_cost_log += 100
             res_cost += (1000.0 / bw)
 
+        return (total_delay, rel_cost_log, res_cost), min_path_bw
+
+    def calculate_path_cost(self, path, weights, requested_bw=0, max_delay=None, min_reliability=None):
+        """
+        Yolun ağırlıklı maliyetini ve QoS metriklerini hesaplar.
+        Sert kısıtlar (bant genişliği, isteğe bağlı gecikme bütçesi max_delay [ms] ve
+        güvenilirlik tabanı min_reliability [0-1]) ihlal edilirse her ihlal için 1e6 ceza eklenir
+        ve 'is_feasible' False olur.
+        """
+        result = self.path_objectives(path)
+        if result is None:
+            return float('inf'), {}
+
+        w_d, w_r, w_res = weights
+        (total_delay, rel_cost_log, res_cost), min_path_bw = result
+        penalty = 0
+
         if requested_bw > 0 and min_path_bw < requested_bw:
             penalty = 1000000 
+        if max_delay is not None and total_delay > max_delay + 1e-9:
+            penalty += 1000000
+        if min_reliability is not None and rel_cost_log > self.reliability_log_limit(min_reliability) + 1e-12:
+            penalty += 1000000
 
         raw_cost = (w_d * total_delay) + (w_r * rel_cost_log) + (w_res * res_cost)
         total_cost = raw_cost + penalty
@@ -134,4 +289,4 @@ class NetworkManager:
             "total_cost": round(total_cost, 4),
             "is_feasible": penalty == 0
         }
-        return total_cost, metrics
\ No newline at end of file
+        return total_cost, metrics
@@ -0,0 +1,179 @@
+import math
+import numpy as np
+
+# Opsiyonel: SciPy varsa düğüm araması KD-ağacı ile yapılır (yoksa vektörel kaba kuvvet)
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+def segment_distances(px, py, x1, y1, x2, y2):
+    """dist_point_to_segment'in vektörel hâli: (px, py) noktasının segment dizilerine uzaklıkları."""
+    dx = x2 - x1
+    dy = y2 - y1
+    l2 = dx * dx + dy * dy
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = np.where(l2 > 0, ((px - x1) * dx + (py - y1) * dy) / l2, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    return np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+def segments_intersect_rect(seg, x0, y0, x1, y1):
+    """(m, 4) segment dizisinin [x0, x1] x [y0, y1] dikdörtgeniyle kesişip kesişmediği (Liang-Barsky, vektörel)."""
+    t_enter = np.zeros(len(seg))
+    t_exit = np.ones(len(seg))
+    for a, b, lo, hi in ((seg[:, 0], seg[:, 2], x0, x1), (seg[:, 1], seg[:, 3], y0, y1)):
+        d = b - a
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ta = (lo - a) / d
+            tb = (hi - a) / d
+        # Eksene paralel segment: başlangıç bandın içindeyse her t uygun, değilse hiçbiri
+        inside = (a >= lo) & (a <= hi)
+        t_lo = np.where(d == 0, np.where(inside, -np.inf, np.inf), np.minimum(ta, tb))
+        t_hi = np.where(d == 0, np.where(inside, np.inf, -np.inf), np.maximum(ta, tb))
+        t_enter = np.maximum(t_enter, t_lo)
+        t_exit = np.minimum(t_exit, t_hi)
+    return t_enter <= t_exit
+
+
+class GraphSpatialIndex:
+    """
+    Graf yerleşimi üzerinde fare yakalama (hit-test) için uzamsal indeks; yerleşim başına bir kez kurulur.
+
+    - Düğümler: KD-ağacı (SciPy yoksa koordinat dizisi üzerinde vektörel arama).
+    - Kenarlar: düzgün ızgara. Her segment üzerinde hücre boyunun yarısı aralıkla örnek noktalar
+      alınır ve bu noktaların düştüğü hücrelere kaydedilir; hücre -> kenar listesi CSR biçiminde
+      (sıralı dizi + başlangıç ofsetleri) tutulur. Segmentin her noktası bir örneğe en fazla
+      hücre/4 uzaklıkta olduğundan, sorguda aralık bir hücre genişletilerek hiçbir kenar kaçırılmaz.
+
+    Böylece her fare hareketi tüm düğüm/kenarları dolaşmak yerine sadece yakındaki adayları inceler.
+    """
+
+    def __init__(self, pos, edges, grid_size=64, chunk_edges=20000):
+        """
+        Args:
+            pos (dict): düğüm -> (x, y).
+            edges (list): (u, v) ikilileri; iki ucu da pos'ta olmayanlar atlanır.
+            grid_size (int): Izgaranın uzun kenardaki hücre sayısı.
+            chunk_edges (int): Kurulumda bellek sınırı için bir seferde işlenecek kenar sayısı.
+        """
+        self.nodes = list(pos.keys())
+        self.node_xy = np.array([pos[n] for n in self.nodes], dtype=float).reshape(-1, 2)
+        self._tree = cKDTree(self.node_xy) if SCIPY_AVAILABLE and len(self.nodes) else None
+
+        index = {n: i for i, n in enumerate(self.nodes)}
+        self.edges = [(u, v) for u, v in edges if u in index and v in index]
+        m = len(self.edges)
+        ends = np.array([(index[u], index[v]) for u, v in self.edges], dtype=np.int64).reshape(m, 2)
+        self.seg = np.hstack([self.node_xy[ends[:, 0]], self.node_xy[ends[:, 1]]])
+
+        pts = np.vstack([self.node_xy, self.seg[:, :2], self.seg[:, 2:]]) if (m or len(self.nodes)) else np.zeros((1, 2))
+        self.origin = pts.min(axis=0)
+        extent = max(float((pts.max(axis=0) - self.origin).max()), 1e-9)
+        self.extent = extent
+        self.cell = extent / grid_size
+        self.shape = (int(math.floor(extent / self.cell)) + 1,) * 2
+        self._density = {}
+        self._build_grid(chunk_edges)
+
+    def _cell_of(self, x, y):
+        cx = np.clip(np.floor((x - self.origin[0]) / self.cell).astype(np.int64), 0, self.shape[0] - 1)
+        cy = np.clip(np.floor((y - self.origin[1]) / self.cell).astype(np.int64), 0, self.shape[1] - 1)
+        return cx, cy
+
+    def _sample_segments(self, step, chunk_edges):
+        """
+        Segmentleri en fazla step aralıklı noktalarla örnekler; parça parça (eid, x, y, ağırlık) döndürür.
+        Ağırlık: segment uzunluğu / örnek sayısı (yoğunluk görüntüsünde piksel başına kenar uzunluğu).
+        """
+        for start in range(0, len(self.edges), chunk_edges):
+            seg = self.seg[start:start + chunk_edges]
+            length = np.hypot(seg[:, 2] - seg[:, 0], seg[:, 3] - seg[:, 1])
+            counts = np.ceil(length / step).astype(np.int64) + 1
+            eid = np.repeat(np.arange(start, start + len(seg)), counts)
+            # Her segment için 0..1 arası eşit aralıklı parametreler
+            offsets = np.cumsum(counts) - counts
+            k = np.arange(counts.sum()) - np.repeat(offsets, counts)
+            t = k / np.maximum(np.repeat(counts, counts) - 1, 1)
+            s = self.seg[eid]
+            yield (eid, s[:, 0] + t * (s[:, 2] - s[:, 0]), s[:, 1] + t * (s[:, 3] - s[:, 1]),
+                   np.repeat(length / counts, counts))
+
+    def _build_grid(self, chunk_edges):
+        n_cells = self.shape[0] * self.shape[1]
+        pairs = []
+        for eid, x, y, _ in self._sample_segments(self.cell / 2, chunk_edges):
+            cx, cy = self._cell_of(x, y)
+            pairs.append((cx * self.shape[1] + cy) * len(self.edges) + eid)
+        keys = np.sort(np.concatenate(pairs)) if pairs else np.zeros(0, dtype=np.int64)
+        # Aynı hücreye düşen örnekler tek kayda indirilir (np.unique'ten hızlı: zaten sıralı)
+        keys = keys[np.concatenate(([True], np.diff(keys) != 0))] if keys.size else keys
+        m = max(len(self.edges), 1)
+        cell_ids = keys // m
+        self.cell_edges = keys % m                      # Hücreye göre sıralı kenar indeksleri
+        self.cell_start = np.searchsorted(cell_ids, np.arange(n_cells + 1))
+
+    def _edges_in_cells(self, x0, y0, x1, y1):
+        """[x0, x1] x [y0, y1] dikdörtgenine (bir hücre genişletilmiş) değen hücrelerdeki kenar indeksleri (tekrarlı olabilir)."""
+        (cx0, cx1), (cy0, cy1) = self._cell_of(np.array([x0, x1]), np.array([y0, y1]))
+        cx0, cy0 = max(cx0 - 1, 0), max(cy0 - 1, 0)
+        cx1, cy1 = min(cx1 + 1, self.shape[0] - 1), min(cy1 + 1, self.shape[1] - 1)
+        chunks = []
+        for cx in range(cx0, cx1 + 1):
+            base = cx * self.shape[1]
+            # Aynı sütundaki ardışık hücreler CSR dizisinde bitişiktir
+            chunks.append(self.cell_edges[self.cell_start[base + cy0]:self.cell_start[base + cy1 + 1]])
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int64)
+
+    def nearest_node(self, x, y, radius):
+        """(x, y)'ye radius'tan yakın en yakın düğüm (yoksa None)."""
+        if not self.nodes:
+            return None
+        if self._tree is not None:
+            d, i = self._tree.query((x, y), distance_upper_bound=radius)
+            return self.nodes[i] if d < radius else None
+        d = np.hypot(self.node_xy[:, 0] - x, self.node_xy[:, 1] - y)
+        i = int(np.argmin(d))
+        return self.nodes[i] if d[i] < radius else None
+
+    def nearest_edge(self, x, y, radius):
+        """(x, y)'ye radius'tan yakın en yakın kenar (u, v) (yoksa None). Eşitlikte kenar sırası korunur."""
+        if not self.edges:
+            return None
+        cand = np.unique(self._edges_in_cells(x - radius, y - radius, x + radius, y + radius))
+        if cand.size == 0:
+            return None
+        s = self.seg[cand]
+        d = segment_distances(x, y, s[:, 0], s[:, 1], s[:, 2], s[:, 3])
+        i = int(np.argmin(d))
+        return self.edges[cand[i]] if d[i] < radius else None
+
+    def edges_in_rect(self, x0, y0, x1, y1):
+        """[x0, x1] x [y0, y1] dikdörtgeniyle kesişen kenarların indeksleri (sıralı)."""
+        if x0 <= self.origin[0] and y0 <= self.origin[1] and x1 >= self.origin[0] + self.extent and y1 >= self.origin[1] + self.extent:
+            return np.arange(len(self.edges))    # Görünüm tüm grafı kapsıyor
+        # Tekrarları atmak için np.unique (sıralama) yerine kenar sayısı boyunda maske
+        mask = np.zeros(len(self.edges), dtype=bool)
+        mask[self._edges_in_cells(x0, y0, x1, y1)] = True
+        cand = np.flatnonzero(mask)
+        return cand[segments_intersect_rect(self.seg[cand], x0, y0, x1, y1)]
+
+    def edge_density(self, resolution=256, chunk_edges=20000):
+        """
+        Kenar yoğunluğu görüntüsü (uzaktan görünüm için): her pikseldeki toplam kenar uzunluğu.
+
+        Returns:
+            tuple: (image, extent) - image (resolution, resolution) dizisi [satır = y, sütun = x],
+                   extent imshow için (x0, x1, y0, y1). Sonuç çözünürlük başına önbelleklenir.
+        """
+        if resolution not in self._density:
+            pixel = self.extent / resolution
+            image = np.zeros(resolution * resolution)
+            for _, x, y, w in self._sample_segments(pixel / 2, chunk_edges):
+                px = np.clip(((x - self.origin[0]) / pixel).astype(np.int64), 0, resolution - 1)
+                py = np.clip(((y - self.origin[1]) / pixel).astype(np.int64), 0, resolution - 1)
+                image += np.bincount(py * resolution + px, weights=w, minlength=resolution * resolution)
+            x0, y0 = self.origin
+            self._density[resolution] = (image.reshape(resolution, resolution),
+                                         (x0, x0 + self.extent, y0, y0 + self.extent))
+        return self._density[resolution]
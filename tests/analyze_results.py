@@ -1,17 +1,18 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 
 # 1. Veriyi Yükle (Load Data)
 file_path = "Final_Project_Benchmark_Results.csv"
+scaling_path = "Scaling_Benchmark_Results.csv"   # tests/benchmark_scaling.py çıktısı
+solves_path = "Final_Project_Benchmark_Solves.csv"   # benchmark_runner.py: çözüm başına süreler
 
-if not os.path.exists(file_path):
+if not os.path.exists(file_path) and not os.path.exists(scaling_path):
     print(f"Hata: '{file_path}' dosyası bulunamadı. Lütfen benchmark kodunu çalıştırın.")
     exit()
 
-df = pd.read_csv(file_path, sep=';')
-
 # Stil ayarları (Görsellik için)
 sns.set_theme(style="whitegrid")
 plt.rcParams.update({'font.size': 12})
@@ -28,62 +29,161 @@ def save_plot(filename):
     print(f"Grafik kaydedildi: {path}")
     plt.close()
 
-# --- GRAFİK 1: Ortalama Maliyet Karşılaştırması (Mean Cost Comparison) ---
-# DÜZELTME: Logaritmik ölçek (Log Scale) kullanıldı çünkü GeneticAlgo değerleri çok yüksek.
-plt.figure(figsize=(12, 6))
-sns.barplot(data=df, x="Weight_Profile", y="Mean_Cost", hue="Algorithm", palette="viridis")
-plt.title("Ağırlık Senaryolarına Göre Ortalama Maliyet (Mean Cost)", fontsize=16)
-plt.ylabel("Ortalama Maliyet (Log Scale)") # Etiketi güncelledik
-plt.yscale('log') # <-- Logaritmik ölçek eklendi
-plt.xlabel("Senaryo")
-plt.legend(title="Algoritma")
-save_plot("comparison_mean_cost.png")
-
-# --- GRAFİK 2: Çalışma Süresi Karşılaştırması (Execution Time Comparison) ---
-plt.figure(figsize=(12, 6))
-sns.barplot(data=df, x="Weight_Profile", y="Avg_Time", hue="Algorithm", palette="rocket")
-plt.title("Algoritmaların Çalışma Süresi Karşılaştırması (Saniye)", fontsize=16)
-plt.ylabel("Ortalama Süre (sn)")
-plt.xlabel("Senaryo")
-plt.legend(title="Algoritma")
-save_plot("comparison_execution_time.png")
-
-# --- GRAFİK 3: Başarı Oranı (Success Rate) ---
-plt.figure(figsize=(10, 6))
-success_df = df.groupby(['Algorithm', 'Weight_Profile'])['Success_Rate'].mean().reset_index()
-sns.barplot(data=success_df, x="Algorithm", y="Success_Rate", hue="Weight_Profile", palette="Blues_d")
-plt.title("Algoritmaların Başarı Oranları (%)", fontsize=16)
-plt.ylabel("Başarı Oranı (%)")
-plt.ylim(0, 110) 
-save_plot("comparison_success_rate.png")
-
-# --- GRAFİK 4: Gecikme vs Maliyet (Scatter Plot) ---
-valid_df = df[df['Mean_Cost'] < float('inf')]
-plt.figure(figsize=(12, 7))
-sns.scatterplot(data=valid_df, x="Mean_Delay", y="Mean_Cost", hue="Algorithm", style="Weight_Profile", s=100)
-plt.title("Maliyet ve Gecikme İlişkisi (Cost vs Delay)", fontsize=16)
-plt.xlabel("Ortalama Gecikme (Mean Delay)")
-plt.ylabel("Ortalama Maliyet (Mean Cost)")
-# İstersen buraya da log scale ekleyebilirsin ama scatter plot'ta genelde orjinal halini görmek daha iyidir.
-save_plot("scatter_cost_vs_delay.png")
-
-# --- GRAFİK 5: Ortalama Güvenilirlik Karşılaştırması (Mean Reliability Comparison) ---
-plt.figure(figsize=(12, 6))
-sns.barplot(data=df, x="Weight_Profile", y="Mean_Reliability", hue="Algorithm", palette="magma")
-plt.title("Ağırlık Senaryolarına Göre Ortalama Güvenilirlik", fontsize=16)
-plt.ylabel("Ortalama Güvenilirlik")
-plt.xlabel("Senaryo")
-plt.legend(title="Algoritma")
-save_plot("comparison_reliability.png")
-
-# --- GRAFİK 6: Ortalama Kaynak Maliyeti Karşılaştırması (Mean Resource Cost Comparison) ---
-plt.figure(figsize=(12, 6))
-sns.barplot(data=df, x="Weight_Profile", y="Mean_Resource_Cost", hue="Algorithm", palette="coolwarm")
-plt.title("Ağırlık Senaryolarına Göre Ortalama Kaynak Maliyeti", fontsize=16)
-plt.ylabel("Ortalama Kaynak Maliyeti")
-plt.xlabel("Senaryo")
-plt.legend(title="Algoritma")
-save_plot("comparison_resource_cost.png")
+def fit_exponent(x, y):
+    """log-log doğrusal uydurma: y ~ x^k ise k (ampirik ölçeklenme üssü)."""
+    ok = (x > 0) & (y > 0)
+    if ok.sum() < 2 or x[ok].nunique() < 2:
+        return float('nan')
+    return np.polyfit(np.log(x[ok]), np.log(y[ok]), 1)[0]
+
+def plot_scaling(sdf):
+    """Ölçeklenebilirlik grafikleri (log-log): süre, bellek ve değerlendirme hızı düğüm sayısına göre."""
+    # Topoloji x algoritma başına medyan (talepler üzerinden)
+    agg = sdf.groupby(["Nodes", "Avg_Degree", "Algorithm"]).agg(
+        Runtime_s=("Runtime_s", "median"), Peak_Mem_MB=("Peak_Mem_MB", "first"),
+        Evals_per_s=("Evals_per_s", "median"), Gap_pct=("Gap_pct", "median")).reset_index()
+    agg["Yoğunluk"] = "derece " + agg["Avg_Degree"].astype(str)
+
+    metrics = [
+        ("Runtime_s", "Çözüm Süresi (sn)", "scaling_runtime.png"),
+        ("Peak_Mem_MB", "Çözüm Başına Tepe Bellek (MB)", "scaling_peak_memory.png"),
+        ("Evals_per_s", "Yol Değerlendirme / sn", "scaling_evals_per_s.png"),
+    ]
+    for col, label, filename in metrics:
+        data = agg.dropna(subset=[col])
+        if data.empty:
+            continue
+        plt.figure(figsize=(12, 7))
+        sns.lineplot(data=data, x="Nodes", y=col, hue="Algorithm", style="Yoğunluk", markers=True, dashes=True)
+        plt.xscale('log'); plt.yscale('log')
+        plt.title(f"Ölçeklenebilirlik: {label} (log-log)", fontsize=16)
+        plt.xlabel("Düğüm Sayısı (log)")
+        plt.ylabel(f"{label} (log)")
+        plt.legend(title="Algoritma / Yoğunluk", fontsize=9)
+        save_plot(filename)
+
+    # Çözüm kalitesi: A* referansına göre fark (%) - negatif olmaz, sıfır optimum demektir
+    data = agg.dropna(subset=["Gap_pct"])
+    if not data.empty:
+        plt.figure(figsize=(12, 7))
+        sns.lineplot(data=data, x="Nodes", y="Gap_pct", hue="Algorithm", style="Yoğunluk", markers=True)
+        plt.xscale('log')
+        plt.title("Ölçeklenebilirlik: Kesin Çözüme Göre Maliyet Farkı (%)", fontsize=16)
+        plt.xlabel("Düğüm Sayısı (log)")
+        plt.ylabel("Medyan Fark (%)")
+        save_plot("scaling_quality_gap.png")
+
+    # Ampirik ölçeklenme üssü: süre ~ n^k (yoğunluk başına)
+    exps = agg.groupby(["Algorithm", "Avg_Degree"]).apply(
+        lambda g: fit_exponent(g["Nodes"], g["Runtime_s"])).rename("Runtime_Exponent").reset_index()
+    print("\nAmpirik ölçeklenme üsleri (Çözüm Süresi ~ n^k):")
+    print(exps.round(2).to_string(index=False))
+    exps.round(3).to_csv(os.path.join(output_dir, "scaling_exponents.csv"), sep=';', index=False)
+
+def plot_latency(solves, df):
+    """Kuyruk gecikmesi (p50/p95/p99), süre dağılımı, CPU/duvar süresi ve tepe bellek grafikleri."""
+    # --- Gecikme histogramı (log ölçek: algoritmalar arasında süreler büyüklük mertebesi farklı) ---
+    plt.figure(figsize=(12, 7))
+    sns.histplot(data=solves, x="Wall_Time", hue="Algorithm", log_scale=True, element="step", bins=40)
+    plt.title("Çözüm Süresi Dağılımı (Tüm Çözümler)", fontsize=16)
+    plt.xlabel("Süre (sn, log)")
+    plt.ylabel("Çözüm Sayısı")
+    save_plot("latency_histogram.png")
+
+    # --- Yüzdelikler: p50 / p95 / p99 ---
+    pct = solves.groupby("Algorithm")["Wall_Time"].quantile([0.50, 0.95, 0.99]).rename("Süre").reset_index()
+    pct["Yüzdelik"] = pct["level_1"].map(lambda q: f"p{round(q * 100)}")
+    plt.figure(figsize=(12, 6))
+    sns.barplot(data=pct, x="Algorithm", y="Süre", hue="Yüzdelik", palette="flare")
+    plt.title("Kuyruk Gecikmesi: p50 / p95 / p99 (Saniye)", fontsize=16)
+    plt.ylabel("Süre (sn)")
+    plt.xlabel("Algoritma")
+    save_plot("latency_percentiles.png")
+
+    # --- CPU süresi vs duvar süresi (köşegenin altı: bekleme, üstü: ek iş parçacıkları) ---
+    plt.figure(figsize=(10, 8))
+    sns.scatterplot(data=solves, x="Wall_Time", y="CPU_Time", hue="Algorithm", style="Weight_Profile", alpha=0.7)
+    lim = max(solves["Wall_Time"].max(), solves["CPU_Time"].max())
+    plt.plot([0, lim], [0, lim], "k--", linewidth=1)
+    plt.title("CPU Süresi vs Duvar Süresi (Çözüm Başına)", fontsize=16)
+    plt.xlabel("Duvar Süresi (sn)")
+    plt.ylabel("CPU Süresi (sn)")
+    save_plot("latency_cpu_vs_wall.png")
+
+    # --- Çözüm başına tepe bellek ---
+    if df is not None and "Peak_Mem_MB" in df and df["Peak_Mem_MB"].notna().any():
+        plt.figure(figsize=(12, 6))
+        sns.boxplot(data=df, x="Algorithm", y="Peak_Mem_MB", hue="Weight_Profile", palette="crest")
+        plt.title("Çözüm Başına Tepe Bellek Kullanımı (tracemalloc)", fontsize=16)
+        plt.ylabel("Tepe Bellek (MB)")
+        plt.xlabel("Algoritma")
+        save_plot("peak_memory_per_solve.png")
+
+if os.path.exists(file_path):
+    df = pd.read_csv(file_path, sep=';')
+
+    # --- GRAFİK 1: Ortalama Maliyet Karşılaştırması (Mean Cost Comparison) ---
+    # DÜZELTME: Logaritmik ölçek (Log Scale) kullanıldı çünkü GeneticAlgo değerleri çok yüksek.
+    plt.figure(figsize=(12, 6))
+    sns.barplot(data=df, x="Weight_Profile", y="Mean_Cost", hue="Algorithm", palette="viridis")
+    plt.title("Ağırlık Senaryolarına Göre Ortalama Maliyet (Mean Cost)", fontsize=16)
+    plt.ylabel("Ortalama Maliyet (Log Scale)") # Etiketi güncelledik
+    plt.yscale('log') # <-- Logaritmik ölçek eklendi
+    plt.xlabel("Senaryo")
+    plt.legend(title="Algoritma")
+    save_plot("comparison_mean_cost.png")
+
+    # --- GRAFİK 2: Çalışma Süresi Karşılaştırması (Execution Time Comparison) ---
+    plt.figure(figsize=(12, 6))
+    sns.barplot(data=df, x="Weight_Profile", y="Avg_Time", hue="Algorithm", palette="rocket")
+    plt.title("Algoritmaların Çalışma Süresi Karşılaştırması (Saniye)", fontsize=16)
+    plt.ylabel("Ortalama Süre (sn)")
+    plt.xlabel("Senaryo")
+    plt.legend(title="Algoritma")
+    save_plot("comparison_execution_time.png")
+
+    # --- GRAFİK 3: Başarı Oranı (Success Rate) ---
+    plt.figure(figsize=(10, 6))
+    success_df = df.groupby(['Algorithm', 'Weight_Profile'])['Success_Rate'].mean().reset_index()
+    sns.barplot(data=success_df, x="Algorithm", y="Success_Rate", hue="Weight_Profile", palette="Blues_d")
+    plt.title("Algoritmaların Başarı Oranları (%)", fontsize=16)
+    plt.ylabel("Başarı Oranı (%)")
+    plt.ylim(0, 110) 
+    save_plot("comparison_success_rate.png")
+
+    # --- GRAFİK 4: Gecikme vs Maliyet (Scatter Plot) ---
+    valid_df = df[df['Mean_Cost'] < float('inf')]
+    plt.figure(figsize=(12, 7))
+    sns.scatterplot(data=valid_df, x="Mean_Delay", y="Mean_Cost", hue="Algorithm", style="Weight_Profile", s=100)
+    plt.title("Maliyet ve Gecikme İlişkisi (Cost vs Delay)", fontsize=16)
+    plt.xlabel("Ortalama Gecikme (Mean Delay)")
+    plt.ylabel("Ortalama Maliyet (Mean Cost)")
+    # İstersen buraya da log scale ekleyebilirsin ama scatter plot'ta genelde orjinal halini görmek daha iyidir.
+    save_plot("scatter_cost_vs_delay.png")
+
+    # --- GRAFİK 5: Ortalama Güvenilirlik Karşılaştırması (Mean Reliability Comparison) ---
+    plt.figure(figsize=(12, 6))
+    sns.barplot(data=df, x="Weight_Profile", y="Mean_Reliability", hue="Algorithm", palette="magma")
+    plt.title("Ağırlık Senaryolarına Göre Ortalama Güvenilirlik", fontsize=16)
+    plt.ylabel("Ortalama Güvenilirlik")
+    plt.xlabel("Senaryo")
+    plt.legend(title="Algoritma")
+    save_plot("comparison_reliability.png")
+
+    # --- GRAFİK 6: Ortalama Kaynak Maliyeti Karşılaştırması (Mean Resource Cost Comparison) ---
+    plt.figure(figsize=(12, 6))
+    sns.barplot(data=df, x="Weight_Profile", y="Mean_Resource_Cost", hue="Algorithm", palette="coolwarm")
+    plt.title("Ağırlık Senaryolarına Göre Ortalama Kaynak Maliyeti", fontsize=16)
+    plt.ylabel("Ortalama Kaynak Maliyeti")
+    plt.xlabel("Senaryo")
+    plt.legend(title="Algoritma")
+    save_plot("comparison_resource_cost.png")
+
+if os.path.exists(solves_path):
+    plot_latency(pd.read_csv(solves_path, sep=';'), df if os.path.exists(file_path) else None)
+
+if os.path.exists(scaling_path):
+    plot_scaling(pd.read_csv(scaling_path, sep=';'))
 
 print("\n--- Analiz Tamamlandı ---")
 print(f"Tüm grafikler '{output_dir}' klasörüne kaydedildi.")
\ No newline at end of file
@@ -0,0 +1,79 @@
+import pandas as pd
+import time
+import sys
+import os
+from concurrent.futures import as_completed
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.batch import BATCH_OPTIMIZERS, solve_task, task_seed
+from algorithms.parallel import make_pool
+
+# Wall-clock time of the GUI batch test (demands x algorithms x repetitions)
+# run serially vs. on a process pool, as BatchTestWorker does. Tasks carry
+# their own seeds, so both runs solve exactly the same problems and must
+# report the same costs.
+
+REPETITIONS = 2
+WEIGHTS = (0.33, 0.33, 0.34)
+
+def run(manager, tasks, processes):
+    start = time.perf_counter()
+    if processes <= 1:
+        results = [solve_task(task, manager) for task in tasks]
+    else:
+        pool = make_pool(manager, processes)
+        try:
+            futures = [pool.submit(solve_task, task) for task in tasks]
+            results = [f.result() for f in as_completed(futures)]
+        finally:
+            pool.shutdown()
+    return time.perf_counter() - start, results
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    tasks = [((i, algo, r), algo, d['src'], d['dst'], d['bw'], WEIGHTS, task_seed(i, algo, r))
+             for i, d in enumerate(manager.demands)
+             for algo in BATCH_OPTIMIZERS
+             for r in range(REPETITIONS)]
+    print(f"{len(tasks)} solves, {os.cpu_count()} CPU(s)")
+
+    cpus = os.cpu_count() or 1
+    rows = []
+    reference = None
+    for processes in sorted({1, 2, cpus}):
+        duration, results = run(manager, tasks, processes)
+        costs = {key: round(cost, 6) for key, _, cost, _ in results}
+        if reference is None:
+            reference = costs
+        rows.append({
+            "Processes": processes,
+            "Wall_Time_s": duration,
+            "Solves_per_s": len(tasks) / duration,
+            "Speedup": rows[0]["Wall_Time_s"] / duration if rows else 1.0,
+            "Same_Costs": costs == reference
+        })
+        print(f"  {processes} process(es) done")
+
+    df = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print(df.round(3).to_string(index=False))
+
+    output_file = "Batch_Parallel_Benchmark_Results.csv"
+    df.round(3).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,113 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ga import GeneticOptimizer
+from algorithms.sa import SAOptimizer
+from algorithms.abc_alg import ABCOptimizer
+from algorithms.exact import ExactOptimizer
+from benchmark_scaling import EvaluationCounter
+
+# Hard QoS constraints: how many path evaluations does constraint-aware pruning
+# save? Every optimizer solves the same constrained demands twice:
+#   - Pruned: the default, partial paths that cannot meet the delay budget or
+#     the reliability floor are dropped during the search
+#   - Scored: pruning disabled, infeasible paths are only penalised (1e6) when
+#     they are evaluated
+# Path evaluations are counted through the manager (scalar and vectorized).
+# The RCSP exact search (A* with delay/reliability labels) gives the
+# constrained optimum for the gap.
+
+WEIGHTS = (0.33, 0.33, 0.34)
+CONSTRAINTS = [
+    ("Delay<40", {"max_delay": 40.0}),
+    ("Rel>0.9", {"min_reliability": 0.9}),
+    ("Delay<40_Rel>0.9", {"max_delay": 40.0, "min_reliability": 0.9}),
+]
+REPETITIONS = 3
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    algorithms = [
+        ("GeneticAlgo", GeneticOptimizer),
+        ("SimulatedAnnealing", SAOptimizer),
+        ("ArtBeeColony", ABCOptimizer)
+    ]
+    test_cases = manager.demands[:10]
+    counter = EvaluationCounter(manager)
+
+    rows = []
+    for c_name, limits in CONSTRAINTS:
+        print(f"\n>>> Constraints: {c_name}")
+        for idx, demand in enumerate(test_cases):
+            src, dst, bw = demand['src'], demand['dst'], demand['bw']
+            path, ref_cost, metrics = ExactOptimizer(manager, src, dst, bw, **limits).solve(WEIGHTS)
+            if metrics.get('budget_exhausted'):
+                print(f"  Case {idx + 1}: exact search ran out of its expansion budget, no reference gap")
+            ref_cost = ref_cost if path and metrics.get('is_feasible') else np.nan
+
+            for algo_name, AlgoClass in algorithms:
+                for mode in ("Pruned", "Scored"):
+                    for rep in range(REPETITIONS):
+                        random.seed(idx * 100 + rep)
+                        optimizer = AlgoClass(manager, src, dst, bw, **limits)
+                        if mode == "Scored":
+                            optimizer._qos = None
+                        counter.count = 0
+                        start = time.perf_counter()
+                        path, cost, metrics = optimizer.solve(WEIGHTS)
+                        duration = time.perf_counter() - start
+                        feasible = bool(path) and metrics.get('is_feasible', False)
+                        rows.append({
+                            "Constraints": c_name,
+                            "Algorithm": algo_name,
+                            "Mode": mode,
+                            "Case_ID": idx + 1,
+                            "Rep": rep + 1,
+                            "Evaluations": counter.count,
+                            "Feasible": feasible,
+                            "Gap_pct": (cost - ref_cost) / ref_cost * 100 if feasible else np.nan,
+                            "Time": duration
+                        })
+            print(f"  Case {idx + 1}/{len(test_cases)} done")
+
+    df = pd.DataFrame(rows)
+    summary = df.groupby(["Constraints", "Algorithm", "Mode"]).agg(
+        Mean_Evaluations=("Evaluations", "mean"),
+        Feasible_Rate=("Feasible", "mean"),
+        Median_Gap_pct=("Gap_pct", "median"),
+        Mean_Time=("Time", "mean"),
+    ).reset_index()
+    # Evaluations saved by pruning, relative to the scoring-only run of the same algorithm
+    scored = summary[summary["Mode"] == "Scored"].set_index(["Constraints", "Algorithm"])["Mean_Evaluations"]
+    summary["Eval_Reduction_pct"] = [
+        (1 - row.Mean_Evaluations / scored[row.Constraints, row.Algorithm]) * 100
+        for row in summary.itertuples()
+    ]
+
+    print("\n" + "=" * 80)
+    print(summary.round(3).to_string(index=False))
+
+    output_file = "Constraint_Pruning_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,102 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ga import GeneticOptimizer
+
+# Compares the island-model GA against the single-population GA at equal
+# wall-clock budgets. The single population is restarted until the budget is
+# spent (keeping the best run), so both sides use the whole budget.
+# Costs are re-evaluated with calculate_path_cost (the GA fitness carries noise).
+
+def run_single(manager, demand, weights, budget):
+    best_cost, best_path = float('inf'), None
+    deadline = time.perf_counter() + budget
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        optimizer = GeneticOptimizer(manager, demand['src'], demand['dst'], demand['bw'])
+        optimizer.time_limit = remaining
+        path, _, _ = optimizer.solve(weights)
+        if path:
+            cost, _ = manager.calculate_path_cost(path, weights, demand['bw'])
+            if cost < best_cost:
+                best_cost, best_path = cost, path
+    return best_cost, best_path
+
+def run_islands(manager, demand, weights, budget, n_islands, processes):
+    optimizer = GeneticOptimizer(manager, demand['src'], demand['dst'], demand['bw'])
+    optimizer.n_islands = n_islands
+    optimizer.max_generations = 10000    # the time budget is the stopping rule
+    optimizer.time_limit = budget
+    path, _, _ = optimizer.solve_islands(weights, processes=processes)
+    if not path:
+        return float('inf'), None
+    cost, _ = manager.calculate_path_cost(path, weights, demand['bw'])
+    return cost, path
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    weights = [0.33, 0.33, 0.34]
+    budgets = [0.5, 1.0, 2.0]           # seconds per solve
+    n_islands = os.cpu_count() or 1
+    test_cases = manager.demands[:10]
+    REPETITIONS = 3
+
+    print(f"Islands: {n_islands} (one per core)")
+    rows = []
+    for budget in budgets:
+        for idx, demand in enumerate(test_cases):
+            for rep in range(REPETITIONS):
+                for mode in ("Single", "Islands"):
+                    random.seed(1000 * idx + rep)
+                    start = time.perf_counter()
+                    if mode == "Single":
+                        cost, path = run_single(manager, demand, weights, budget)
+                    else:
+                        cost, path = run_islands(manager, demand, weights, budget, n_islands, processes=n_islands)
+                    rows.append({
+                        "Mode": mode,
+                        "Budget_s": budget,
+                        "Case_ID": idx + 1,
+                        "Rep": rep + 1,
+                        "Cost": cost if path else np.nan,
+                        "Time": time.perf_counter() - start
+                    })
+        print(f"  budget={budget}s done")
+
+    df = pd.DataFrame(rows)
+    summary = df.groupby(["Budget_s", "Mode"]).agg(
+        Mean_Cost=("Cost", "mean"),
+        Std_Dev=("Cost", "std"),
+        Best_Cost=("Cost", "min"),
+        Mean_Time=("Time", "mean"),
+    ).reset_index()
+
+    print("\n" + "=" * 80)
+    print(summary.round(4).to_string(index=False))
+
+    output_file = "GA_Islands_Benchmark_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,120 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import math
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from the project modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from graph_layout import compute_layout
+from spatial_index import GraphSpatialIndex
+
+# Measures GraphCanvas hover hit-testing throughput (events per second):
+# the original per-event scan over every node and edge vs. GraphSpatialIndex
+# (KD-tree for nodes, uniform grid for edge segments). Both use the GUI's hit
+# radii and must agree on the hovered node/edge for every event.
+
+NODE_RADIUS = 0.08
+EDGE_RADIUS = 0.05
+N_EVENTS = 300
+
+def dist_point_to_segment(px, py, x1, y1, x2, y2):
+    # Same helper as GUI.py (copied so the benchmark does not need Qt)
+    l2 = (x1 - x2)**2 + (y1 - y2)**2
+    if l2 == 0: return math.hypot(px - x1, py - y1)
+    t = ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / l2
+    t = max(0, min(1, t))
+    return math.hypot(px - (x1 + t * (x2 - x1)), py - (y1 + t * (y2 - y1)))
+
+def linear_hit(G, pos, x, y):
+    closest_node, min_d = None, NODE_RADIUS
+    for n, (nx_, ny_) in pos.items():
+        if abs(nx_ - x) > min_d or abs(ny_ - y) > min_d:
+            continue
+        d = math.hypot(x - nx_, y - ny_)
+        if d < min_d:
+            min_d, closest_node = d, n
+    if closest_node is not None:
+        return closest_node, None
+    closest_edge, min_d = None, EDGE_RADIUS
+    for u, v in G.edges():
+        x1, y1 = pos[u]
+        x2, y2 = pos[v]
+        margin = 0.1
+        if not (min(x1, x2) - margin < x < max(x1, x2) + margin and
+                min(y1, y2) - margin < y < max(y1, y2) + margin):
+            continue
+        d = dist_point_to_segment(x, y, x1, y1, x2, y2)
+        if d < min_d:
+            min_d, closest_edge = d, (u, v)
+    return None, closest_edge
+
+def indexed_hit(index, x, y):
+    node = index.nearest_node(x, y, NODE_RADIUS)
+    if node is not None:
+        return node, None
+    return None, index.nearest_edge(x, y, EDGE_RADIUS)
+
+def measure(name, G, n_events=N_EVENTS):
+    # Plain floats, as the linear scan in the GUI iterates over them
+    pos = {n: (float(x), float(y)) for n, (x, y) in compute_layout(G).items()}
+    start = time.perf_counter()
+    index = GraphSpatialIndex(pos, list(G.edges()))
+    build = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    events = rng.uniform(-1.05, 1.05, (n_events, 2))
+
+    start = time.perf_counter()
+    fast = [indexed_hit(index, x, y) for x, y in events]
+    indexed_eps = n_events / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    slow = [linear_hit(G, pos, x, y) for x, y in events]
+    linear_eps = n_events / (time.perf_counter() - start)
+
+    return {
+        "Graph": name,
+        "Nodes": G.number_of_nodes(),
+        "Edges": G.number_of_edges(),
+        "Index_Build_s": build,
+        "Linear_Events_per_s": linear_eps,
+        "Indexed_Events_per_s": indexed_eps,
+        "Speedup": indexed_eps / linear_eps,
+        "Mismatches": sum(a != b for a, b in zip(fast, slow))
+    }
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    rows = [measure("Project topology", manager.G)]
+    print("  project topology done")
+    # Larger synthetic topologies
+    for n, m in [(2000, 20000), (20000, 100000)]:
+        G = nx.gnm_random_graph(n, m, seed=42, directed=True)
+        rows.append(measure(f"Random G({n}, {m})", G))
+        print(f"  G({n}, {m}) done")
+
+    df = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print(df.round(3).to_string(index=False))
+
+    output_file = "Hover_Benchmark_Results.csv"
+    df.round(3).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
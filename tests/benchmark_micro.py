@@ -0,0 +1,295 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import datetime
+import platform
+import itertools
+import random
+import json
+import math
+import time
+import sys
+import gc
+import io
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ga import GeneticOptimizer
+from algorithms.ql import QLearningOptimizer
+from algorithms.sa import SAOptimizer
+from algorithms.abc_alg import ABCOptimizer
+import graph_layout
+
+# Microbenchmarks for the routing hot paths. Unlike benchmark_runner.py (whole
+# solves), each benchmark times a single operation: warmup calls first, then
+# `repeat` samples, each one timing a batch of calls with perf_counter_ns (the
+# batch is sized so a sample lasts at least MIN_SAMPLE_NS; GC is off while
+# sampling, as in timeit). Samples are stored per call in nanoseconds.
+#
+#   python tests/benchmark_micro.py                       # run, print, save Microbench_Results.json
+#   python tests/benchmark_micro.py --save base.json      # save a baseline
+#   python tests/benchmark_micro.py --compare base.json   # flag regressions against a baseline
+#   python tests/benchmark_micro.py --filter ga_ ql_      # only benchmarks whose name contains a filter
+#
+# Comparison uses a two-sided Mann-Whitney U test on the samples (robust to the
+# outliers timing data has). A benchmark is a REGRESSION when p < ALPHA *and* the
+# median slowed down by more than MIN_EFFECT, so noise on a busy machine or tiny
+# but "significant" differences are not flagged (raise --min-effect on noisy
+# machines). Slow benchmarks take SLOW_REPEAT samples, enough for the test to
+# reach ALPHA (with n samples per side the smallest possible p is ~0.08 at n=3,
+# ~0.012 at n=5, ~0.001 at n=8). If a comparison still has too few samples to
+# reach alpha (e.g. an older baseline), it is decided on the median alone with
+# the stricter LOW_POWER_EFFECT and marked Low_Power. Exit status is 1 on
+# regressions.
+
+WEIGHTS = (0.33, 0.33, 0.34)
+N_PATHS = 50            # Fixed input paths (random walks, seeded) cycled through by the benchmarks
+DEFAULT_REPEAT = 30
+DEFAULT_WARMUP = 3
+MIN_SAMPLE_NS = 20_000_000
+SLOW_REPEAT = 8         # Samples for benchmarks whose single call takes ~0.5-10 s
+ALPHA = 0.01
+MIN_EFFECT = 0.05
+LOW_POWER_EFFECT = 0.25 # Median change needed when the sample counts cannot reach ALPHA
+
+def quiet(fn):
+    # load_data prints a summary line on every call
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+    return run
+
+def time_benchmark(fn, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, min_sample_ns=MIN_SAMPLE_NS):
+    """Returns (calls per sample, per-call samples in ns)."""
+    for _ in range(warmup):
+        fn()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # Calibrate the batch size (like timeit.autorange)
+        number = 1
+        while True:
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                fn()
+            elapsed = time.perf_counter_ns() - start
+            if elapsed >= min_sample_ns:
+                break
+            number = max(number * 2, int(number * min_sample_ns / max(elapsed, 1)))
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return number, samples
+
+def summarize(samples):
+    a = np.asarray(samples, dtype=float)
+    q1, median, q3, p95 = np.percentile(a, [25, 50, 75, 95])
+    return {
+        "n": int(a.size),
+        "mean_ns": float(a.mean()),
+        "median_ns": float(median),
+        "stdev_ns": float(a.std(ddof=1)) if a.size > 1 else 0.0,
+        "min_ns": float(a.min()),
+        "p95_ns": float(p95),
+        "iqr_ns": float(q3 - q1),
+    }
+
+def mann_whitney_p(x, y):
+    """Two-sided Mann-Whitney U test p-value (normal approximation with tie correction)."""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n1, n2 = x.size, y.size
+    combined = np.concatenate([x, y])
+    order = np.argsort(combined, kind='mergesort')
+    ranks = np.empty(combined.size)
+    ranks[order] = np.arange(1, combined.size + 1)
+    # Average ranks for ties
+    _, inverse, counts = np.unique(combined, return_inverse=True, return_counts=True)
+    ranks = (np.bincount(inverse, weights=ranks) / counts)[inverse]
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - (counts ** 3 - counts).sum() / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / sigma
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+def min_p_value(n1, n2):
+    """Smallest p-value mann_whitney_p can return for these sample counts (complete separation)."""
+    return mann_whitney_p(np.arange(n1), np.arange(n1, n1 + n2))
+
+def build_benchmarks(manager, files):
+    """(name, function performing one operation, repeat, warmup) for every hot path."""
+    random.seed(0)
+    d = manager.demands[0]
+    src, dst, bw = d['src'], d['dst'], d['bw']
+
+    ga = GeneticOptimizer(manager, src, dst, bw)
+    sa = SAOptimizer(manager, src, dst, bw)
+    abc = ABCOptimizer(manager, src, dst, bw)
+    ql = QLearningOptimizer(manager, src, dst, bw)
+    ql_batched = QLearningOptimizer(manager, src, dst, bw)
+    ql_batched.batch_size = 64
+
+    paths = [p for p in (ga._generate_random_path() for _ in range(N_PATHS * 2)) if p][:N_PATHS]
+    costs = [manager.calculate_path_cost(p, WEIGHTS, bw)[0] for p in paths]
+    # Paths for other demands too, so cost evaluation is not tuned to one route length
+    mixed = list(paths)
+    for dem in manager.demands[1:10]:
+        other = GeneticOptimizer(manager, dem['src'], dem['dst'], dem['bw'])
+        mixed += [p for p in (other._generate_random_path() for _ in range(5)) if p]
+    graph_arrays = manager.get_graph_arrays()
+    edges = list(manager.G.edges())[:1000]
+
+    path_it = itertools.cycle(paths)
+    mixed_it = itertools.cycle(mixed)
+    pair_it = itertools.cycle(list(zip(paths, paths[1:] + paths[:1])))
+    cost_it = itertools.cycle(list(zip(paths, costs)))
+    edge_it = itertools.cycle(edges)
+
+    def bellman_update():
+        # One Q-learning step as in _train_sequential
+        s, a = next(edge_it)
+        q = ql._get_q(s, a)
+        ql._set_q(s, a, q + ql.alpha * (ql.REWARD_STEP + ql.gamma * ql._get_max_q(a) - q))
+
+    def episode(optimizer, episodes):
+        # Fixed exploration rate so every sample does the same amount of work
+        def run():
+            optimizer.epsilon = 0.5
+            if optimizer.batch_size > 1:
+                optimizer._train_batched(WEIGHTS, episodes)
+            else:
+                optimizer._train_sequential(WEIGHTS, episodes)
+        return run
+
+    return [
+        ("csv_load", quiet(lambda: NetworkManager().load_data(*files)), SLOW_REPEAT, 1),
+        ("path_cost", lambda: manager.calculate_path_cost(next(mixed_it), WEIGHTS, bw), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("evaluate_paths_x50", lambda: graph_arrays.evaluate_paths(mixed[:50], WEIGHTS, bw), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("sa_neighbor", lambda: sa._generate_neighbor(next(path_it)), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ga_random_path", lambda: ga._generate_random_path(), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("abc_random_paths_x20", lambda: abc._generate_random_paths(20), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ga_crossover", lambda: ga._crossover(*next(pair_it)), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ga_mutation", lambda: ga._mutate(next(path_it)), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("abc_mutation", lambda: abc._mutate(*next(cost_it)), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ql_bellman_update", bellman_update, DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ql_episode", episode(ql, 1), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("ql_batched_episodes_x64", episode(ql_batched, 64), DEFAULT_REPEAT, DEFAULT_WARMUP),
+        ("layout_fast", lambda: graph_layout.compute_layout(manager.G, method="fast"), SLOW_REPEAT, 1),
+        ("layout_auto", lambda: graph_layout.compute_layout(manager.G), SLOW_REPEAT, 0),
+    ]
+
+def compare(results, baseline, alpha=ALPHA, min_effect=MIN_EFFECT):
+    rows = []
+    for name, res in results.items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            rows.append({"Benchmark": name, "Status": "NEW"})
+            continue
+        ratio = res["summary"]["median_ns"] / base["summary"]["median_ns"]
+        p = mann_whitney_p(res["samples"], base["samples"])
+        low_power = min_p_value(len(res["samples"]), len(base["samples"])) >= alpha
+        if low_power:
+            # The test can never reach alpha with these sample counts: judge by effect size alone
+            significant, effect = True, max(min_effect, LOW_POWER_EFFECT)
+        else:
+            significant, effect = p < alpha, min_effect
+        if significant and ratio > 1 + effect:
+            status = "REGRESSION"
+        elif significant and ratio < 1 - effect:
+            status = "IMPROVED"
+        else:
+            status = "same"
+        rows.append({
+            "Benchmark": name,
+            "Baseline_Median_us": base["summary"]["median_ns"] / 1000,
+            "Median_us": res["summary"]["median_ns"] / 1000,
+            "Ratio": ratio,
+            "p_value": p,
+            "Low_Power": low_power,
+            "Status": status
+        })
+    return pd.DataFrame(rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the routing hot paths")
+    parser.add_argument("--save", metavar="JSON", help="save the results as a baseline file")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a saved baseline")
+    parser.add_argument("--filter", nargs="*", default=None, help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--alpha", type=float, default=ALPHA, help="significance level of the comparison")
+    parser.add_argument("--min-effect", type=float, default=MIN_EFFECT, help="smallest median slowdown (fraction) reported")
+    args = parser.parse_args()
+
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    benchmarks = build_benchmarks(manager, (node_file, edge_file, demand_file))
+    if args.filter:
+        benchmarks = [b for b in benchmarks if any(f in b[0] for f in args.filter)]
+
+    results = {}
+    for name, fn, repeat, warmup in benchmarks:
+        number, samples = time_benchmark(fn, repeat, warmup)
+        results[name] = {"unit": "ns/call", "number": number, "samples": samples, "summary": summarize(samples)}
+        print(f"  {name}: median {results[name]['summary']['median_ns'] / 1000:.2f} us ({repeat} x {number} calls)")
+
+    df = pd.DataFrame([{"Benchmark": name, **{k.replace("_ns", "_us"): (v / 1000 if k.endswith("_ns") else v)
+                                              for k, v in r["summary"].items()}}
+                       for name, r in results.items()])
+    print("\n" + "=" * 80)
+    print(df.round(3).to_string(index=False))
+
+    report = {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "topology": manager.topology_version(),
+        },
+        "benchmarks": results,
+    }
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("machine") != report["meta"]["machine"]:
+            print("\nWARNING: baseline was recorded on a different machine; timings may not be comparable.")
+        cmp = compare(results, baseline, args.alpha, args.min_effect)
+        print(f"\nComparison with '{args.compare}' (Mann-Whitney U, alpha={args.alpha}, min effect {args.min_effect:.0%}):")
+        print(cmp.round(4).to_string(index=False))
+        if "Low_Power" in cmp and cmp["Low_Power"].fillna(False).astype(bool).any():
+            print(f"\nLow_Power: too few samples for p < {args.alpha}; these benchmarks were judged on a "
+                  f"median change above {max(args.min_effect, LOW_POWER_EFFECT):.0%} alone.")
+        cmp.round(4).to_csv("Microbench_Comparison.csv", sep=';', index=False)
+        if (cmp["Status"] == "REGRESSION").any():
+            exit_code = 1
+
+    output_file = args.save or "Microbench_Results.json"
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    print(f"\nDONE! Results saved to '{output_file}'")
+    sys.exit(exit_code)
@@ -0,0 +1,91 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ga import GeneticOptimizer
+from algorithms.exact import ExactOptimizer
+
+# Compares answering several weight profiles by re-solving the GA once per
+# profile against a single NSGA-II run per demand (solve_pareto) followed by a
+# ParetoFront.best_for lookup per profile. Gaps are measured against the
+# exact (A*) optimum of each profile.
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    weight_scenarios = [
+        ("Balanced", [0.33, 0.33, 0.34]),
+        ("Speed_Focus", [1.0, 0.0, 0.0]),
+        ("Reliability_Focus", [0.0, 1.0, 0.0]),
+        ("Resource_Focus", [0.0, 0.0, 1.0]),
+        ("Delay_Reliability", [0.5, 0.5, 0.0]),
+    ]
+    test_cases = manager.demands[:20]
+    REPETITIONS = 3
+
+    rows = []
+    for idx, demand in enumerate(test_cases):
+        src, dst, bw = demand['src'], demand['dst'], demand['bw']
+        optimum = {name: ExactOptimizer(manager, src, dst, bw).solve(w)[1] for name, w in weight_scenarios}
+
+        for rep in range(REPETITIONS):
+            # Per-profile: one GA solve for every weight triple
+            random.seed(1000 * idx + rep)
+            start = time.perf_counter()
+            for name, w in weight_scenarios:
+                path, _, _ = GeneticOptimizer(manager, src, dst, bw).solve(w)
+                cost = manager.calculate_path_cost(path, w, bw)[0] if path else np.nan
+                rows.append({"Mode": "Per_Profile", "Case_ID": idx + 1, "Rep": rep + 1, "Profile": name,
+                             "Gap": cost - optimum[name]})
+            per_profile_time = time.perf_counter() - start
+
+            # Pareto: one NSGA-II run, then a lookup per weight triple
+            random.seed(1000 * idx + rep)
+            start = time.perf_counter()
+            front = GeneticOptimizer(manager, src, dst, bw).solve_pareto()
+            for name, w in weight_scenarios:
+                path, cost, _ = front.best_for(w)
+                rows.append({"Mode": "Pareto", "Case_ID": idx + 1, "Rep": rep + 1, "Profile": name,
+                             "Gap": cost - optimum[name] if path else np.nan, "Front_Size": len(front)})
+            pareto_time = time.perf_counter() - start
+
+            for r in rows[-2 * len(weight_scenarios):-len(weight_scenarios)]:
+                r["Time"] = per_profile_time / len(weight_scenarios)
+            for r in rows[-len(weight_scenarios):]:
+                r["Time"] = pareto_time / len(weight_scenarios)
+        print(f"  case {idx + 1}/{len(test_cases)} done")
+
+    df = pd.DataFrame(rows)
+    summary = df.groupby(["Mode", "Profile"]).agg(
+        Mean_Gap=("Gap", "mean"),
+        Optimal_Rate=("Gap", lambda g: float((g.abs() < 1e-6).mean())),
+        Mean_Time_Per_Profile=("Time", "mean"),
+    ).reset_index()
+
+    print("\n" + "=" * 80)
+    print(summary.round(4).to_string(index=False))
+    print("\nTotal time per demand (all profiles):")
+    print((df.groupby("Mode")["Time"].sum() / (len(test_cases) * REPETITIONS)).round(4).to_string())
+
+    output_file = "Pareto_Benchmark_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
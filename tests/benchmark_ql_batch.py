@@ -0,0 +1,86 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ql import QLearningOptimizer
+
+# Compares the classic sequential Q-learning training against the batched
+# (lock-step) training mode on the same demands, seeds and weight profiles.
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    # Build the array representation once so it is not billed to the first batched solve
+    manager.get_graph_arrays()
+
+    weight_scenarios = [
+        ("Balanced", [0.33, 0.33, 0.34]),
+        ("Speed_Focus", [1.0, 0.0, 0.0]),
+        ("Reliability_Focus", [0.0, 1.0, 0.0])
+    ]
+    batch_sizes = [1, 16, 32, 64]   # 1 = current sequential solve
+    test_cases = manager.demands[:10]
+    REPETITIONS = 3
+
+    rows = []
+    for w_name, w_vals in weight_scenarios:
+        for batch_size in batch_sizes:
+            for idx, demand in enumerate(test_cases):
+                for rep in range(REPETITIONS):
+                    random.seed(1000 * idx + rep)
+                    optimizer = QLearningOptimizer(manager, demand['src'], demand['dst'], demand['bw'])
+                    optimizer.batch_size = batch_size
+
+                    start = time.perf_counter()
+                    path, cost, metrics = optimizer.solve(weights=w_vals)
+                    duration = time.perf_counter() - start
+
+                    rows.append({
+                        "Weight_Profile": w_name,
+                        "Batch_Size": batch_size,
+                        "Case_ID": idx + 1,
+                        "Rep": rep + 1,
+                        "Success": bool(path),
+                        "Cost": cost if path else np.nan,
+                        "Time": duration
+                    })
+            print(f"  {w_name:<18} K={batch_size:<3} done")
+
+    df = pd.DataFrame(rows)
+    summary = df.groupby(["Weight_Profile", "Batch_Size"]).agg(
+        Mean_Time=("Time", "mean"),
+        Mean_Cost=("Cost", "mean"),
+        Success_Rate=("Success", "mean"),
+    ).reset_index()
+
+    # Speed-up and relative cost gap against the sequential baseline of the same profile
+    baseline = summary[summary["Batch_Size"] == 1].set_index("Weight_Profile")
+    summary["Speedup"] = summary.apply(lambda r: baseline.loc[r["Weight_Profile"], "Mean_Time"] / r["Mean_Time"], axis=1)
+    summary["Cost_Gap_%"] = summary.apply(
+        lambda r: 100.0 * (r["Mean_Cost"] - baseline.loc[r["Weight_Profile"], "Mean_Cost"]) / baseline.loc[r["Weight_Profile"], "Mean_Cost"], axis=1)
+
+    print("\n" + "=" * 80)
+    print(summary.round(4).to_string(index=False))
+
+    output_file = "QL_Batch_Benchmark_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,135 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import time
+import sys
+import os
+
+# Render off-screen so the benchmark also runs on machines without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root to sys.path to allow imports from the project modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from matplotlib.backend_bases import MouseEvent
+from network_manager import NetworkManager
+import GUI
+
+# Measures GraphCanvas rendering costs:
+#   - Full_Redraw_ms: rebuilding and drawing the whole scene (new graph or layout).
+#   - Route_Update_ms: showing a new route (overlay update + blit).
+#   - Hover_ms: one mouse-move event (hit-test + highlight + blit).
+#   - Zoomed_Out_Frame_ms / Zoomed_In_Frame_ms: one full frame while panning with
+#     level-of-detail edges (density image / viewport edges from the spatial index).
+#   - Edges_Drawn_*: edge segments actually drawn in that view (0 = density image).
+
+N_ROUTES = 20
+N_HOVER = 200
+N_PAN = 10
+ZOOM_IN_STEPS = 6      # zoom_view(0.7) steps: the view shows ~1.4% of the layout area
+CANVAS_SIZE = (900, 700)
+
+def wait_ready(app, canvas):
+    # Layout and spatial index are built in background threads
+    while canvas.layout_pending or canvas.spatial_index is None:
+        app.processEvents()
+        time.sleep(0.01)
+
+def pan_frames(canvas):
+    # Pan in small steps; every step changes the view, so LOD is re-evaluated each frame
+    start = time.perf_counter()
+    for i in range(N_PAN):
+        xlim, ylim = canvas.ax.get_xlim(), canvas.ax.get_ylim()
+        dx = (xlim[1] - xlim[0]) * 0.05 * (1 if i % 2 == 0 else -1)
+        canvas.ax.set_xlim(xlim[0] + dx, xlim[1] + dx)
+        canvas.draw()
+    frame_ms = (time.perf_counter() - start) / N_PAN * 1000
+    drawn = len(canvas.edge_lines.get_segments()) if canvas.edge_lines.get_visible() else 0
+    return frame_ms, drawn
+
+def measure(app, name, G):
+    canvas = GUI.GraphCanvas()
+    canvas.resize(*CANVAS_SIZE)
+    canvas.draw_graph(G)
+    wait_ready(app, canvas)
+    canvas.draw()
+
+    nodes = list(G.nodes())
+    rng = np.random.default_rng(0)
+    routes = []
+    while len(routes) < N_ROUTES:
+        s, d = rng.choice(len(nodes), 2, replace=False)
+        try:
+            routes.append(nx.shortest_path(G, nodes[s], nodes[d]))
+        except nx.NetworkXNoPath:
+            continue
+
+    start = time.perf_counter()
+    for path in routes[:3]:
+        canvas.build_scene(G)
+        canvas.set_route(path, path[0], path[-1])
+        canvas.draw()
+    full_ms = (time.perf_counter() - start) / 3 * 1000
+
+    start = time.perf_counter()
+    for path in routes:
+        canvas.draw_graph(G, path, path[0], path[-1])
+    route_ms = (time.perf_counter() - start) / len(routes) * 1000
+
+    width, height = CANVAS_SIZE
+    start = time.perf_counter()
+    for _ in range(N_HOVER):
+        x, y = rng.uniform(0.05 * width, 0.95 * width), rng.uniform(0.05 * height, 0.95 * height)
+        canvas.on_mouse_move(MouseEvent("motion_notify_event", canvas, x, y))
+    hover_ms = (time.perf_counter() - start) / N_HOVER * 1000
+
+    out_ms, out_drawn = pan_frames(canvas)
+    canvas.reset_view()
+    for _ in range(ZOOM_IN_STEPS):
+        canvas.zoom_view(0.7, 0.0, 0.0)
+    in_ms, in_drawn = pan_frames(canvas)
+
+    return {
+        "Graph": name,
+        "Nodes": G.number_of_nodes(),
+        "Edges": G.number_of_edges(),
+        "Full_Redraw_ms": full_ms,
+        "Route_Update_ms": route_ms,
+        "Hover_ms": hover_ms,
+        "Zoomed_Out_Frame_ms": out_ms,
+        "Edges_Drawn_Out": out_drawn,
+        "Zoomed_In_Frame_ms": in_ms,
+        "Edges_Drawn_In": in_drawn
+    }
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication(sys.argv)
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    rows = [measure(app, "Project topology", manager.G)]
+    print("  project topology done")
+    for n, m in [(2000, 20000), (20000, 100000)]:
+        G = nx.gnm_random_graph(n, m, seed=42, directed=True)
+        rows.append(measure(app, f"Random G({n}, {m})", G))
+        print(f"  G({n}, {m}) done")
+
+    df = pd.DataFrame(rows)
+    print("\n" + "=" * 80)
+    print(df.round(2).to_string(index=False))
+
+    output_file = "Render_Benchmark_Results.csv"
+    df.round(2).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
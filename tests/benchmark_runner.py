@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+import tracemalloc
 import time
 import sys
 import os
@@ -13,6 +14,27 @@ from algorithms.ql import QLearningOptimizer
 from algorithms.sa import SAOptimizer
 from algorithms.abc_alg import ABCOptimizer
 
+# Latency percentiles reported per (algorithm, weight profile) over every solve
+PERCENTILES = [50, 95, 99]
+# One extra, untimed solve per case under tracemalloc for the peak allocation
+# (tracing slows Python code down, so it is kept out of the latency numbers)
+MEASURE_MEMORY = True
+
+def timed_solve(optimizer, weights):
+    # Wall time (perf_counter) vs CPU time of this process (process_time):
+    # CPU well below wall means waiting, above wall means extra threads (BLAS)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    path, cost, metrics = optimizer.solve(weights=weights)
+    return path, cost, metrics, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+def peak_memory_mb(optimizer, weights):
+    tracemalloc.start()
+    try:
+        optimizer.solve(weights=weights)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
 if __name__ == "__main__":
     # 1. Setup Network Manager and Load Data
     manager = NetworkManager()
@@ -50,6 +72,7 @@ if __name__ == "__main__":
     test_cases = manager.demands[:20] 
 
     experiment_results = []
+    solve_results = []  # One row per solve (latency distribution)
     REPETITIONS = 5
 
     print("\n" + "="*80)
@@ -73,20 +96,18 @@ if __name__ == "__main__":
                 scenario_reliabilities = []
                 scenario_res_costs = []
                 scenario_times = []
+                scenario_cpu_times = []
                 
                 print(f"    - Case {idx + 1}/{len(test_cases)} (Src: {src} -> Dst: {dst})")
                 
                 for rep in range(REPETITIONS):
                     print(f"      .. Rep {rep + 1}/{REPETITIONS}", end="\r", flush=True) 
-                    start_time = time.time()
                     
                     # Instantiate optimizer
                     optimizer = AlgoClass(manager, src, dst, bw_demand)
                     
                     # Execute algorithm
-                    path, cost, metrics = optimizer.solve(weights=w_vals)
-                    
-                    duration = time.time() - start_time
+                    path, cost, metrics, duration, cpu_time = timed_solve(optimizer, w_vals)
                     
                     if path:
                         # Consistency with GUI: Clean the cost (remove penalty) for statistics
@@ -105,6 +126,18 @@ if __name__ == "__main__":
                         scenario_res_costs.append(float('inf'))
                     
                     scenario_times.append(duration)
+                    scenario_cpu_times.append(cpu_time)
+                    solve_results.append({
+                        "Algorithm": algo_name,
+                        "Weight_Profile": w_name,
+                        "Case_ID": idx + 1,
+                        "Rep": rep + 1,
+                        "Found": bool(path),
+                        "Wall_Time": round(duration, 6),
+                        "CPU_Time": round(cpu_time, 6)
+                    })
+
+                peak_mem = peak_memory_mb(AlgoClass(manager, src, dst, bw_demand), w_vals) if MEASURE_MEMORY else np.nan
 
                 # Calculate statistics
                 valid_costs = [c for c in scenario_costs if c != float('inf')]
@@ -122,9 +155,11 @@ if __name__ == "__main__":
                     mean_res = np.mean(valid_res_costs) if valid_res_costs else 0
 
                     avg_time = np.mean(scenario_times)
+                    avg_cpu = np.mean(scenario_cpu_times)
+                    max_time = np.max(scenario_times)
                     success_rate = (len(valid_costs) / REPETITIONS) * 100
                 else:
-                    mean_val = std_val = best_val = avg_time = 0
+                    mean_val = std_val = best_val = avg_time = avg_cpu = max_time = 0
                     mean_delay = mean_rel = mean_res = 0
                     success_rate = 0
 
@@ -141,13 +176,38 @@ if __name__ == "__main__":
                     "Mean_Resource_Cost": round(mean_res, 4),
                     "Std_Dev": round(std_val, 4),
                     "Best_Cost": round(best_val, 4),
-                    "Avg_Time": round(avg_time, 4)
+                    "Avg_Time": round(avg_time, 4),
+                    "Avg_CPU_Time": round(avg_cpu, 4),
+                    "Max_Time": round(max_time, 4),
+                    "Peak_Mem_MB": round(peak_mem, 3)
                 })
 
     # 4. Save Results
     df_final = pd.DataFrame(experiment_results)
     output_file = "Final_Project_Benchmark_Results.csv"
     df_final.to_csv(output_file, sep=';', index=False)
+
+    # 5. Latency distribution over all solves (tail latency, CPU vs wall, memory)
+    df_solves = pd.DataFrame(solve_results)
+    latency = df_solves.groupby(["Algorithm", "Weight_Profile"]).agg(
+        Solves=("Wall_Time", "size"),
+        Mean_Time=("Wall_Time", "mean"),
+        **{f"P{q}_Time": ("Wall_Time", lambda t, q=q: np.percentile(t, q)) for q in PERCENTILES},
+        Max_Time=("Wall_Time", "max"),
+        Mean_CPU_Time=("CPU_Time", "mean")).reset_index()
+    latency["CPU_Wall_Ratio"] = latency["Mean_CPU_Time"] / latency["Mean_Time"]
+    memory = df_final.groupby(["Algorithm", "Weight_Profile"]).agg(
+        Mean_Peak_Mem_MB=("Peak_Mem_MB", "mean"), Max_Peak_Mem_MB=("Peak_Mem_MB", "max")).reset_index()
+    latency = latency.merge(memory, on=["Algorithm", "Weight_Profile"])
+
+    print("\n" + "="*80)
+    print("LATENCY (seconds per solve) AND PEAK MEMORY")
+    print(latency.round(4).to_string(index=False))
+
+    solves_file = "Final_Project_Benchmark_Solves.csv"
+    latency_file = "Final_Project_Latency_Summary.csv"
+    df_solves.to_csv(solves_file, sep=';', index=False)
+    latency.round(6).to_csv(latency_file, sep=';', index=False)
     
     print("\n" + "="*80)
-    print(f"DONE! All results saved to '{output_file}'")
\ No newline at end of file
+    print(f"DONE! All results saved to '{output_file}', '{solves_file}' and '{latency_file}'")
\ No newline at end of file
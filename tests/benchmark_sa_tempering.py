@@ -0,0 +1,111 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.sa import SAOptimizer
+from algorithms.exact import ExactOptimizer
+
+# Parallel tempering vs plain SA at equal wall-clock time. Per (case, rep):
+#   - Tempering: solve_tempering() in-process; its wall time is the budget
+#   - SA_Restarts: independent solve() runs (new seed each) while the next
+#     one is expected to fit in the same wall time, best of them is kept
+#   - SA_Single: one solve(), for reference (shorter wall time)
+# Std_Dev is the spread of the cost over repetitions of the same case (the
+# Std_Dev column of benchmark_runner.py), averaged over cases.
+
+REPETITIONS = 5
+
+def run(mode, manager, demand, w_vals, budget=None):
+    src, dst, bw = demand['src'], demand['dst'], demand['bw']
+    start = time.perf_counter()
+    optimizer = SAOptimizer(manager, src, dst, bw)
+    rounds = np.nan
+    if mode == "SA_Single":
+        path, cost, _ = optimizer.solve(w_vals)
+    elif mode == "SA_Restarts":
+        path, cost, _ = optimizer.solve(w_vals)
+        last = time.perf_counter() - start
+        while time.perf_counter() - start + last <= budget:
+            t0 = time.perf_counter()
+            optimizer = SAOptimizer(manager, src, dst, bw)
+            p, c, _ = optimizer.solve(w_vals)
+            last = time.perf_counter() - t0
+            if p and (not path or c < cost):
+                path, cost = p, c
+    else:
+        path, cost, metrics = optimizer.solve_tempering(w_vals)
+        rounds = metrics.get('rounds', np.nan)
+    return (cost if path else np.nan), time.perf_counter() - start, rounds
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    weight_scenarios = [
+        ("Balanced", [0.33, 0.33, 0.34]),
+        ("Speed_Focus", [1.0, 0.0, 0.0]),
+        ("Reliability_Focus", [0.0, 1.0, 0.0])
+    ]
+    test_cases = manager.demands[:10]
+
+    rows = []
+    for w_name, w_vals in weight_scenarios:
+        print(f"\n>>> Weight Profile: {w_name}")
+        for idx, demand in enumerate(test_cases):
+            optimum = ExactOptimizer(manager, demand['src'], demand['dst'], demand['bw']).solve(w_vals)[1]
+            for rep in range(REPETITIONS):
+                seed = idx * 100 + rep
+                random.seed(seed)
+                cost, budget, rounds = run("Tempering", manager, demand, w_vals)
+                results = [("Tempering", cost, budget, rounds)]
+                for mode in ("SA_Restarts", "SA_Single"):
+                    random.seed(seed)
+                    results.append((mode, *run(mode, manager, demand, w_vals, budget)))
+                for mode, cost, duration, rounds in results:
+                    rows.append({
+                        "Weight_Profile": w_name,
+                        "Mode": mode,
+                        "Case_ID": idx + 1,
+                        "Rep": rep + 1,
+                        "Cost": cost,
+                        "Gap_pct": (cost - optimum) / optimum * 100 if optimum > 0 else np.nan,
+                        "Time": duration,
+                        "Rounds": rounds
+                    })
+            print(f"    - Case {idx + 1}/{len(test_cases)} done")
+
+    df = pd.DataFrame(rows)
+    per_case = df.groupby(["Weight_Profile", "Mode", "Case_ID"]).agg(
+        Cost_Std=("Cost", "std"), Gap_pct=("Gap_pct", "mean"), Time=("Time", "mean"),
+        Rounds=("Rounds", "mean")).reset_index()
+    summary = per_case.groupby(["Weight_Profile", "Mode"]).agg(
+        Mean_Gap_pct=("Gap_pct", "mean"),
+        Std_Dev=("Cost_Std", "mean"),
+        Mean_Time=("Time", "mean"),
+        Mean_Rounds=("Rounds", "mean"),
+    ).reset_index()
+
+    print("\n" + "=" * 80)
+    print(summary.round(4).to_string(index=False))
+
+    output_file = "SA_Tempering_Benchmark_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,205 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import argparse
+import contextlib
+import tempfile
+import tracemalloc
+import random
+import time
+import sys
+import io
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from network_generator import generate_network
+from algorithms.ga import GeneticOptimizer
+from algorithms.ql import QLearningOptimizer
+from algorithms.sa import SAOptimizer
+from algorithms.abc_alg import ABCOptimizer
+from algorithms.exact import ExactOptimizer
+from algorithms.progress import ProgressReporter
+
+# Scaling harness: how runtime, memory, throughput and solution quality change
+# with topology size. For every (nodes, average degree) it generates an
+# Erdos-Renyi topology with network_generator.py, loads it through
+# NetworkManager.load_data (as the GUI does) and solves a fixed, seeded demand
+# sample with every optimizer under a time cap. The cap is the time_limit of
+# the same ProgressReporter the GUI uses for early stopping, so it also applies
+# before a first path is found and during population / k-shortest-path
+# initialisation. ExactOptimizer (A*) provides the reference cost for the
+# quality gap under the same cap; a capped reference is reported in
+# Ref_Status and leaves Gap_pct empty.
+#
+# Output: one tidy row per (topology, algorithm, demand) in
+# Scaling_Benchmark_Results.csv; `python tests/analyze_results.py` draws the
+# log-log plots and fits the empirical scaling exponents.
+#
+#   python tests/benchmark_scaling.py                               # full sweep (slow at 50k nodes)
+#   python tests/benchmark_scaling.py --sizes 100 1000 --degrees 8  # quick run
+
+SIZES = [100, 250, 1000, 5000, 20000, 50000]
+AVG_DEGREES = [4, 16, 64]
+MAX_DIRECTED_EDGES = 1_000_000  # Larger (nodes, degree) combinations are skipped
+N_DEMANDS = 5
+TIME_CAP = 30.0                 # Seconds per solve (checked at every iteration)
+WEIGHTS = (0.33, 0.33, 0.34)
+BW_CHOICES = [50, 100, 150, 250]
+
+ALGORITHMS = [
+    ("GeneticAlgo", GeneticOptimizer),
+    ("QLearning", QLearningOptimizer),
+    ("SimulatedAnnealing", SAOptimizer),
+    ("ArtBeeColony", ABCOptimizer),
+]
+
+class EvaluationCounter:
+    """Counts path evaluations (scalar and vectorized) made through the manager."""
+
+    def __init__(self, manager):
+        self.count = 0
+        path_cost = manager.calculate_path_cost
+        evaluate_paths = manager.get_graph_arrays().evaluate_paths
+
+        def counted_path_cost(*args, **kwargs):
+            self.count += 1
+            return path_cost(*args, **kwargs)
+
+        def counted_evaluate_paths(paths, *args, **kwargs):
+            self.count += len(paths)
+            return evaluate_paths(paths, *args, **kwargs)
+
+        manager.calculate_path_cost = counted_path_cost
+        manager.get_graph_arrays().evaluate_paths = counted_evaluate_paths
+
+def load_topology(n, avg_degree, seed, workdir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_network(n, seed=seed, avg_degree=avg_degree, output_dir=workdir)
+        manager = NetworkManager()
+        start = time.perf_counter()
+        ok = manager.load_data(os.path.join(workdir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv'),
+                               os.path.join(workdir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv'), None)
+    return (manager if ok else None), time.perf_counter() - start
+
+def sample_demands(manager, count, seed):
+    # Fixed sample per topology: endpoints in the same (largest) component so a route exists
+    rng = random.Random(seed)
+    nodes = sorted(max(nx.weakly_connected_components(manager.G), key=len))
+    demands = []
+    while len(demands) < count and len(nodes) > 1:
+        s, d = rng.sample(nodes, 2)
+        demands.append({'src': s, 'dst': d, 'bw': rng.choice(BW_CHOICES)})
+    return demands
+
+def timed_solve(optimizer, time_cap):
+    # The time cap rides on the progress hook (checked at every iteration and during initialisation)
+    start = time.perf_counter()
+    reporter = ProgressReporter(time_limit=time_cap)
+    optimizer.progress = reporter
+    path, cost, metrics = optimizer.solve(WEIGHTS)
+    return path, cost, metrics, time.perf_counter() - start, reporter.stop_requested
+
+def peak_memory_mb(cls, manager, demand, seed, time_cap):
+    # Separate run: tracemalloc slows Python code down, so it is not used for the timings
+    random.seed(seed)
+    optimizer = cls(manager, demand['src'], demand['dst'], demand['bw'])
+    tracemalloc.start()
+    try:
+        timed_solve(optimizer, time_cap)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+def run_topology(n, avg_degree, args, workdir):
+    manager, load_s = load_topology(n, avg_degree, args.seed, workdir)
+    if manager is None:
+        print(f"  could not load topology ({n}, {avg_degree})")
+        return []
+    counter = EvaluationCounter(manager)
+    demands = sample_demands(manager, args.demands, args.seed)
+    topo = {"Nodes": manager.G.number_of_nodes(), "Edges": manager.G.number_of_edges(),
+            "Avg_Degree": avg_degree, "Load_s": load_s}
+
+    references = []
+    for demand in demands:
+        exact = ExactOptimizer(manager, demand['src'], demand['dst'], demand['bw'])
+        path, cost, metrics, ref_s, capped = timed_solve(exact, args.time_cap)
+        feasible = bool(path) and metrics.get('is_feasible', False)
+        if capped:
+            status = "capped"
+        elif metrics.get('budget_exhausted'):
+            status = "budget_exhausted"
+        else:
+            status = "optimal" if feasible else "infeasible"
+        references.append((cost if feasible and status == "optimal" else np.nan, ref_s, status))
+
+    rows = []
+    for algo_name, cls in ALGORITHMS:
+        peak = None if args.no_memory else peak_memory_mb(cls, manager, demands[0], args.seed, args.time_cap)
+        for idx, demand in enumerate(demands):
+            random.seed(args.seed + idx)
+            optimizer = cls(manager, demand['src'], demand['dst'], demand['bw'])
+            counter.count = 0
+            path, cost, metrics, runtime, capped = timed_solve(optimizer, args.time_cap)
+            ref_cost, ref_s, ref_status = references[idx]
+            found = bool(path)
+            rows.append({
+                **topo,
+                "Algorithm": algo_name,
+                "Demand": idx + 1,
+                "Source": demand['src'],
+                "Destination": demand['dst'],
+                "Bandwidth": demand['bw'],
+                "Found": found,
+                "Feasible": found and metrics.get('is_feasible', False),
+                "Capped": capped,
+                "Runtime_s": runtime,
+                "Evaluations": counter.count,
+                "Evals_per_s": counter.count / runtime if runtime > 0 else np.nan,
+                "Peak_Mem_MB": peak,
+                "Cost": cost if found else np.nan,
+                "Ref_Cost": ref_cost,
+                "Ref_Runtime_s": ref_s,
+                "Ref_Status": ref_status,
+                "Gap_pct": (cost - ref_cost) / ref_cost * 100 if found and ref_cost > 0 else np.nan
+            })
+        print(f"    {algo_name} done")
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scaling benchmark across topology sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--degrees", type=float, nargs="+", default=AVG_DEGREES, help="average node degrees (densities)")
+    parser.add_argument("--demands", type=int, default=N_DEMANDS)
+    parser.add_argument("--time-cap", type=float, default=TIME_CAP, help="seconds per solve")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory runs")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in args.sizes:
+            for avg_degree in args.degrees:
+                if n * min(avg_degree, n - 1) > MAX_DIRECTED_EDGES:
+                    print(f"Skipping {n} nodes x degree {avg_degree} (over {MAX_DIRECTED_EDGES} edges)")
+                    continue
+                print(f"Topology: {n} nodes, average degree {avg_degree}")
+                rows += run_topology(n, avg_degree, args, workdir)
+
+    df = pd.DataFrame(rows)
+    summary = df.groupby(["Nodes", "Avg_Degree", "Algorithm"]).agg(
+        Edges=("Edges", "first"), Runtime_s=("Runtime_s", "median"), Evals_per_s=("Evals_per_s", "median"),
+        Peak_Mem_MB=("Peak_Mem_MB", "first"), Gap_pct=("Gap_pct", "median"),
+        Found=("Found", "mean"), Capped=("Capped", "mean")).reset_index()
+    print("\n" + "=" * 80)
+    print(summary.round(3).to_string(index=False))
+    refs = df.drop_duplicates(["Nodes", "Avg_Degree", "Demand"])["Ref_Status"].value_counts()
+    if set(refs.index) - {"optimal", "infeasible"}:
+        print(f"\nExact references without a proven optimum (no Gap_pct): {refs.to_dict()}")
+
+    output_file = "Scaling_Benchmark_Results.csv"
+    df.round(6).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,124 @@
+import pandas as pd
+import subprocess
+import statistics
+import json
+import sys
+import os
+
+# GUI startup profile. Every run starts a fresh interpreter (imports are only
+# slow the first time) and reports:
+#   - Import_s: `import GUI`
+#   - Window_Shown_s: import + Window() + first paint (what the user waits for)
+#   - Data_Loaded_s: CSVs loaded in the background, solve buttons enabled
+#   - Ready_s: graph layout on screen (from the disk cache after the first run)
+# It also lists the slowest modules from `python -X importtime -c "import GUI"`
+# and checks that the heavy, deferred modules are not imported by `import GUI`.
+# Any median over its budget, or any eagerly imported deferred module, is
+# reported as a regression and the script exits with status 1.
+
+N_RUNS = 3
+TOP_IMPORTS = 15
+
+# Budgets in seconds (generous for slow CI machines; the point is catching step changes)
+BUDGETS = {
+    "Import_s": 3.0,
+    "Window_Shown_s": 4.0,
+    "Data_Loaded_s": 15.0,
+    "Ready_s": 30.0,
+}
+
+# Modules that must only be imported on first use / in background threads
+DEFERRED_MODULES = ["pandas", "scipy", "network_manager", "spatial_index", "matplotlib.pyplot",
+                    "algorithms.ga", "algorithms.ql", "algorithms.abc_alg", "algorithms.sa", "algorithms.exact"]
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+STARTUP_SCRIPT = r"""
+import json, sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, ROOT)
+import GUI
+t_import = time.perf_counter() - t0
+eager = [m for m in DEFERRED if m in sys.modules]
+from PyQt5 import QtWidgets
+app = QtWidgets.QApplication(sys.argv)
+w = GUI.Window(); w.show(); app.processEvents()
+t_shown = time.perf_counter() - t0
+while not w.data_worker.isFinished():
+    app.processEvents(); time.sleep(0.005)
+app.processEvents()
+t_data = time.perf_counter() - t0
+while w.load_bar.isVisible():
+    app.processEvents(); time.sleep(0.005)
+t_ready = time.perf_counter() - t0
+print(json.dumps({"Import_s": t_import, "Window_Shown_s": t_shown, "Data_Loaded_s": t_data,
+                  "Ready_s": t_ready, "loaded": w.manager is not None, "eager": eager}))
+"""
+
+def child_env():
+    # Off-screen Qt so the profile also runs on machines without a display
+    return dict(os.environ, QT_QPA_PLATFORM="offscreen")
+
+def run_startup():
+    code = f"ROOT = {ROOT!r}\nDEFERRED = {DEFERRED_MODULES!r}\n" + STARTUP_SCRIPT
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=child_env(),
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def import_profile():
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", "import GUI"], cwd=ROOT,
+                         env=child_env(), capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level
+        rows.append({"Module": name.strip(), "Depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                     "Self_ms": int(self_us) / 1000, "Cumulative_ms": int(cum_us) / 1000})
+    df = pd.DataFrame(rows)
+    # Depth 1: modules imported directly by GUI (with everything they pull in)
+    return df[df["Depth"] == 1].drop(columns="Depth").sort_values("Cumulative_ms", ascending=False)
+
+if __name__ == "__main__":
+    print(f"Profiling GUI startup ({N_RUNS} fresh interpreters)...")
+    runs = []
+    for i in range(N_RUNS):
+        runs.append(run_startup())
+        print(f"  run {i + 1} done")
+    if not all(r["loaded"] for r in runs):
+        print("Data could not be loaded in the GUI; load times are not meaningful.")
+
+    rows = []
+    for metric, budget in BUDGETS.items():
+        median = statistics.median(r[metric] for r in runs)
+        rows.append({
+            "Metric": metric,
+            "Median_s": median,
+            "Min_s": min(r[metric] for r in runs),
+            "Max_s": max(r[metric] for r in runs),
+            "Budget_s": budget,
+            "Status": "OK" if median <= budget else "REGRESSION"
+        })
+    eager = sorted({m for r in runs for m in r["eager"]})
+    rows.append({
+        "Metric": "Deferred_Modules_Imported",
+        "Median_s": None, "Min_s": None, "Max_s": None, "Budget_s": None,
+        "Status": "OK" if not eager else "REGRESSION: " + ", ".join(eager)
+    })
+    df = pd.DataFrame(rows)
+
+    top = import_profile()
+    print("\n" + "=" * 80)
+    print(df.round(3).to_string(index=False))
+    print("\nSlowest direct imports of GUI (-X importtime):")
+    print(top.head(TOP_IMPORTS).round(1).to_string(index=False))
+
+    output_file = "Startup_Profile_Results.csv"
+    df.round(3).to_csv(output_file, sep=';', index=False)
+    top.round(1).to_csv("Startup_Import_Profile.csv", sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}' and 'Startup_Import_Profile.csv'")
+
+    if any(row["Status"] != "OK" for row in rows):
+        sys.exit(1)
@@ -0,0 +1,92 @@
+import pandas as pd
+import numpy as np
+import random
+import time
+import sys
+import os
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from algorithms.ga import GeneticOptimizer
+from algorithms.ql import QLearningOptimizer
+from algorithms.sa import SAOptimizer
+from algorithms.abc_alg import ABCOptimizer
+from algorithms.exact import ExactOptimizer
+from algorithms.solution_archive import SolutionArchive
+
+# Simulates a user sweeping the weight spin boxes: for every demand the delay
+# weight is moved step by step and each optimizer is re-run per step, either
+# cold or warm-started from a per-demand SolutionArchive. Gaps are measured
+# against the exact (A*) optimum of each step.
+
+if __name__ == "__main__":
+    manager = NetworkManager()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, 'data')
+
+    node_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_NodeData(in).csv')
+    edge_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv')
+    demand_file = os.path.join(data_dir, 'BSM307_317_Guz2025_TermProject_DemandData(in).csv')
+
+    print("Loading data...")
+    if not manager.load_data(node_file, edge_file, demand_file):
+        print("Failed to load data. Exiting.")
+        sys.exit(1)
+
+    # w_delay from 0.2 to 0.6, the rest split evenly between reliability and resource
+    sweep = [(wd, (1 - wd) / 2, (1 - wd) / 2) for wd in np.linspace(0.2, 0.6, 9)]
+
+    algorithms = [
+        ("GeneticAlgo", GeneticOptimizer),
+        ("QLearning", QLearningOptimizer),
+        ("SimulatedAnnealing", SAOptimizer),
+        ("ArtBeeColony", ABCOptimizer)
+    ]
+    test_cases = manager.demands[:10]
+
+    optimum = {}
+    for idx, demand in enumerate(test_cases):
+        for step, w in enumerate(sweep):
+            optimum[idx, step] = ExactOptimizer(manager, demand['src'], demand['dst'], demand['bw']).solve(w)[1]
+
+    rows = []
+    for algo_name, AlgoClass in algorithms:
+        for mode in ("Cold", "Warm"):
+            for idx, demand in enumerate(test_cases):
+                archive = SolutionArchive(manager) if mode == "Warm" else None
+                random.seed(idx)
+                for step, w in enumerate(sweep):
+                    optimizer = AlgoClass(manager, demand['src'], demand['dst'], demand['bw'], archive=archive)
+                    start = time.perf_counter()
+                    path, _, _ = optimizer.solve(w)
+                    duration = time.perf_counter() - start
+                    cost = manager.calculate_path_cost(path, w, demand['bw'])[0] if path else np.nan
+                    rows.append({
+                        "Algorithm": algo_name,
+                        "Mode": mode,
+                        "Case_ID": idx + 1,
+                        "Step": step,
+                        "Gap": cost - optimum[idx, step],
+                        "Rel_Gap": (cost - optimum[idx, step]) / optimum[idx, step],
+                        "Time": duration
+                    })
+            print(f"  {algo_name} / {mode} done")
+
+    df = pd.DataFrame(rows)
+    # The first step of a sweep is always cold; report the re-solves only
+    resolves = df[df["Step"] > 0]
+    summary = resolves.groupby(["Algorithm", "Mode"]).agg(
+        Mean_Gap=("Gap", "mean"),
+        Within_1pct=("Rel_Gap", lambda g: float((g <= 0.01).mean())),
+        Mean_Time=("Time", "mean"),
+    ).reset_index()
+
+    print("\n" + "=" * 80)
+    print(summary.round(4).to_string(index=False))
+
+    output_file = "Warm_Start_Benchmark_Results.csv"
+    summary.round(4).to_csv(output_file, sep=';', index=False)
+    print(f"\nDONE! Results saved to '{output_file}'")
@@ -0,0 +1,86 @@
+import contextlib
+import random
+import io
+import sys
+import os
+
+import pytest
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from network_generator import generate_network
+from algorithms.ql import QLearningOptimizer
+from algorithms.q_store import QTableStore
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+@pytest.fixture(scope="module")
+def manager(tmp_path_factory):
+    # Small generated topology: fast to load and train on
+    workdir = tmp_path_factory.mktemp("topology")
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_network(30, p=0.3, seed=7, output_dir=str(workdir))
+        manager = NetworkManager()
+        assert manager.load_data(str(workdir / 'BSM307_317_Guz2025_TermProject_NodeData(in).csv'),
+                                 str(workdir / 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv'), None)
+    return manager
+
+def train(manager, store, **constraints):
+    random.seed(0)
+    optimizer = QLearningOptimizer(manager, 0, 29, 100, q_store=store, **constraints)
+    optimizer.episodes = 50
+    optimizer.solve(WEIGHTS)
+
+@pytest.mark.parametrize("constraints", [
+    {},
+    {"max_delay": 200.0},
+    {"min_reliability": 0.9},
+    {"max_delay": 200.0, "min_reliability": 0.9},
+])
+def test_save_load_round_trip(manager, tmp_path, constraints):
+    store = QTableStore()
+    train(manager, store, **constraints)
+    (key,) = store._tables
+    file_path = tmp_path / "q_tables.bin"
+    store.save(file_path)
+
+    loaded = QTableStore()
+    assert loaded.load(file_path) == 1
+    # The rebuilt key must be the one the optimizer looks up on the next solve
+    expected = store.make_key(manager, 29, WEIGHTS, 100, constraints.get("max_delay"),
+                              constraints.get("min_reliability"))
+    assert key == expected
+    assert expected in loaded
+    assert loaded.get(expected) == store.get(expected)
+    assert loaded.get_route(expected, 0) == store.get_route(expected, 0)
+
+def test_constrained_and_unconstrained_tables_stay_separate(manager, tmp_path):
+    store = QTableStore()
+    train(manager, store)
+    train(manager, store, max_delay=200.0)
+    store.save(tmp_path / "q_tables.bin")
+
+    loaded = QTableStore()
+    assert loaded.load(tmp_path / "q_tables.bin") == 2
+    assert set(loaded._tables) == set(store._tables)
+
+def test_warm_start_after_load(manager, tmp_path):
+    store = QTableStore()
+    train(manager, store, max_delay=200.0, min_reliability=0.9)
+    store.save(tmp_path / "q_tables.bin")
+
+    loaded = QTableStore()
+    loaded.load(tmp_path / "q_tables.bin")
+    optimizer = QLearningOptimizer(manager, 0, 29, 100, q_store=loaded, max_delay=200.0, min_reliability=0.9)
+    optimizer.episodes = 50
+    optimizer.solve(WEIGHTS)
+    assert optimizer.is_warm
+
+@pytest.mark.parametrize("magic", [b"XXXX", b"QTS1"])
+def test_rejects_foreign_file(tmp_path, magic):
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(magic)
+    with pytest.raises(ValueError):
+        QTableStore().load(bad)
@@ -0,0 +1,58 @@
+import contextlib
+import random
+import copy
+import io
+import sys
+import os
+
+import pytest
+
+# Add project root to sys.path to allow imports from 'algorithms' and 'network_manager'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from network_manager import NetworkManager
+from network_generator import generate_network
+from algorithms.ql import QLearningOptimizer
+
+WEIGHTS = (0.33, 0.33, 0.34)
+
+@pytest.fixture(scope="module")
+def manager(tmp_path_factory):
+    # Small generated topology: fast to load and train on
+    workdir = tmp_path_factory.mktemp("topology")
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_network(30, p=0.3, seed=7, output_dir=str(workdir))
+        manager = NetworkManager()
+        assert manager.load_data(str(workdir / 'BSM307_317_Guz2025_TermProject_NodeData(in).csv'),
+                                 str(workdir / 'BSM307_317_Guz2025_TermProject_EdgeData(in).csv'), None)
+    return manager
+
+def trained_table(manager, **constraints):
+    # Routing table before the distance-vector relaxation
+    random.seed(0)
+    optimizer = QLearningOptimizer(manager, 0, 29, 100, **constraints)
+    optimizer.episodes = 100
+    optimizer.table_relax_rounds = 0
+    table = optimizer.solve_routing_table(WEIGHTS)
+    optimizer.table_relax_rounds = 3
+    return optimizer, table
+
+@pytest.mark.parametrize("constraints", [
+    {},
+    {"max_delay": 20.0},
+    {"min_reliability": 0.87},
+    {"max_delay": 25.0, "min_reliability": 0.87},
+])
+def test_relaxation_keeps_feasible_routes(manager, constraints):
+    optimizer, table = trained_table(manager, **constraints)
+    before = copy.deepcopy(table)
+    optimizer._relax_routing_table(table, WEIGHTS)
+
+    assert set(table) == set(before)
+    for s, route in table.items():
+        cost, metrics = manager.calculate_path_cost(route['path'], WEIGHTS, 100, constraints.get("max_delay"),
+                                                    constraints.get("min_reliability"))
+        assert route['cost'] == pytest.approx(cost)
+        assert route['cost'] <= before[s]['cost'] + 1e-9
+        if before[s]['metrics']['is_feasible']:
+            assert metrics['is_feasible']